@@ -0,0 +1,227 @@
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .serialization import dumps, loads
+from .singleflight import SingleFlight
+
+logger = logging.getLogger('job_scraper')
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize request parameters so equivalent searches map to the same key."""
+    normalized = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            value = " ".join(value.lower().split())
+        normalized[name] = value
+    return normalized
+
+
+def make_key(source: str, params: Dict[str, Any]) -> str:
+    """
+    Build a cache key from a source name and request parameters.
+
+    Args:
+        source: The job board the results come from
+        params: The request parameters (e.g. a dumped schemas model)
+
+    Returns:
+        A stable key such as ``jobhub:indeed:<sha1>``
+    """
+    payload = json.dumps(normalize_params(params), sort_keys=True, default=str)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"jobhub:{source}:{digest}"
+
+
+def is_cacheable(value: Any) -> bool:
+    """Empty results and error payloads are never cached."""
+    if not value:
+        return False
+    if isinstance(value, dict) and "error" in value:
+        return False
+    return True
+
+
+class LRUCache:
+    """A thread-safe in-process LRU of (value, stored_at) entries."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, stored_at: float):
+        with self._lock:
+            self._data[key] = (value, stored_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisTier:
+    """Optional shared cache tier; failures are logged and treated as misses."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.Redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        try:
+            raw = await self._client.get(key)
+        except Exception as e:
+            logger.warning(f"Redis get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        entry = loads(raw)
+        return entry["value"], entry["stored_at"]
+
+    async def set(self, key: str, value: Any, stored_at: float, expire: float):
+        try:
+            payload = dumps({"value": value, "stored_at": stored_at})
+            await self._client.set(key, payload, ex=max(1, int(expire)))
+        except Exception as e:
+            logger.warning(f"Redis set failed: {e}")
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class ResultCache:
+    """
+    Two-tier search result cache with per-source TTLs.
+
+    Entries younger than the source TTL are served as fresh. Entries past
+    the TTL but inside the stale window are served immediately while a
+    background task refreshes them (stale-while-revalidate). Concurrent
+    misses and refreshes for the same key share a single scrape.
+    """
+
+    def __init__(self, ttls: Dict[str, float], default_ttl: float = 600.0,
+                 stale_ttl: float = 1800.0, maxsize: int = 512,
+                 redis_url: Optional[str] = None):
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.local = LRUCache(maxsize)
+        self.redis = RedisTier(redis_url) if redis_url else None
+        self.flights = SingleFlight()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0}
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, self.default_ttl)
+
+    async def _lookup(self, key: str) -> Optional[Tuple[Any, float]]:
+        entry = self.local.get(key)
+        if entry is None and self.redis is not None:
+            entry = await self.redis.get(key)
+            if entry is not None:
+                self.local.set(key, *entry)
+        return entry
+
+    async def store(self, source: str, key: str, value: Any):
+        """Write a result to every tier if it is worth caching."""
+        if not is_cacheable(value):
+            return
+        stored_at = time.time()
+        self.local.set(key, value, stored_at)
+        if self.redis is not None:
+            await self.redis.set(key, value, stored_at, self.ttl_for(source) + self.stale_ttl)
+
+    async def get_or_fetch(self, source: str, params: Dict[str, Any],
+                           fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached result for the search, scraping it on a miss.
+
+        Args:
+            source: The job board name, used for the TTL and the key
+            params: The request parameters; normalized before hashing
+            fetch: Coroutine factory that performs the actual scrape
+
+        Returns:
+            The cached or freshly scraped result
+        """
+        key = make_key(source, params)
+        entry = await self._lookup(key)
+
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            ttl = self.ttl_for(source)
+            if age < ttl:
+                self.stats["hits"] += 1
+                return value
+            if age < ttl + self.stale_ttl:
+                self.stats["stale_hits"] += 1
+                self._revalidate(source, key, fetch)
+                return value
+            self.local.delete(key)
+
+        self.stats["misses"] += 1
+        return await self.flights.do(key, lambda: self._fetch_and_store(source, key, fetch))
+
+    async def _fetch_and_store(self, source: str, key: str,
+                               fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        await self.store(source, key, value)
+        return value
+
+    async def peek(self, source: str, key: str) -> Optional[Any]:
+        """The value stored under ``key`` if it is still within the source TTL; never scrapes."""
+        entry = await self._lookup(key)
+        if entry is None or time.time() - entry[1] >= self.ttl_for(source):
+            return None
+        return entry[0]
+
+    async def age(self, source: str, params: Dict[str, Any]) -> Optional[float]:
+        """Seconds since the search was cached, or None if it is not cached."""
+        entry = await self._lookup(make_key(source, params))
+        return None if entry is None else time.time() - entry[1]
+
+    async def refresh(self, source: str, params: Dict[str, Any],
+                      fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Scrape the search now and store the result, joining a scrape already in flight."""
+        key = make_key(source, params)
+        return await self.flights.do(key, lambda: self._fetch_and_store(source, key, fetch))
+
+    def _revalidate(self, source: str, key: str, fetch: Callable[[], Awaitable[Any]]):
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self.flights.do(key, lambda: self._fetch_and_store(source, key, fetch))
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def close(self):
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self.redis is not None:
+            await self.redis.close()
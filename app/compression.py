@@ -0,0 +1,131 @@
+import gzip
+import asyncio
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger('job_scraper')
+
+COMPRESSIBLE_TYPES = (b"application/json", b"text/", b"application/x-ndjson")
+
+# Bodies larger than this are compressed in a thread instead of on the event loop
+THREAD_THRESHOLD = 256 * 1024
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _qualities(accept_encoding: str) -> Dict[str, float]:
+    """Map every coding listed in an Accept-Encoding header to its q-value."""
+    offered = {}
+    for part in accept_encoding.lower().split(","):
+        name, *params = (piece.strip() for piece in part.split(";"))
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        offered[name] = quality
+    return offered
+
+
+def choose_encoding(accept_encoding: str, brotli_available: bool) -> Optional[str]:
+    """
+    Pick "br" or "gzip" from an Accept-Encoding header, or None to send the body as is.
+
+    Codings not listed take the q-value of ``*``. The highest q-value wins,
+    brotli first on a tie; ``identity`` only wins if the client ranks it
+    above both compressed codings.
+    """
+    offered = _qualities(accept_encoding)
+    wildcard = offered.get("*", 0.0)
+    candidates = (["br"] if brotli_available else []) + ["gzip"]
+    best = max(candidates, key=lambda name: offered.get(name, wildcard))
+    quality = offered.get(best, wildcard)
+    identity = offered.get("identity", wildcard)
+    if quality <= 0 or quality < identity:
+        return None
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress complete API responses with brotli or gzip.
+
+    Unlike Starlette's ``GZipMiddleware`` it never touches a response that
+    arrives in several body messages, so ``/*/stream`` events are still
+    sent the moment they are produced. Brotli is used when the client
+    accepts it and the ``brotli`` package is installed, gzip otherwise.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 5, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli = _brotli()
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return self.brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = next((value.decode("latin-1") for name, value in scope["headers"]
+                       if name == b"accept-encoding"), "")
+        encoding = choose_encoding(accept, self.brotli is not None)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            passthrough = True
+            body = message.get("body", b"")
+            headers = list(start.get("headers", []))
+            names = {name.lower(): value for name, value in headers}
+            content_type = names.get(b"content-type", b"")
+            if (message.get("more_body")
+                    or b"content-encoding" in names
+                    or len(body) < self.minimum_size
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)):
+                await send(start)
+                await send(message)
+                return
+
+            if len(body) > THREAD_THRESHOLD:
+                body = await asyncio.to_thread(self._compress, encoding, body)
+            else:
+                body = self._compress(encoding, body)
+            start["headers"] = [
+                *((name, value) for name, value in headers if name.lower() != b"content-length"),
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(body)).encode()),
+                (b"vary", b"Accept-Encoding"),
+            ]
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,179 @@
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _env_str(name: str, default: str) -> str:
+    """Read a string setting from the environment, falling back to a default."""
+    value = os.getenv(name)
+    return default if value is None or value == "" else value
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting (1/true/yes/on) from the environment."""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Browser pool
+CHROME_BINARY = _env_str("JOBHUB_CHROME_BINARY", "/usr/bin/google-chrome-stable")
+BROWSER_POOL_SIZE = _env_int("JOBHUB_BROWSER_POOL_SIZE", 2)
+BROWSER_MAX_NAVIGATIONS = _env_int("JOBHUB_BROWSER_MAX_NAVIGATIONS", 50)
+BROWSER_CHECKOUT_TIMEOUT = _env_float("JOBHUB_BROWSER_CHECKOUT_TIMEOUT", 60.0)
+# Browsers launched in the background at startup; 0 launches them on first use only
+BROWSER_WARM = _env_int("JOBHUB_BROWSER_WARM", 1)
+# Fixed chromedriver path; unset resolves it once with webdriver_manager
+CHROMEDRIVER_PATH = os.getenv("JOBHUB_CHROMEDRIVER") or None
+# "normal" waits for every subresource, "eager" for the DOM only, "none" returns at once
+BROWSER_PAGE_LOAD_STRATEGY = _env_str("JOBHUB_BROWSER_PAGE_LOAD_STRATEGY", "eager")
+# Requests a browser refuses per source: category names from app.netfilter and/or URL patterns.
+# We only read page_source, but Dice still needs its scripts and styles to render the cards.
+BLOCK_PROFILES = {
+    "linkedin": _env_str("JOBHUB_BLOCK_LINKEDIN", "images,fonts,media,styles,scripts,trackers"),
+    "dice": _env_str("JOBHUB_BLOCK_DICE", "images,fonts,media,trackers"),
+}
+
+# Browserless HTTP fetching
+HTTP_POOL_LIMIT = _env_int("JOBHUB_HTTP_POOL_LIMIT", 20)
+HTTP_POOL_LIMIT_PER_HOST = _env_int("JOBHUB_HTTP_POOL_LIMIT_PER_HOST", 8)
+HTTP_TIMEOUT = _env_float("JOBHUB_HTTP_TIMEOUT", 15.0)
+HTTP_DNS_TTL = _env_int("JOBHUB_HTTP_DNS_TTL", 300)
+HTTP_RETRIES = _env_int("JOBHUB_HTTP_RETRIES", 2)
+HTTP_BACKOFF = _env_float("JOBHUB_HTTP_BACKOFF", 0.5)
+LINKEDIN_HTTP_CONCURRENCY = _env_int("JOBHUB_LINKEDIN_HTTP_CONCURRENCY", 4)
+# Dice results pages are addressed by URL (page=, pageSize=), so they are fetched side by side
+DICE_PAGE_SIZE = _env_int("JOBHUB_DICE_PAGE_SIZE", 100)
+DICE_HTTP_CONCURRENCY = _env_int("JOBHUB_DICE_HTTP_CONCURRENCY", 4)
+
+# Result cache
+CACHE_MAXSIZE = _env_int("JOBHUB_CACHE_MAXSIZE", 512)
+CACHE_STALE_TTL = _env_float("JOBHUB_CACHE_STALE_TTL", 1800.0)
+CACHE_REDIS_URL = os.getenv("JOBHUB_REDIS_URL") or None
+CACHE_TTLS = {
+    "linkedin": _env_float("JOBHUB_CACHE_TTL_LINKEDIN", 600.0),
+    "indeed": _env_float("JOBHUB_CACHE_TTL_INDEED", 900.0),
+    "zip_recruiter": _env_float("JOBHUB_CACHE_TTL_ZIP_RECRUITER", 900.0),
+    "hirebase": _env_float("JOBHUB_CACHE_TTL_HIREBASE", 600.0),
+    "dice": _env_float("JOBHUB_CACHE_TTL_DICE", 600.0),
+}
+
+# Federated search
+FEDERATED_TIMEOUTS = {
+    "linkedin": _env_float("JOBHUB_TIMEOUT_LINKEDIN", 45.0),
+    "indeed": _env_float("JOBHUB_TIMEOUT_INDEED", 60.0),
+    "zip_recruiter": _env_float("JOBHUB_TIMEOUT_ZIP_RECRUITER", 60.0),
+    "hirebase": _env_float("JOBHUB_TIMEOUT_HIREBASE", 20.0),
+    "dice": _env_float("JOBHUB_TIMEOUT_DICE", 60.0),
+}
+
+# Paged /*/get responses: result sets are kept for cursors to page through
+PAGE_SIZE_DEFAULT = _env_int("JOBHUB_PAGE_SIZE_DEFAULT", 50)
+PAGE_SIZE_MAX = _env_int("JOBHUB_PAGE_SIZE_MAX", 500)
+RESULT_SET_TTL = _env_float("JOBHUB_RESULT_SET_TTL", 900.0)
+RESULT_SET_MAXSIZE = _env_int("JOBHUB_RESULT_SET_MAXSIZE", 256)
+
+# Response compression: bodies smaller than this are sent as they are
+COMPRESSION_MIN_SIZE = _env_int("JOBHUB_COMPRESSION_MIN_SIZE", 1024)
+GZIP_LEVEL = _env_int("JOBHUB_GZIP_LEVEL", 5)
+BROTLI_QUALITY = _env_int("JOBHUB_BROTLI_QUALITY", 4)
+
+# One log line per API request (method, path, status, latency)
+ACCESS_LOG = _env_bool("JOBHUB_ACCESS_LOG", False)
+
+# Cross-source deduplication and ranking of federated results
+DEDUPE_THRESHOLD = _env_float("JOBHUB_DEDUPE_THRESHOLD", 0.7)
+RANK_HALF_LIFE = _env_float("JOBHUB_RANK_HALF_LIFE", 7.0)
+RANK_SALARY_WEIGHT = _env_float("JOBHUB_RANK_SALARY_WEIGHT", 0.3)
+
+# Per-source pacing: starting requests per second, adapted at runtime
+RATE_LIMITS = {
+    "linkedin": _env_float("JOBHUB_RATE_LINKEDIN", 0.5),
+    "indeed": _env_float("JOBHUB_RATE_INDEED", 1.0),
+    "zip_recruiter": _env_float("JOBHUB_RATE_ZIP_RECRUITER", 0.5),
+    "hirebase": _env_float("JOBHUB_RATE_HIREBASE", 2.0),
+    "dice": _env_float("JOBHUB_RATE_DICE", 0.7),
+    "default": _env_float("JOBHUB_RATE_DEFAULT", 1.0),
+}
+# Requests a source may send back to back before the rate applies; the concurrent
+# scrapers need at least one token per page of a wave, or their waves go out one by one
+RATE_BURSTS = {
+    "linkedin": _env_float("JOBHUB_BURST_LINKEDIN", 2 * LINKEDIN_HTTP_CONCURRENCY),
+    "dice": _env_float("JOBHUB_BURST_DICE", 2 * DICE_HTTP_CONCURRENCY),
+}
+# Consecutive failures that open a source's circuit, and how long it stays open
+BREAKER_THRESHOLD = _env_int("JOBHUB_BREAKER_THRESHOLD", 5)
+BREAKER_RESET = _env_float("JOBHUB_BREAKER_RESET", 60.0)
+
+# Outbound proxies: comma-separated URLs and/or a file with one per line
+PROXIES = _env_str("JOBHUB_PROXIES", "")
+PROXY_FILE = os.getenv("JOBHUB_PROXY_FILE") or None
+PROXY_STRATEGY = _env_str("JOBHUB_PROXY_STRATEGY", "best")
+PROXY_MAX_FAILURES = _env_int("JOBHUB_PROXY_MAX_FAILURES", 3)
+PROXY_COOLDOWN = _env_float("JOBHUB_PROXY_COOLDOWN", 120.0)
+# Sources that scrape through the proxy pool
+PROXY_SOURCES = {s.strip() for s in _env_str("JOBHUB_PROXY_SOURCES", "linkedin,indeed,zip_recruiter,dice").split(",")}
+
+# Queue mode: API processes enqueue scrapes for `python -m app.worker` processes
+QUEUE_URL = os.getenv("JOBHUB_QUEUE_URL") or None
+QUEUE_NAME = _env_str("JOBHUB_QUEUE_NAME", "jobhub:scrape")
+QUEUE_TIMEOUT = _env_float("JOBHUB_QUEUE_TIMEOUT", 120.0)
+WORKER_CONCURRENCY = _env_int("JOBHUB_WORKER_CONCURRENCY", 4)
+
+# Blocking scrape executor
+SCRAPE_WORKERS = _env_int("JOBHUB_SCRAPE_WORKERS", 8)
+SCRAPE_QUEUE = _env_int("JOBHUB_SCRAPE_QUEUE", 16)
+
+# HTML parser engine per source: "lxml" (compiled XPath) or "soup" (BeautifulSoup)
+PARSER_LINKEDIN = _env_str("JOBHUB_PARSER_LINKEDIN", "lxml")
+PARSER_DICE = _env_str("JOBHUB_PARSER_DICE", "lxml")
+
+# Job board endpoints; the benchmark harness points them at local stand-in servers
+LINKEDIN_URL = _env_str("JOBHUB_LINKEDIN_URL", "https://www.linkedin.com")
+HIREBASE_URL = _env_str("JOBHUB_HIREBASE_URL", "https://www.hirebase.org/api")
+DICE_URL = _env_str("JOBHUB_DICE_URL", "https://www.dice.com")
+
+# Incremental ("new since last scrape") mode
+SEEN_DB_PATH = _env_str("JOBHUB_SEEN_DB_PATH", "jobhub_seen.sqlite3")
+SEEN_MAX_AGE = _env_float("JOBHUB_SEEN_MAX_AGE", 14 * 24 * 3600.0)
+
+# Persistent job store behind /jobs/query, filled from every scrape
+STORE_PATH = _env_str("JOBHUB_STORE_PATH", "jobhub_jobs.sqlite3")
+# Postings neither posted nor scraped again within this many seconds are deleted
+STORE_MAX_AGE = _env_float("JOBHUB_STORE_MAX_AGE", 14 * 24 * 3600.0)
+STORE_EXPIRE_INTERVAL = _env_float("JOBHUB_STORE_EXPIRE_INTERVAL", 3600.0)
+
+# Background pre-warming of popular searches
+PREWARM_ENABLED = _env_bool("JOBHUB_PREWARM_ENABLED", True)
+PREWARM_TOP_N = _env_int("JOBHUB_PREWARM_TOP_N", 5)
+PREWARM_INTERVAL = _env_float("JOBHUB_PREWARM_INTERVAL", 300.0)
+PREWARM_JITTER = _env_float("JOBHUB_PREWARM_JITTER", 30.0)
+PREWARM_CONCURRENCY = _env_int("JOBHUB_PREWARM_CONCURRENCY", 2)
+PREWARM_MIN_INTERVALS = {
+    "linkedin": _env_float("JOBHUB_PREWARM_MIN_INTERVAL_LINKEDIN", 30.0),
+    "indeed": _env_float("JOBHUB_PREWARM_MIN_INTERVAL_INDEED", 10.0),
+    "zip_recruiter": _env_float("JOBHUB_PREWARM_MIN_INTERVAL_ZIP_RECRUITER", 20.0),
+    "hirebase": _env_float("JOBHUB_PREWARM_MIN_INTERVAL_HIREBASE", 5.0),
+    "dice": _env_float("JOBHUB_PREWARM_MIN_INTERVAL_DICE", 30.0),
+}
@@ -0,0 +1,308 @@
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .normalize import FIELDS, Job, canonical_url
+
+ABBREVIATIONS = {
+    "sr": "senior", "jr": "junior", "eng": "engineer", "engr": "engineer", "dev": "developer",
+    "mgr": "manager", "mngr": "manager", "assoc": "associate", "admin": "administrator",
+    "swe": "software engineer",
+}
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "gmbh", "plc", "the"}
+# Tokens that make otherwise near-identical titles different jobs
+LEVEL_TOKENS = {
+    "i", "ii", "iii", "iv", "v", "1", "2", "3", "4", "5", "intern", "junior", "senior",
+    "staff", "principal", "lead", "head", "director", "manager", "associate",
+}
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+# MinHash: BANDS * ROWS permutations of character trigrams
+BANDS = 8
+ROWS = 4
+
+
+def _words(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return _NON_WORD.sub(" ", value.lower().replace("&", " and ")).split()
+
+
+@lru_cache(maxsize=65536)
+def normalize_title(value: Optional[str]) -> str:
+    return " ".join(ABBREVIATIONS.get(word, word) for word in _words(value))
+
+
+@lru_cache(maxsize=65536)
+def normalize_company(value: Optional[str]) -> str:
+    return " ".join(word for word in _words(value) if word not in COMPANY_SUFFIXES)
+
+
+@lru_cache(maxsize=4096)
+def normalize_city(value: Optional[str]) -> str:
+    """The first part of a location ("San Francisco, CA" -> "san francisco")."""
+    if not value:
+        return ""
+    return " ".join(_words(value.split(",")[0]))
+
+
+def minhash_signatures(texts: List[str]):
+    """
+    MinHash signatures over character trigrams, one row per text.
+
+    Trigrams and permutations are computed with numpy over all texts at
+    once, so signing tens of thousands of titles is a handful of array passes.
+    """
+    import numpy as np
+
+    encoded = [(text if len(text) >= 3 else text.ljust(3)).encode() for text in texts]
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    grams = (data[:-2] << np.uint64(16)) | (data[1:-1] << np.uint64(8)) | data[2:]
+
+    # Drop the trigrams that straddle two texts
+    ends = np.cumsum(lengths)
+    owner_end = np.repeat(ends, lengths)[:-2]
+    grams = grams[np.arange(len(grams)) + 2 < owner_end]
+    starts = np.concatenate(([0], np.cumsum(lengths - 2)[:-1]))
+
+    # Multiply-shift hashing: one wrapping multiply-add per permutation, no modulo
+    rng = np.random.default_rng(0x10b)
+    a = rng.integers(0, 2**63, BANDS * ROWS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2**63, BANDS * ROWS, dtype=np.uint64)
+    shift = np.uint64(32)
+    signatures = np.empty((len(texts), BANDS * ROWS), dtype=np.uint64)
+    for i in range(BANDS * ROWS):
+        signatures[:, i] = np.minimum.reduceat((a[i] * grams + b[i]) >> shift, starts)
+    return signatures
+
+
+def band_keys(signatures) -> List[List[int]]:
+    """Collapse each band of ROWS signature values into one LSH bucket key."""
+    import numpy as np
+
+    bands = signatures.reshape(len(signatures), BANDS, ROWS)
+    # Wrapping multiply-xor; a collision only costs one extra similarity check
+    mix = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5],
+                   dtype=np.uint64)[:ROWS]
+    keys = bands[:, :, 0] * mix[0]
+    for row in range(1, ROWS):
+        keys ^= bands[:, :, row] * mix[row]
+    return keys.tolist()
+
+
+@lru_cache(maxsize=65536)
+def _levels(title: str) -> frozenset:
+    return frozenset(word for word in title.split() if word in LEVEL_TOKENS)
+
+
+class Deduplicator:
+    """
+    Drop jobs already seen on this or another board.
+
+    A job is a duplicate when its canonical URL or its company + title +
+    city fingerprint was seen before, or when MinHash/LSH finds an earlier
+    job whose company and title trigrams are at least ``threshold``
+    similar, with the same seniority tokens and a compatible city. Jobs
+    without a title or company are only matched by URL. Fields missing on
+    the kept job are filled in from its duplicates.
+
+    ``add`` can be called once per board as results arrive; each call
+    only returns jobs that are new.
+    """
+
+    def __init__(self, threshold: float = 0.7):
+        self.threshold = threshold
+        self.kept: List[Job] = []
+        self.stats = {"input": 0, "url": 0, "fingerprint": 0, "near": 0}
+        self._urls: Dict[str, int] = {}
+        self._fingerprints: Dict[Tuple[str, str, str], int] = {}
+        self._buckets: List[Dict[int, int]] = [{} for _ in range(BANDS)]
+        self._signatures: Dict[int, Any] = {}
+        self._meta: Dict[int, Tuple[str, str, frozenset]] = {}
+        # Kept jobs later found to be near-duplicates point at the job they were merged into
+        self._merged_into: Dict[int, int] = {}
+
+    def _resolve(self, index: int) -> int:
+        while index in self._merged_into:
+            index = self._merged_into[index]
+        return index
+
+    def _similar(self, index: int, signature, company: str, city: str, levels: frozenset) -> bool:
+        kept_company, kept_city, kept_levels = self._meta[index]
+        if levels != kept_levels:
+            return False
+        if (company and kept_company and company != kept_company) or (city and kept_city and city != kept_city):
+            return False
+        agreement = (self._signatures[index] == signature).sum() / len(signature)
+        return agreement >= self.threshold
+
+    def _merge(self, index: int, job: Job):
+        kept = self.kept[index]
+        for name in FIELDS:
+            if getattr(kept, name) is None:
+                setattr(kept, name, getattr(job, name))
+
+    def add(self, jobs: List[Job]) -> List[Job]:
+        """Register ``jobs`` and return the ones that are not duplicates, in order."""
+        if not jobs:
+            return []
+        self.stats["input"] += len(jobs)
+
+        # Exact matches first, so only the remaining jobs need a signature
+        candidates = []
+        for job in jobs:
+            title = normalize_title(job.title)
+            company = normalize_company(job.company)
+            city = normalize_city(job.location)
+            url = canonical_url(job.url)
+            # The dict hashes the normalized company + title + city tuple. Without a
+            # title and company there is nothing to compare, only the URL identifies the job
+            key = (company, title, city) if title and company else None
+            if url and url in self._urls:
+                self.stats["url"] += 1
+                match = self._resolve(self._urls[url])
+                self._merge(match, job)
+            elif key is not None and key in self._fingerprints:
+                self.stats["fingerprint"] += 1
+                match = self._resolve(self._fingerprints[key])
+                self._merge(match, job)
+            else:
+                match = len(self.kept)
+                self.kept.append(job)
+                self._meta[match] = (company, city, _levels(title))
+                candidates.append((match, None if key is None else f"{company} {title}"))
+            if url:
+                self._urls.setdefault(url, match)
+            if key is not None:
+                self._fingerprints.setdefault(key, match)
+        if not candidates:
+            return []
+
+        texts = [text for _, text in candidates if text is not None]
+        if texts:
+            signatures = minhash_signatures(texts)
+            signed = zip(signatures, band_keys(signatures))
+        fresh = []
+        for index, text in candidates:
+            if text is None:
+                fresh.append(self.kept[index])
+                continue
+            signature, bands = next(signed)
+            company, city, levels = self._meta[index]
+            match = None
+            for band, bucket in zip(self._buckets, bands):
+                candidate = band.get(bucket)
+                if candidate is not None and self._similar(candidate, signature, company, city, levels):
+                    match = candidate
+                    break
+            if match is None:
+                self._signatures[index] = signature
+                fresh.append(self.kept[index])
+                for band, bucket in zip(self._buckets, bands):
+                    band.setdefault(bucket, index)
+            else:
+                self.stats["near"] += 1
+                self._merged_into[index] = match
+                self._merge(match, self.kept[index])
+        return fresh
+
+    @property
+    def duplicates(self) -> int:
+        return self.stats["url"] + self.stats["fingerprint"] + self.stats["near"]
+
+
+def dedupe(jobs: List[Job], threshold: float = 0.7) -> List[Job]:
+    """Deduplicate one list of normalized jobs, keeping the first of each group."""
+    return Deduplicator(threshold).add(jobs)
+
+
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
+_RELATIVE = re.compile(r"(\d+)\+?\s*(minute|min|hour|hr|day|week|wk|month|mo|year|yr)s?\b")
+_UNIT_DAYS = {
+    "minute": 0, "min": 0, "hour": 0, "hr": 0, "day": 1, "week": 7, "wk": 7,
+    "month": 30, "mo": 30, "year": 365, "yr": 365,
+}
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(k)?\b", re.IGNORECASE)
+_PERIODS = (("hour", 2080), ("/hr", 2080), ("week", 52), ("month", 12), ("/mo", 12), ("day", 260))
+
+
+@lru_cache(maxsize=4096)
+def _parse_post_date(post_date: str) -> Union[date, int, None]:
+    """The posting date of an ISO date, the age in days of a text like "3 days ago", else None."""
+    text = post_date.strip().lower()
+    iso = _ISO_DATE.match(text)
+    if iso:
+        try:
+            return date(*map(int, iso.groups()))
+        except ValueError:
+            return None
+    if "today" in text or "just" in text or text in ("new", "now"):
+        return 0
+    if "yesterday" in text:
+        return 1
+    relative = _RELATIVE.search(text)
+    if relative:
+        return int(relative.group(1)) * _UNIT_DAYS[relative.group(2)]
+    return None
+
+
+def age_days(post_date: Optional[str], today: Optional[date] = None) -> Optional[float]:
+    """
+    Days since a job was posted, from ISO dates or texts like "3 days ago".
+
+    Returns None when the date cannot be read.
+    """
+    if not post_date:
+        return None
+    parsed = _parse_post_date(post_date)
+    # Only the parse is cached: ages of ISO dates move on with the clock
+    if isinstance(parsed, date):
+        return max(0, ((today or date.today()) - parsed).days)
+    return parsed
+
+
+@lru_cache(maxsize=4096)
+def annual_salary(salary: Optional[str]) -> Optional[float]:
+    """
+    Midpoint of a salary text as a yearly amount.
+
+    Hourly, weekly, daily and monthly figures are annualized; bare amounts
+    below 500 are taken as hourly.
+    """
+    if not salary:
+        return None
+    amounts = [float(value.replace(",", "")) * (1000 if k else 1)
+               for value, k in _AMOUNT.findall(salary)[:2]]
+    amounts = [amount for amount in amounts if amount > 0]
+    if not amounts:
+        return None
+    amount = sum(amounts) / len(amounts)
+    text = salary.lower()
+    for period, factor in _PERIODS:
+        if period in text:
+            return amount * factor
+    return amount * 2080 if amount < 500 else amount
+
+
+def rank(jobs: List[Job], half_life: float = 7.0, salary_weight: float = 0.3,
+         today: Optional[date] = None) -> List[Job]:
+    """
+    Order jobs by a blend of recency and pay, best first.
+
+    Recency halves every ``half_life`` days (an unknown date scores as if
+    it were two half-lives old); pay is the annual salary relative to the
+    best-paid job in the list, 0 when undisclosed. Ties keep their order.
+    """
+    today = today or date.today()
+    ages = [age_days(job.post_date, today) for job in jobs]
+    salaries = [annual_salary(job.salary) for job in jobs]
+    top = max((s for s in salaries if s), default=0) or 1
+    scores = [
+        (1 - salary_weight) * 0.5 ** ((2 * half_life if age is None else age) / half_life)
+        + salary_weight * min((pay or 0) / top, 1.0)
+        for age, pay in zip(ages, salaries)
+    ]
+    order = sorted(range(len(jobs)), key=lambda i: -scores[i])
+    return [jobs[i] for i in order]
@@ -0,0 +1,238 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('job_scraper')
+
+
+class PoolTimeout(Exception):
+    """Raised when no browser could be checked out before the timeout expired."""
+
+
+class PooledDriver:
+    """
+    A WebDriver wrapper that counts navigations for the pool.
+
+    Attribute access is delegated to the wrapped driver, so callers can use
+    it exactly like a ``webdriver.Chrome`` instance.
+    """
+
+    def __init__(self, driver: Any, on_close: Optional[Callable[[], None]] = None,
+                 proxy: Any = None):
+        self.driver = driver
+        self.proxy = proxy
+        self.blocked: Optional[Tuple[str, ...]] = None
+        self.navigations = 0
+        self.created_at = time.monotonic()
+        self._on_close = on_close
+
+    def get(self, url: str):
+        self.navigations += 1
+        return self.driver.get(url)
+
+    def block_urls(self, patterns: Sequence[str]):
+        """
+        Make the browser refuse requests matching ``patterns`` (CDP wildcards).
+
+        Pooled browsers serve several sources, so the profile is switched on
+        checkout; the CDP round-trip is skipped when it is already in place.
+        """
+        patterns = tuple(patterns)
+        if patterns == self.blocked:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+            self.blocked = patterns
+        except Exception as e:
+            logger.warning(f"Could not set blocked URLs: {e}")
+
+    @property
+    def proxy_unhealthy(self) -> bool:
+        """True if the browser's proxy was benched by the proxy pool."""
+        return self.proxy is not None and self.proxy.cooling_down()
+
+    def is_alive(self) -> bool:
+        """Cheap round-trip to check that the browser session still responds."""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error while quitting WebDriver: {e}")
+        finally:
+            if self._on_close:
+                self._on_close()
+
+    def __getattr__(self, name: str):
+        return getattr(self.driver, name)
+
+
+class DriverPool:
+    """
+    A bounded pool of WebDriver instances with checkout/checkin.
+
+    Browsers are launched on demand up to ``size``. A browser is health-checked
+    on checkout and recycled once it has served ``max_navigations`` page loads,
+    when the caller reports it as broken, or when its proxy went bad.
+    """
+
+    def __init__(self, factory: Callable[[], PooledDriver], size: int = 2,
+                 max_navigations: int = 50, checkout_timeout: float = 60.0):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._factory = factory
+        self.size = size
+        self.max_navigations = max_navigations
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[PooledDriver] = []
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {"created": 0, "recycled": 0, "checkouts": 0, "waits": 0}
+
+    @property
+    def total(self) -> int:
+        return len(self._idle) + self._in_use
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Take a healthy browser from the pool, launching one if there is room.
+
+        Args:
+            timeout: Seconds to wait for a free browser (defaults to the pool setting)
+
+        Returns:
+            A PooledDriver reserved for the caller until checkin
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self.total < self.size:
+                    # Reserve the slot before launching so other threads respect the bound
+                    self._in_use += 1
+                    pooled = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(f"No browser available after {timeout:.0f}s")
+                self.stats["waits"] += 1
+                self._cond.wait(remaining)
+
+        # Launching and health checks happen outside the lock
+        try:
+            if pooled is not None and not pooled.is_alive():
+                logger.warning("Pooled WebDriver failed health check, recycling")
+                self._discard(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = self._factory()
+                with self._cond:
+                    self.stats["created"] += 1
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self.stats["checkouts"] += 1
+        return pooled
+
+    def checkin(self, pooled: PooledDriver, broken: bool = False):
+        """
+        Return a browser to the pool.
+
+        Args:
+            pooled: The browser obtained from checkout
+            broken: True if the caller hit a crash and the browser must be replaced
+        """
+        recycle = broken or pooled.navigations >= self.max_navigations or pooled.proxy_unhealthy
+        if recycle:
+            self._discard(pooled)
+
+        quit_now = False
+        with self._cond:
+            self._in_use -= 1
+            if not recycle:
+                if self._closed:
+                    quit_now = True
+                else:
+                    self._idle.append(pooled)
+            self._cond.notify()
+
+        if quit_now:
+            pooled.quit()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Context manager that checks a browser out and always checks it back in."""
+        from selenium.common.exceptions import WebDriverException
+
+        pooled = self.checkout(timeout)
+        broken = False
+        try:
+            yield pooled
+        except WebDriverException:
+            broken = not pooled.is_alive()
+            raise
+        finally:
+            self.checkin(pooled, broken=broken)
+
+    def warm(self, count: int) -> int:
+        """
+        Launch browsers ahead of demand until ``count`` are idle (at most ``size``).
+
+        Returns:
+            The number of idle browsers in the pool afterwards
+        """
+        launched = []
+        try:
+            for _ in range(min(count, self.size)):
+                launched.append(self.checkout(timeout=0))
+        except PoolTimeout:
+            pass
+        finally:
+            for pooled in launched:
+                self.checkin(pooled)
+        with self._cond:
+            return len(self._idle)
+
+    def _discard(self, pooled: PooledDriver):
+        with self._cond:
+            self.stats["recycled"] += 1
+        pooled.quit()
+
+    def close(self):
+        """Quit every idle browser and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            pooled.quit()
+
+    def status(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                **self.stats,
+            }
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger('job_scraper')
+
+class Saturated(Exception):
+    """Raised when the executor's workers and queue are all taken."""
+
+    def __init__(self, name: str, retry_after: int = 5):
+        super().__init__(f"{name} executor is saturated, try again later")
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    A dedicated thread pool for blocking scrapes with a bounded queue.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue``
+    more wait for a worker. Anything beyond that is rejected immediately
+    with ``Saturated`` instead of piling up, so blocking scrapes can never
+    starve the server's own threadpool.
+    """
+
+    def __init__(self, max_workers: int = 8, max_queue: int = 16, name: str = "scrape"):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._pending = 0
+        self.stats = {"completed": 0, "rejected": 0}
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @contextmanager
+    def _admit(self):
+        if self._pending >= self.capacity:
+            self.stats["rejected"] += 1
+            logger.warning(f"{self.name} executor saturated ({self._pending} pending), rejecting")
+            raise Saturated(self.name)
+        self._pending += 1
+        try:
+            yield
+        finally:
+            self._pending -= 1
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the executor.
+
+        Raises:
+            Saturated: If all workers are busy and the queue is full
+        """
+        with self._admit():
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._pool, partial(fn, *args, **kwargs))
+            self.stats["completed"] += 1
+            return result
+
+    def status(self) -> Dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "running": min(self._pending, self.max_workers),
+            "queued": max(0, self._pending - self.max_workers),
+            **self.stats,
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,207 @@
+import time
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from . import config
+from . import schemas
+from . import normalize
+from .dedupe import Deduplicator, rank
+from .cache import ResultCache
+from .executor import Saturated
+from .ratelimit import CircuitOpen
+from .jobs import JobScraper
+
+logger = logging.getLogger('job_scraper')
+
+
+class Source:
+    """
+    One job board taking part in a federated search.
+
+    ``build`` turns the federated query into ``model``, the same schemas
+    model the board's own /*/get endpoint takes, so both share cache entries.
+    """
+
+    def __init__(self, name: str, model: Type[BaseModel],
+                 build: Callable[[schemas.searchInput], BaseModel],
+                 fetch: Callable[[JobScraper, Any], Awaitable[Any]],
+                 normalizer: Callable[[Any], List[normalize.Job]]):
+        self.name = name
+        self.model = model
+        self.build = build
+        self.fetch = fetch
+        self.normalizer = normalizer
+
+
+def _jobspy_kwargs(title: schemas.indeedInput) -> Dict[str, Any]:
+    return dict(
+        search_term=title.search_term,
+        google_search_term=title.google_search_term,
+        location=title.location,
+        results_wanted=title.results_wanted,
+        hours_old=title.hours_old,
+        country=title.country_indeed,
+    )
+
+
+def _indeed_input(query: schemas.searchInput) -> schemas.indeedInput:
+    return schemas.indeedInput(
+        search_term=query.search_term,
+        google_search_term=None,
+        location=query.location,
+        results_wanted=query.results_wanted,
+        hours_old=query.hours_old,
+        country_indeed=query.country_indeed,
+    )
+
+
+SOURCES: Dict[str, Source] = {
+    "linkedin": Source(
+        "linkedin",
+        schemas.userInput,
+        lambda q: schemas.userInput(skill=q.search_term, location=q.location, pagenumber=0),
+        lambda scraper, t: scraper.search_linkedin_http(t.skill, t.location, t.pagenumber),
+        normalize.from_linkedin,
+    ),
+    "indeed": Source(
+        "indeed",
+        schemas.indeedInput,
+        _indeed_input,
+        lambda scraper, t: scraper.executor.run(scraper.search_with_jobspy, site_name="indeed", **_jobspy_kwargs(t)),
+        normalize.from_indeed,
+    ),
+    "zip_recruiter": Source(
+        "zip_recruiter",
+        schemas.indeedInput,
+        _indeed_input,
+        lambda scraper, t: scraper.executor.run(scraper.search_with_jobspy_ziprecuiter, site_name=["zip_recruiter"], **_jobspy_kwargs(t)),
+        normalize.from_zip_recruiter,
+    ),
+    "hirebase": Source(
+        "hirebase",
+        schemas.hireBase,
+        lambda q: schemas.hireBase(search_term=q.search_term, location=q.location),
+        lambda scraper, t: scraper.search_on_hireBase(search_term=t.search_term, location=t.location),
+        normalize.from_hirebase,
+    ),
+    "dice": Source(
+        "dice",
+        schemas.hireBase,
+        lambda q: schemas.hireBase(search_term=q.search_term, location=q.location),
+        lambda scraper, t: scraper.search_dice_http(t.search_term, t.location),
+        normalize.from_dice,
+    ),
+}
+
+
+Fetcher = Callable[[str, BaseModel], Awaitable[Any]]
+
+
+def local_fetcher(scraper: JobScraper) -> Fetcher:
+    """Run a source's search on this process's scraper."""
+    return lambda name, title: SOURCES[name].fetch(scraper, title)
+
+
+class FederatedSearch:
+    """
+    Fan a query out to several job boards at once and merge the results.
+
+    ``fetch`` runs one source's search; it defaults to the local scraper
+    and is replaced by the work queue when scraping runs on workers.
+    """
+
+    def __init__(self, scraper: JobScraper, cache: ResultCache,
+                 timeouts: Dict[str, float], default_timeout: float = 60.0,
+                 on_query: Optional[Callable[[str, BaseModel], None]] = None,
+                 fetch: Optional[Fetcher] = None):
+        self.scraper = scraper
+        self.fetch = fetch or local_fetcher(scraper)
+        self.cache = cache
+        self.timeouts = timeouts
+        self.default_timeout = default_timeout
+        self.on_query = on_query
+
+    async def _run_source(self, source: Source, query: schemas.searchInput) -> Dict[str, Any]:
+        started = time.monotonic()
+        title = source.build(query)
+        if self.on_query:
+            self.on_query(source.name, title)
+        timeout = self.timeouts.get(source.name, self.default_timeout)
+        result = {"source": source.name, "status": "ok", "jobs": []}
+        try:
+            raw = await asyncio.wait_for(
+                self.cache.get_or_fetch(source.name, title.model_dump(),
+                                        lambda: self.fetch(source.name, title)),
+                timeout,
+            )
+            result["jobs"] = source.normalizer(raw)
+            if not result["jobs"]:
+                result["status"] = "empty"
+        except asyncio.TimeoutError:
+            # The scrape keeps running in the background and still fills the cache
+            logger.warning(f"{source.name} timed out after {timeout:.0f}s")
+            result["status"] = "timeout"
+        except Saturated:
+            result["status"] = "saturated"
+        except CircuitOpen:
+            result["status"] = "circuit_open"
+        except Exception as e:
+            logger.error(f"{source.name} failed in federated search: {e}")
+            result["status"] = "error"
+        result["elapsed"] = round(time.monotonic() - started, 3)
+        return result
+
+    async def stream(self, query: schemas.searchInput) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield one event per source as soon as it finishes.
+
+        Jobs already sent for another source (same posting URL, same
+        company + title + city, or a near-identical title at the same
+        company) are dropped, so every event only carries new postings.
+        The last event summarizes the search.
+        """
+        names = query.sources or list(SOURCES)
+        dedupe = Deduplicator(config.DEDUPE_THRESHOLD)
+        total = 0
+        statuses = {}
+        pending = [asyncio.ensure_future(self._run_source(SOURCES[name], query)) for name in names]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                result = await next_done
+                fresh = dedupe.add(result["jobs"])
+                result["jobs"] = fresh
+                total += len(fresh)
+                statuses[result["source"]] = result["status"]
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+        yield {"done": True, "total": total, "duplicates": dedupe.duplicates, "sources": statuses}
+
+    async def search(self, query: schemas.searchInput) -> Dict[str, Any]:
+        """
+        Run the query on all sources and return the merged, deduplicated jobs.
+
+        Unless ``query.rank`` is off, jobs are ordered by recency and
+        salary instead of by the board that answered first.
+        """
+        jobs = []
+        sources = {}
+        duplicates = 0
+        async for event in self.stream(query):
+            if event.get("done"):
+                duplicates = event["duplicates"]
+                continue
+            jobs.extend(event["jobs"])
+            sources[event["source"]] = {
+                "status": event["status"],
+                "count": len(event["jobs"]),
+                "elapsed": event["elapsed"],
+            }
+        if query.rank:
+            jobs = rank(jobs, config.RANK_HALF_LIFE, config.RANK_SALARY_WEIGHT)
+        return {"total": len(jobs), "duplicates": duplicates, "sources": sources, "jobs": jobs}
@@ -0,0 +1,140 @@
+import random
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger('job_scraper')
+
+# Responses worth retrying: the board is briefly unavailable, not refusing us
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class HttpFetcher:
+    """
+    A shared aiohttp session for every HTTP-based source.
+
+    The session is started from the app lifespan (or lazily on first use)
+    and kept open, so connections to the job boards are pooled and reused
+    (keep-alive) and DNS lookups are cached. Requests get a total timeout
+    and are retried with jittered exponential backoff on connection errors
+    and 5xx responses.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, limit: int = 20,
+                 limit_per_host: int = 8, timeout: float = 15.0, dns_ttl: int = 300,
+                 retries: int = 2, backoff: float = 0.5):
+        self.headers = headers or {}
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.dns_ttl = dns_ttl
+        self.retries = retries
+        self.backoff = backoff
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.stats = {"requests": 0, "retries": 0, "errors": 0}
+
+    async def start(self):
+        """Create the session up front, e.g. from the app lifespan."""
+        await self.session()
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.dns_ttl,
+                    use_dns_cache=True,
+                    keepalive_timeout=30,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+        return self._session
+
+    async def _sleep_before_retry(self, attempt: int):
+        # Full jitter: spread retries from many requests over the backoff window
+        await asyncio.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    async def request(self, method: str, url: str, parse: str = "text",
+                      retries: Optional[int] = None, **kwargs) -> Tuple[int, Any]:
+        """
+        Send a request through the shared session, retrying transient failures.
+
+        Args:
+            method: The HTTP method
+            url: The URL to request
+            parse: "text" or "json"; error responses are always returned as text
+            retries: Retry attempts (defaults to the fetcher setting)
+            **kwargs: Passed to ``ClientSession.request`` (json=, headers=, ...)
+
+        Returns:
+            A (status, body) tuple
+        """
+        retries = self.retries if retries is None else retries
+        session = await self.session()
+
+        for attempt in range(retries + 1):
+            self.stats["requests"] += 1
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status in RETRY_STATUSES and attempt < retries:
+                        logger.warning(f"{method} {url} returned {response.status}, retrying")
+                        self.stats["retries"] += 1
+                        await self._sleep_before_retry(attempt)
+                        continue
+                    if parse == "json" and response.status == 200:
+                        return response.status, await response.json(content_type=None)
+                    return response.status, await response.text()
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= retries:
+                    self.stats["errors"] += 1
+                    raise
+                logger.warning(f"{method} {url} failed ({e.__class__.__name__}), retrying")
+                self.stats["retries"] += 1
+                await self._sleep_before_retry(attempt)
+
+    async def fetch_text(self, url: str, proxy: Optional[str] = None) -> Tuple[int, str]:
+        """
+        GET a URL through the shared session.
+
+        Args:
+            url: The URL to fetch
+            proxy: Optional proxy URL for this request
+
+        Returns:
+            A (status, body) tuple
+        """
+        return await self.request("GET", url, proxy=proxy)
+
+    async def post_json(self, url: str, payload: Any, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any]:
+        """POST a JSON payload and decode a JSON response (text on error statuses)."""
+        return await self.request("POST", url, parse="json", json=payload, headers=headers)
+
+    def status(self) -> Dict[str, Any]:
+        """Connection pool and request counters, for sizing the pool under load."""
+        pool = {"limit": self.limit, "limit_per_host": self.limit_per_host, "in_use": 0, "idle": 0}
+        connector = self._session.connector if self._session is not None and not self._session.closed else None
+        if connector is not None:
+            # aiohttp has no public pool stats; read them defensively
+            pool["in_use"] = len(getattr(connector, "_acquired", ()))
+            pool["idle"] = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        return {**pool, **self.stats}
+
+    async def close(self):
+        """Close the shared session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,154 @@
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, AsyncIterator, Callable, Iterable, List, Set
+
+from pydantic import BaseModel
+
+from . import normalize
+from .cache import make_key
+
+logger = logging.getLogger('job_scraper')
+
+# Sources whose result pages come newest first (LinkedIn searches with sortBy=DD),
+# so paginating can stop at the first known posting
+DATE_SORTED = {"linkedin"}
+
+
+class SeenIndex:
+    """
+    Persistent per-query index of job IDs that were already returned.
+
+    Backed by SQLite so it survives restarts. One connection is shared
+    between threads behind a lock; WAL mode keeps writes cheap.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_jobs ("
+                " query_key TEXT NOT NULL,"
+                " job_id TEXT NOT NULL,"
+                " first_seen REAL NOT NULL,"
+                " PRIMARY KEY (query_key, job_id))"
+            )
+            self._conn.commit()
+
+    def known(self, query_key: str, job_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of ``job_ids`` already recorded for the query."""
+        job_ids = list(set(job_ids))
+        if not job_ids:
+            return set()
+        placeholders = ",".join("?" * len(job_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT job_id FROM seen_jobs WHERE query_key = ? AND job_id IN ({placeholders})",
+                [query_key, *job_ids],
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark(self, query_key: str, job_ids: Iterable[str]):
+        """Record job IDs as seen for the query."""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_jobs (query_key, job_id, first_seen) VALUES (?, ?, ?)",
+                [(query_key, job_id, now) for job_id in set(job_ids)],
+            )
+            self._conn.commit()
+
+    def prune(self, max_age: float) -> int:
+        """Forget postings first seen more than ``max_age`` seconds ago."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM seen_jobs WHERE first_seen < ?", (time.time() - max_age,))
+            self._conn.commit()
+        if cursor.rowcount:
+            logger.info(f"Pruned {cursor.rowcount} entries from the seen-jobs index")
+        return cursor.rowcount
+
+    def delta(self, source: str, title: BaseModel) -> "Delta":
+        """
+        Start an incremental scrape for a request.
+
+        The query is identified by the request parameters; ``client_id``
+        gives each polling client its own view of what it has seen.
+        """
+        query_key = f"{make_key(source, title.model_dump())}:{title.client_id or ''}"
+        return Delta(self, query_key, lambda item: normalize.job_id(source, item),
+                     stop_at_known=source in DATE_SORTED)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class Delta:
+    """
+    Filters a scrape down to postings not yet seen for a query.
+
+    Call ``filter`` for each page (or the whole result) and ``commit``
+    once the delta was delivered, so a failed request does not swallow
+    new postings.
+    """
+
+    def __init__(self, index: SeenIndex, query_key: str, job_id: Callable[[Any], str],
+                 stop_at_known: bool = False):
+        self.index = index
+        self.query_key = query_key
+        self.job_id = job_id
+        self.stop_at_known = stop_at_known
+        self.new_ids: List[str] = []
+        self._new: Set[str] = set()
+        self.reached_known = False
+
+    def filter(self, items: List[Any]) -> List[Any]:
+        ids = [self.job_id(item) for item in items]
+        known = self.index.known(self.query_key, ids)
+        fresh = []
+        for item, job_id in zip(items, ids):
+            if job_id in known or job_id in self._new:
+                continue
+            self._new.add(job_id)
+            self.new_ids.append(job_id)
+            fresh.append(item)
+        if known:
+            self.reached_known = True
+        return fresh
+
+    async def pages(self, pages: AsyncIterator[List[Any]]) -> AsyncIterator[List[Any]]:
+        """
+        Yield only new postings.
+
+        With ``stop_at_known`` the results are sorted newest first, so
+        everything after a known posting was delivered by an earlier poll
+        and paginating stops at the first page with known ones. Otherwise
+        every page is fetched and filtered.
+        """
+        fetched = 0
+        try:
+            async for items in pages:
+                fetched += 1
+                fresh = self.filter(items)
+                if fresh:
+                    yield fresh
+                if self.stop_at_known and self.reached_known:
+                    logger.info(f"Incremental scrape reached known postings after {fetched} page(s)")
+                    break
+        finally:
+            # Stop the scrape right away instead of when the generator is collected
+            await pages.aclose()
+
+    async def committed_pages(self, pages: AsyncIterator[List[Any]]) -> AsyncIterator[List[Any]]:
+        """Like ``pages``, and records the delta as seen once it was fully delivered."""
+        async for items in self.pages(pages):
+            yield items
+        self.commit()
+
+    def commit(self):
+        if self.new_ids:
+            self.index.mark(self.query_key, self.new_ids)
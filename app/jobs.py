@@ -1,24 +1,25 @@
 import time
 import logging
-import random
-import aiohttp
-import json
 import asyncio
-import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.common.by import By
-from selenium_stealth import stealth
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from urllib.request import Request, urlopen
-import urllib.request
-import numpy as np
+import threading
+import urllib.parse
 import tempfile
-from jobspy import scrape_jobs
-from typing import List, Dict, Optional, Any
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Iterable, AsyncIterator
+
+from . import config
+from .driver_pool import DriverPool, PooledDriver
+from .http_fetch import HttpFetcher
+from .executor import BoundedExecutor, Saturated
+from .metrics import metrics
+from .netfilter import build_patterns
+from .parsers import get_parser
+from .ratelimit import CircuitOpen, build_guards
+from .proxies import ProxyPool, load_proxies
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 # Configure logging
 logging.basicConfig(
@@ -28,42 +29,137 @@ logging.basicConfig(
 )
 logger = logging.getLogger('job_scraper')
 
+# Selenium, webdriver_manager and jobspy (pandas/numpy) are imported on first
+# use, so importing the app and serving browserless sources stays fast.
+HEAVY_MODULES = (
+    "selenium.webdriver",
+    "selenium_stealth",
+    "webdriver_manager.chrome",
+    "jobspy",
+    ".postprocess",
+)
+
+# Substrings that show up on LinkedIn's auth wall / bot challenge pages
+LINKEDIN_CHALLENGE_MARKERS = ("/checkpoint/challenge", "authwall", "captcha")
+
+# A search with no matches: Dice's "no results" notice, or its card list rendered empty.
+# A page with neither is a script-only shell (or a block page), not an empty search.
+DICE_NO_RESULTS = "[data-cy='no-results']"
+DICE_RESULTS_MARKERS = ('data-cy="no-results"', "<dhi-search-cards-widget")
+
 class JobScraper:
     """A class for scraping job listings from various job boards."""
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, pool_size: Optional[int] = None,
+                 max_navigations: Optional[int] = None):
         self.headers = {
             'user-agent': 'Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) '
                          'AppleWebKit/537.36 (KHTML, like Gecko) '
                          'Chrome/92.0.4515.107 Mobile Safari/537.36'
         }
-        
-        # Create temporary directory that auto-cleans up
-        self.user_data_dir = tempfile.TemporaryDirectory()
-        
-        self.chrome_options = webdriver.ChromeOptions()
-        if headless:
-            self.chrome_options.add_argument("--headless=new")  # Modern headless mode
-        
-        self.chrome_options.binary_location = "/usr/bin/google-chrome-stable"
-        self.chrome_options.add_argument(f"--user-data-dir={self.user_data_dir.name}")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        self.driver = None
-        self._initialize_driver()
+        self.headless = headless
+        self._chromedriver: Optional[str] = config.CHROMEDRIVER_PATH
+        self._chromedriver_lock = threading.Lock()
+        self.warmup = {"state": "pending", "browsers": 0, "seconds": None, "error": None}
+        self.parser_engines = {"linkedin": config.PARSER_LINKEDIN, "dice": config.PARSER_DICE}
+        # Requests each source's pages make that we never read (images, fonts, trackers, ...)
+        self.blocked_urls = {source: build_patterns(spec) for source, spec in config.BLOCK_PROFILES.items()}
 
+        # Adaptive pacing and a circuit breaker per job board
+        self.guards = build_guards(config.RATE_LIMITS, config.BREAKER_THRESHOLD, config.BREAKER_RESET,
+                                   config.RATE_BURSTS)
+
+        # Outbound proxies, rotated per request (per browser for Selenium)
+        self.proxies = ProxyPool(
+            load_proxies(config.PROXIES, config.PROXY_FILE),
+            strategy=config.PROXY_STRATEGY,
+            max_failures=config.PROXY_MAX_FAILURES,
+            cooldown=config.PROXY_COOLDOWN,
+        )
+
+        # Blocking scrapes (Selenium, jobspy) run here instead of the server's threadpool
+        self.executor = BoundedExecutor(
+            max_workers=config.SCRAPE_WORKERS,
+            max_queue=config.SCRAPE_QUEUE,
+        )
+
+        # Shared keep-alive HTTP session for sources that do not need a browser
+        self.http = HttpFetcher(
+            headers=self.headers,
+            limit=config.HTTP_POOL_LIMIT,
+            limit_per_host=config.HTTP_POOL_LIMIT_PER_HOST,
+            timeout=config.HTTP_TIMEOUT,
+            dns_ttl=config.HTTP_DNS_TTL,
+            retries=config.HTTP_RETRIES,
+            backoff=config.HTTP_BACKOFF,
+        )
+
+        # Browsers are launched on demand by the pool, each with its own profile dir
+        self.driver_pool = DriverPool(
+            self._create_driver,
+            size=pool_size or config.BROWSER_POOL_SIZE,
+            max_navigations=max_navigations or config.BROWSER_MAX_NAVIGATIONS,
+            checkout_timeout=config.BROWSER_CHECKOUT_TIMEOUT,
+        )
+
+    def _build_chrome_options(self, user_data_dir: str, proxy: Optional[str] = None) -> "webdriver.ChromeOptions":
+        """Build Chrome options for a single browser instance."""
+        from selenium import webdriver
+
+        chrome_options = webdriver.ChromeOptions()
+        if self.headless:
+            chrome_options.add_argument("--headless=new")  # Modern headless mode
+
+        chrome_options.binary_location = config.CHROME_BINARY
+        # Only page_source and explicit waits are used, so do not wait for every subresource
+        chrome_options.page_load_strategy = config.BROWSER_PAGE_LOAD_STRATEGY
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        if proxy:
+            parts = urlsplit(proxy)
+            if parts.username:
+                # Chrome ignores credentials in --proxy-server; the proxy has to allow our IP
+                logger.warning(f"Credentials of proxy {parts.hostname} are not supported by Chrome")
+            chrome_options.add_argument(f"--proxy-server={parts.scheme}://{parts.hostname}:{parts.port}")
+        return chrome_options
+
+    def _driver_path(self) -> str:
+        """
+        Resolve the chromedriver binary once per process.
+
+        ``ChromeDriverManager().install()`` checks (and possibly downloads)
+        the driver over the network on every call, so the result is kept.
+        """
+        with self._chromedriver_lock:
+            if self._chromedriver is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                self._chromedriver = ChromeDriverManager().install()
+                logger.info(f"Using chromedriver at {self._chromedriver}")
+            return self._chromedriver
+
+    def _create_driver(self) -> PooledDriver:
+        """Launch and configure a Chrome WebDriver with stealth settings."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium_stealth import stealth
+
+        # Create temporary directory that auto-cleans up when the browser quits
+        user_data_dir = tempfile.TemporaryDirectory()
+        # A browser keeps its proxy for its lifetime and is recycled if the proxy goes bad
+        proxy = self.proxies.acquire() if config.PROXY_SOURCES & {"linkedin", "dice"} else None
+
+        def on_close():
+            self.proxies.release(proxy)
+            user_data_dir.cleanup()
 
-        self.driver = None
-        self._initialize_driver()
-        
-    def _initialize_driver(self):
-        """Initialize and configure the Chrome WebDriver with stealth settings."""
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            
+            service = Service(self._driver_path())
+            options = self._build_chrome_options(user_data_dir.name, proxy.url if proxy else None)
+            driver = webdriver.Chrome(service=service, options=options)
+
             stealth(
-                self.driver,
+                driver,
                 languages=["en-US", "en"],
                 vendor="Google Inc.",
                 platform="Win32",
@@ -71,147 +167,249 @@ class JobScraper:
                 renderer="Intel Iris OpenGL Engine",
                 fix_hairline=True,
             )
-            logger.info("WebDriver initialized successfully")
-        
+            logger.info("WebDriver initialized successfully" + (f" behind proxy {proxy.url}" if proxy else ""))
+            return PooledDriver(driver, on_close=on_close, proxy=proxy)
+
         except Exception as e:
+            self.proxies.release(proxy, ok=False)
+            user_data_dir.cleanup()
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise
 
+    def warm_up(self, browsers: int = 1):
+        """
+        Import the heavy scraping modules, resolve chromedriver and launch browsers.
+
+        Meant to run in a background thread once the app is already serving,
+        so the first scrape does not pay for the cold start. Progress is kept
+        in ``self.warmup`` for the readiness endpoint.
+        """
+        import importlib
+
+        started = time.monotonic()
+        self.warmup["state"] = "warming"
+        try:
+            for module in HEAVY_MODULES:
+                importlib.import_module(module, __package__)
+            if browsers > 0:
+                self._driver_path()
+                self.warmup["browsers"] = self.driver_pool.warm(browsers)
+            self.warmup["state"] = "ready"
+        except Exception as e:
+            # Browsers are still launched on demand; readiness reports the failure
+            logger.error(f"Warm-up failed: {e}")
+            self.warmup["state"] = "failed"
+            self.warmup["error"] = str(e)
+        finally:
+            self.warmup["seconds"] = round(time.monotonic() - started, 3)
+            logger.info(f"Warm-up finished in {self.warmup['seconds']}s ({self.warmup['state']})")
+
+    async def aclose(self):
+        """Close the shared HTTP session, stop the executor and quit all pooled browsers."""
+        await self.http.close()
+        self.executor.shutdown()
+        self.driver_pool.close()
+
+    @contextmanager
+    def _browser(self, source: str):
+        """Check out a pooled browser with the source's request-blocking profile applied."""
+        with self.driver_pool.driver() as driver:
+            driver.block_urls(self.blocked_urls.get(source, ()))
+            yield driver
+
+    @staticmethod
+    def _navigate(driver: PooledDriver, url: str):
+        """Load a page; with the "none" load strategy, also wait until its DOM is parsed."""
+        driver.get(url)
+        if config.BROWSER_PAGE_LOAD_STRATEGY == "none":
+            from selenium.webdriver.support.ui import WebDriverWait
+
+            WebDriverWait(driver.driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") != "loading"
+            )
+
+    @contextmanager
+    def _proxy(self, source: str, exclude: Iterable[Any] = ()):
+        """Reserve a proxy for one request to a source, or None to connect directly."""
+        with (self.proxies.use(exclude) if source in config.PROXY_SOURCES else nullcontext()) as proxy:
+            yield proxy
+
     def __del__(self):
         """Clean up resources when the object is destroyed."""
-        if self.driver:
-            self.driver.quit()
-            
-    
-    def _check_next_page_exists(self, url: str, method: str = "default") -> bool:
+        pool = getattr(self, "driver_pool", None)
+        if pool:
+            pool.close()
+
+    def _parse_linkedin_page(self, html: str) -> List[List[str]]:
         """
-        Check if a next page exists for pagination.
-        
+        Parse one page of the LinkedIn guest API into job rows.
+
         Args:
-            url: The URL to check
-            method: The method to use for checking ("default", "indeed", or "linkedin")
-            
+            html: The page source returned by the guest API
+
         Returns:
-            True if next page exists, False otherwise
+            A list of [company, job, link, salary, post_date] rows
         """
-        try:
-            if method == "default":
-                req = urllib.request.Request(url, headers=self.headers)
-                time.sleep(1)  # Avoid rate limiting
-                with urlopen(req) as webUrl:
-                    html = webUrl.read()
-                soup = BeautifulSoup(html, 'html.parser')
-                return not bool(soup.find('div', {'class': 'noResults'}))
-                
-            elif method in ("indeed", "linkedin"):
-                self.driver.get(url)
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                if method == "indeed":
-                    return bool(soup.find('div', id='mosaic-provider-jobcards'))
-                else:  # linkedin
-                    return bool(soup.find('li'))
-                    
-            else:
-                logger.warning(f"Unknown method: {method}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error checking next page: {e}")
+        with metrics.stage("linkedin", "parse"):
+            cards = get_parser("linkedin", self.parser_engines["linkedin"]).parse(html)
+        return [
+            [job_data['company'], job_data['job'], job_data['link'], job_data['salary'], job_data['post_date']]
+            for job_data in cards
+        ]
+
+    @staticmethod
+    def _linkedin_url(skill: str, place: str, start: int) -> str:
+        """Build the LinkedIn guest API URL for the page at the given offset."""
+        keywords = urllib.parse.quote(skill)
+        location = urllib.parse.quote(place)
+        return f"{config.LINKEDIN_URL}/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={keywords}&location={location}&start={start}&f_TPR=r86400&&sortBy=DD"
+
+    @staticmethod
+    def _is_linkedin_challenge(status: int, html: str) -> bool:
+        """Check whether a guest API response is a block or challenge page instead of job cards."""
+        if status in (403, 429, 999):
+            return True
+        if status != 200:
             return False
-    
-    
-    
-    def search_linkedin(self, skill: str, place: str, page: int = 0, max_pages: int = 10) -> List[List[str]]:
+        return any(marker in html for marker in LINKEDIN_CHALLENGE_MARKERS)
+
+    async def iter_linkedin_http(self, skill: str, place: str, page: int = 0,
+                                 max_pages: int = 10, concurrency: Optional[int] = None) -> AsyncIterator[List[List[str]]]:
         """
-        Search for jobs on LinkedIn.
-        
+        Search for jobs on LinkedIn over plain HTTP, without a browser.
+
+        The first page is fetched alone to learn the page size, then the
+        remaining offsets are fetched in concurrent waves. Whether another
+        page exists is decided from the pages already fetched: an empty or
+        short page ends the search, with no separate request to probe for
+        it. Pages that come back as a challenge are re-fetched through a
+        pooled browser.
+
         Args:
             skill: The job skill to search for
             place: The location to search in
-            page: The starting page number
+            page: The starting offset (``start=``) of the first page
             max_pages: Maximum number of pages to scrape
-            
-        Returns:
-            A list of job listings
+            concurrency: Maximum number of pages fetched at once
+
+        Yields:
+            The job listings of one page, in page order
         """
-        linkedin_list = []
-        current_page = page
-        
+        concurrency = concurrency or config.LINKEDIN_HTTP_CONCURRENCY
+        semaphore = asyncio.Semaphore(concurrency)
+        guard = self.guards["linkedin"]
+        found = pages = saved = 0
+
+        async def fetch_page(start: int) -> List[List[str]]:
+            url = self._linkedin_url(skill, place, start)
+            async with semaphore:
+                await guard.before_async()
+                logger.info(f"Fetching LinkedIn page {start} over HTTP: {url}")
+                started = time.monotonic()
+                with self._proxy("linkedin") as proxy:
+                    try:
+                        with metrics.stage("linkedin", "fetch"):
+                            status, html = await self.http.fetch_text(url, proxy=proxy.url if proxy else None)
+                    except Exception:
+                        guard.failure()
+                        raise
+                    blocked = self._is_linkedin_challenge(status, html) or status >= 500
+                    self.proxies.record(proxy, not blocked, time.monotonic() - started)
+
+            if self._is_linkedin_challenge(status, html):
+                guard.throttled()
+                logger.warning(f"LinkedIn returned a challenge (status {status}), falling back to Selenium")
+                await guard.before_async()
+                html = await self.executor.run(self._fetch_linkedin_page_source, url)
+                if not html:
+                    return []
+            else:
+                guard.observe(status, time.monotonic() - started)
+                if status != 200:
+                    logger.info(f"LinkedIn returned status {status} for offset {start}")
+                    return []
+            # Parsing a page takes a while; on the event loop it would stall other requests
+            return await self.executor.run(self._parse_linkedin_page, html)
+
         try:
-            while current_page < (page + max_pages):
-                url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={skill}&location={place}&start={current_page}&f_TPR=r86400&&sortBy=DD"
-                logger.info(f"Scraping LinkedIn page {current_page}: {url}")
-                
-                self.driver.get(url)
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                list_items = soup.find('body').find_all('li') if soup.find('body') else []
-                
-                if not list_items:
-                    logger.info("No more jobs found on LinkedIn")
-                    break
-                
-                for item in list_items:
-                    
-                    job_data = {
-                        'company': 'No Company',
-                        'job': 'No Job Title',
-                        'link': 'No Link',
-                        'salary': 'No Salary',
-                        'post_date': 'No Date'
-                    }
-                    
-                    # Job Title
-                    job_title = item.find('h3', class_='base-search-card__title')
-                    if job_title:
-                        job_data['job'] = job_title.get_text(strip=True)
-                    
-                    # Company Name
-                    company_elem = item.find('h4', class_='base-search-card__subtitle')
-                    if company_elem:
-                        job_data['company'] = company_elem.get_text(strip=True)
-                    
-                    # Link
-                    link_elem = item.find('a', class_='base-card__full-link')
-                    if link_elem and link_elem.has_attr('href'):
-                        job_data['link'] = link_elem['href']
-                    
-                    # Salary
-                    salary_elem = item.find('div', class_='job-salary')
-                    if salary_elem:
-                        job_data['salary'] = salary_elem.get_text(strip=True)
-                    
-                    # Post Date
-                    post_date_elem = item.find('time', class_=lambda c: c and ('job-search-card__listdate' in c or 'job-search-card__listdate--new' in c))
-                    if post_date_elem:
-                        job_data['post_date'] = post_date_elem.get_text(strip=True)
-                    
-                    linkedin_list.append([
-                        job_data['company'], 
-                        job_data['job'], 
-                        job_data['link'], 
-                        job_data['salary'], 
-                        job_data['post_date']
-                    ])
-                
-                current_page += 25  # LinkedIn pagination typically uses 25 job increments
-                
-                
-                if not self._check_next_page_exists(url, "linkedin"):
+            guard.check()
+            first = await fetch_page(page)
+            if first:
+                found += len(first)
+                pages += 1
+                yield first
+            page_size = len(first)
+            fetched = 1
+
+            # Remaining pages go out in waves; a short or empty page ends the search
+            while page_size and fetched < max_pages:
+                wave = min(concurrency, max_pages - fetched)
+                offsets = [page + (fetched + i) * page_size for i in range(wave)]
+                results = await asyncio.gather(*(fetch_page(offset) for offset in offsets))
+                fetched += wave
+
+                done = False
+                for rows in results:
+                    if rows:
+                        found += len(rows)
+                        pages += 1
+                        yield rows
+                    if len(rows) < page_size:
+                        # A short page also spares the trailing empty fetch
+                        saved += bool(rows)
+                        done = True
+                        break
+                if done:
                     break
-                    
-                time.sleep(random.uniform(1.5, 3.0))  
-            
-            logger.info(f"Found {len(linkedin_list)} jobs on LinkedIn")
-            return linkedin_list
-            
+
+            # Every page spared a separate load to check for a next one
+            saved += pages
+            metrics.inc("jobhub_page_fetches_total", fetched, source="linkedin", kind="made")
+            metrics.inc("jobhub_page_fetches_total", saved, source="linkedin", kind="saved")
+            logger.info(f"Found {found} jobs on LinkedIn over HTTP ({fetched} fetches, {saved} saved)")
+            metrics.result("linkedin", "success" if found else "empty")
+
+        except (CircuitOpen, Saturated) as e:
+            # Backpressure, not a scrape error: the API answers 503 with Retry-After
+            if not found:
+                metrics.result("linkedin", "rejected")
+                raise
+            metrics.result("linkedin", "success")
+            logger.warning(f"Stopping LinkedIn scrape early: {e}")
         except Exception as e:
-            logger.error(f"Error searching LinkedIn: {e}")
-            return linkedin_list
-    
+            metrics.result("linkedin", "error")
+            logger.error(f"Error searching LinkedIn over HTTP: {e}")
+
+    async def search_linkedin_http(self, skill: str, place: str, page: int = 0,
+                                   max_pages: int = 10, concurrency: Optional[int] = None) -> List[List[str]]:
+        """
+        Search for jobs on LinkedIn over plain HTTP; see ``iter_linkedin_http``.
+
+        Returns:
+            A list of job listings, in page order
+        """
+        linkedin_list = []
+        async for rows in self.iter_linkedin_http(skill, place, page, max_pages, concurrency):
+            linkedin_list.extend(rows)
+        return linkedin_list
+
+    def _fetch_linkedin_page_source(self, url: str) -> str:
+        """Load a LinkedIn guest API page in a pooled browser; returns "" if it is a challenge too."""
+        guard = self.guards["linkedin"]
+        with self._browser("linkedin") as driver:
+            started = time.monotonic()
+            with metrics.stage("linkedin", "navigate"):
+                self._navigate(driver, url)
+                html = driver.page_source
+            if self._is_linkedin_challenge(200, html):
+                guard.throttled()
+                self.proxies.record(driver.proxy, False)
+                logger.warning(f"LinkedIn returned a challenge to the browser too: {url}")
+                return ""
+            guard.success(time.monotonic() - started)
+            self.proxies.record(driver.proxy, True, time.monotonic() - started)
+            return html
+
     def search_with_jobspy(self, site_name: str, search_term: str, 
                       google_search_term: str, location: str = "newyork",
                       results_wanted: int = 30, hours_old: int = 72,
@@ -219,11 +417,14 @@ class JobScraper:
         """
         Search for jobs using jobspy with robust salary handling
         """
+        guard = self.guards.get(site_name, self.guards["default"])
         try:
+            guard.before()
             logger.info(f"Searching {site_name} using jobspy")
             
-            
-            jobs = scrape_jobs(
+            started = time.monotonic()
+            jobs = self._scrape_jobs(
+                site_name,
                 site_name=site_name,
                 search_term=search_term,
                 google_search_term=google_search_term,
@@ -233,43 +434,30 @@ class JobScraper:
                 country_indeed=country,
             )
             
+            guard.success(time.monotonic() - started)
             logger.info(f"Found {len(jobs)} jobs using jobspy")
 
             
             columns_needed = ["company", "title", "job_url", "date_posted", "company_logo"]
-            salary_columns = ["min_amount", "max_amount", "currency"]
-            
-            
-            for col in salary_columns:
-                if col not in jobs.columns:
-                    jobs[col] = None
-
-           
-            if "min_amount" in jobs.columns:
-                jobs["min_amount"] = jobs["min_amount"].fillna(0).astype(int)
-            if "max_amount" in jobs.columns:
-                jobs["max_amount"] = jobs["max_amount"].fillna(0).astype(int)
-
-           
-            jobs["salary_info"] = jobs.apply(
-                lambda row: f"{row['min_amount']}-{row['max_amount']} {row['currency']}"
-                if pd.notnull(row["min_amount"]) and pd.notnull(row["max_amount"])
-                else "Not disclosed",
-                axis=1
-            )
 
-           
-            final_columns = columns_needed + ["salary_info"]
-            df_clean = jobs[final_columns].replace({np.nan: None})
-
-            
-            return df_clean.values.tolist()
+            # Salary strings, typed salary columns and NaN -> None are built column-wise
+            from . import postprocess
+            final_columns = columns_needed + ["salary_info"] + postprocess.SALARY_COLUMNS
+            with metrics.stage(site_name, "postprocess"):
+                rows = postprocess.to_rows(jobs, final_columns)
+            metrics.result(site_name, "success" if rows else "empty")
+            return rows
 
+        except CircuitOpen:
+            metrics.result(site_name, "rejected")
+            raise
         except KeyError as ke:
+            metrics.result(site_name, "error")
             logger.error(f"Missing column in results: {ke}")
             return []
         except Exception as e:
-            logger.error(f"Error in jobspy search: {str(e)}")
+            metrics.result(site_name, "error")
+            self._jobspy_failed(guard, e)
             return []
 
     def search_with_jobspy_ziprecuiter(self,site_name:List[str],search_term: str, 
@@ -279,11 +467,14 @@ class JobScraper:
         """
         Search for jobs using jobspy and return results in JSON-friendly format
         """
+        guard = self.guards["zip_recruiter"]
         try:
+            guard.before()
             logger.info(f"Searching zip_recruiter using jobspy")
             
-           
-            jobs = scrape_jobs(
+            started = time.monotonic()
+            jobs = self._scrape_jobs(
+                "zip_recruiter",
                 site_name=site_name,
                 search_term=search_term,
                 google_search_term=google_search_term,
@@ -291,51 +482,67 @@ class JobScraper:
                 results_wanted=results_wanted,
                 hours_old=hours_old,
                 country_indeed=country,
-                proxies=["161.97.136.251:3128"]
             )
             
+            guard.success(time.monotonic() - started)
             logger.info(f"Found {len(jobs)} jobs using jobspy")
 
             
             columns_needed = ["company", "title", "job_url", "date_posted", "location"]
-            salary_columns = ["min_amount", "max_amount", "currency"]
-            
-            
-            for col in columns_needed + salary_columns:
-                if col not in jobs.columns:
-                    jobs[col] = None
 
-           
-            jobs["min_amount"] = jobs["min_amount"].fillna(0).astype(float)
-            jobs["max_amount"] = jobs["max_amount"].fillna(0).astype(float)
-            
-           
-            jobs["currency"] = jobs["currency"].fillna("").astype(str)
-
-            
-            jobs["salary_info"] = jobs.apply(
-                lambda row: (
-                    f"{row['min_amount']:.0f}-{row['max_amount']:.0f} {row['currency']}"
-                    if pd.notnull(row["min_amount"]) and pd.notnull(row["max_amount"])
-                    else "Not disclosed"
-                ),
-                axis=1
-            )
-
-            
-            final_columns = columns_needed + ["salary_info", "description"]
-            jobs_clean = jobs[final_columns].replace({np.nan: None})
-            
-            
-            return jobs_clean.to_dict(orient='records')
+            # Salary strings, typed salary columns and NaN -> None are built column-wise
+            from . import postprocess
+            final_columns = columns_needed + ["salary_info", "description"] + postprocess.SALARY_COLUMNS
+            with metrics.stage("zip_recruiter", "postprocess"):
+                records = postprocess.to_records(jobs, final_columns)
+            metrics.result("zip_recruiter", "success" if records else "empty")
+            return records
 
+        except CircuitOpen:
+            metrics.result("zip_recruiter", "rejected")
+            raise
         except Exception as e:
-            logger.error(f"Error in jobspy search: {str(e)}")
+            metrics.result("zip_recruiter", "error")
+            self._jobspy_failed(guard, e)
             return []
 
+    def _scrape_jobs(self, source: str, **kwargs):
+        """
+        Run jobspy's ``scrape_jobs`` through the proxy pool.
+
+        jobspy swallows most connection errors and returns no jobs, so an
+        empty result through a proxy counts against that proxy and the
+        scrape is retried once through another one.
+        """
+        from jobspy import scrape_jobs
+
+        attempts = 2 if source in config.PROXY_SOURCES and len(self.proxies) > 1 else 1
+        tried = []
+        for _ in range(attempts):
+            with self._proxy(source, exclude=tried) as proxy:
+                started = time.monotonic()
+                with metrics.stage(source, "scrape"):
+                    jobs = scrape_jobs(proxies=[proxy.url] if proxy else None, **kwargs)
+                self.proxies.record(proxy, len(jobs) > 0, time.monotonic() - started)
+            if len(jobs) or proxy is None:
+                break
+            logger.warning(f"No {source} jobs through proxy {proxy.url}")
+            tried.append(proxy)
+        return jobs
+
+    @staticmethod
+    def _jobspy_failed(guard, error: Exception):
+        """Report a failed jobspy scrape to the source's guard."""
+        # jobspy surfaces rate limiting only in its error messages
+        if "429" in str(error) or "rate limit" in str(error).lower():
+            guard.throttled()
+        else:
+            guard.failure()
+        logger.error(f"Error in jobspy search: {str(error)}")
+
 
     async def search_on_hireBase(self, search_term:str, location:str):
-        url = "https://www.hirebase.org/api"
+        url = config.HIREBASE_URL
         headers = {"Content-Type": "application/json"}
         payload = [
             {
@@ -361,159 +568,209 @@ class JobScraper:
             ""
         ]
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {"error": f"Request failed with status {response.status}"}
+        guard = self.guards["hirebase"]
+        try:
+            await guard.before_async()
+        except CircuitOpen:
+            metrics.result("hirebase", "rejected")
+            raise
+        started = time.monotonic()
+        try:
+            with metrics.stage("hirebase", "fetch"):
+                status, data = await self.http.post_json(url, payload, headers=headers)
+        except Exception:
+            guard.failure()
+            metrics.result("hirebase", "error")
+            raise
+        guard.observe(status, time.monotonic() - started)
+        if status == 200:
+            found = isinstance(data, list) and bool(data) and bool(data[0])
+            metrics.result("hirebase", "success" if found else "empty")
+            return data
+        else:
+            metrics.result("hirebase", "error")
+            return {"error": f"Request failed with status {status}"}
                 
-    def search_dice(self, skill: str, location: str, max_results: int = 50) -> List[Dict[str, str]]:
+    def _parse_dice_page(self, html: str) -> List[Dict[str, str]]:
         """
-        Search Dice.com for jobs and return structured results - optimized version
+        Parse the job cards of one Dice search results page.
+
+        Args:
+            html: The rendered page source
+
+        Returns:
+            A list of job dicts
         """
-        dice_list = []
-        try:
-            logger.info(f"Searching Dice.com for {skill} jobs in {location}")
-            
-            
-            encoded_skill = urllib.parse.quote(skill)
-            encoded_location = urllib.parse.quote(location)
-            search_url = f"https://www.dice.com/jobs?q={encoded_skill}&location={encoded_location}"
-            
-            
-            self.driver.get(search_url)
-            
-            
-            wait = WebDriverWait(self.driver, 10)
-            
-            
-            try:
-                cookie_accept = wait.until(EC.element_to_be_clickable(
-                    (By.XPATH, '//*[@id="truste-show-consent"]')
-                ))
-                cookie_accept.click()
-            except:
-                pass  
-                
-           
+        with metrics.stage("dice", "parse"):
+            return get_parser("dice", self.parser_engines["dice"]).parse(html)
+
+    @staticmethod
+    def _dice_url(skill: str, location: str, page: int, today: bool = False) -> str:
+        """Build the URL of one Dice results page; pages are numbered from 1."""
+        keywords = urllib.parse.quote(skill)
+        place = urllib.parse.quote(location)
+        url = f"{config.DICE_URL}/jobs?q={keywords}&location={place}&page={page}&pageSize={config.DICE_PAGE_SIZE}"
+        # The filter the "Today" facet button used to apply by click
+        return url + "&filters.postedDate=ONE" if today else url
+
+    @staticmethod
+    def _is_dice_results_page(html: str) -> bool:
+        """Check whether a Dice page without job cards really is a search with no matches."""
+        return any(marker in html for marker in DICE_RESULTS_MARKERS)
+
+    def _fetch_dice_page_source(self, url: str) -> str:
+        """Load a Dice results page in a pooled browser and return it once the job cards (or "no results") rendered."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        guard = self.guards["dice"]
+        with self._browser("dice") as driver:
+            started = time.monotonic()
+            with metrics.stage("dice", "navigate"):
+                self._navigate(driver, url)
             try:
-                wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "div.search-card")
-                ))
-            except:
-                logger.warning("No job cards found or page structure changed")
+                with metrics.stage("dice", "wait"):
+                    WebDriverWait(driver.driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, f"div.search-card, {DICE_NO_RESULTS}"))
+                    )
+            except Exception:
+                # Counts towards the circuit breaker, so a blocking Dice stops costing us this wait
+                guard.failure()
+                self.proxies.record(driver.proxy, False)
+                logger.warning(f"No job cards found on {url} or page structure changed")
+                return ""
+            guard.success(time.monotonic() - started)
+            self.proxies.record(driver.proxy, True, time.monotonic() - started)
+            return driver.page_source
+
+    async def iter_dice_http(self, skill: str, location: str, max_results: int = 50,
+                             concurrency: Optional[int] = None) -> AsyncIterator[List[Dict[str, str]]]:
+        """
+        Search Dice.com over plain HTTP, fetching the results pages side by side.
+
+        Every page needed for ``max_results`` is addressed by URL
+        (``page=``, ``pageSize=``, ``filters.postedDate=``), so they go
+        out in concurrent waves instead of being clicked through one by
+        one. The page size is taken from the first page, whatever
+        ``pageSize`` asked for. Pages Dice refuses are loaded in a pooled
+        browser; if the first page is a script-only shell (no job cards
+        and no results list), all pages are. A search with no matches
+        just ends.
+
+        Args:
+            skill: The job skill to search for
+            location: The location to search in
+            max_results: Maximum number of jobs to yield in total
+            concurrency: Maximum number of pages fetched at once
+
+        Yields:
+            The job dicts of one results page, in page order
+        """
+        concurrency = concurrency or config.DICE_HTTP_CONCURRENCY
+        semaphore = asyncio.Semaphore(concurrency)
+        guard = self.guards["dice"]
+        page_size = config.DICE_PAGE_SIZE
+        pages = -(-max_results // page_size)
+        use_browser = False
+        found = 0
+
+        async def fetch_page(page: int) -> Optional[List[Dict[str, str]]]:
+            # None: the page came back without job cards and without a results list
+            url = self._dice_url(skill, location, page, today=max_results > 20)
+            async with semaphore:
+                await guard.before_async()
+                if use_browser:
+                    html = await self.executor.run(self._fetch_dice_page_source, url)
+                    return await self.executor.run(self._parse_dice_page, html)
+                logger.info(f"Fetching Dice page {page} over HTTP: {url}")
+                started = time.monotonic()
+                with self._proxy("dice") as proxy:
+                    try:
+                        with metrics.stage("dice", "fetch"):
+                            status, html = await self.http.fetch_text(url, proxy=proxy.url if proxy else None)
+                    except Exception:
+                        guard.failure()
+                        raise
+                    self.proxies.record(proxy, status < 500 and status not in (403, 429),
+                                        time.monotonic() - started)
+
+            guard.observe(status, time.monotonic() - started)
+            if status in (403, 429):
+                logger.warning(f"Dice returned status {status}, falling back to Selenium")
+                await guard.before_async()
+                html = await self.executor.run(self._fetch_dice_page_source, url)
+            elif status != 200:
+                logger.info(f"Dice returned status {status} for page {page}")
                 return []
-                
-            
-            if max_results > 20:  
-                try:
-                    today_filter = wait.until(EC.element_to_be_clickable((
-                        By.XPATH, '//*[@id="facets"]/dhi-accordion[1]/div[2]/div/js-single-select-filter/div/div/button[2]'
-                    )))
-                    today_filter.click()
-                    
-                    time.sleep(1)
-                except:
-                    pass  
-                    
-            
-            page = 1
-            max_pages = (max_results // 20) + 1  
-            
-            while len(dice_list) < max_results and page <= max_pages:
-                
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "html.parser")
-                job_cards = soup.find_all('div', class_='card search-card')
-                
-                
-                for card in job_cards:
-                    if len(dice_list) >= max_results:
+            # Dice pages are large; parsing them on the event loop would stall other requests
+            jobs = await self.executor.run(self._parse_dice_page, html)
+            if not jobs and not self._is_dice_results_page(html):
+                return None
+            return jobs
+
+        try:
+            guard.check()
+            logger.info(f"Searching Dice.com for {skill} jobs in {location} over HTTP")
+            fetched = 0
+            done = False
+            # A recovering breaker admits a single probe, so page 1 goes out alone first
+            wave_size = 1 if guard.breaker.state != "closed" else concurrency
+            while not done and fetched < pages:
+                wave = list(range(fetched + 1, min(pages, fetched + wave_size) + 1))
+                wave_size = concurrency
+                results = await asyncio.gather(*(fetch_page(page) for page in wave))
+                if not fetched and results[0] is None and not use_browser:
+                    logger.info("Dice sent no job cards over HTTP, loading the pages in a browser")
+                    use_browser = True
+                    continue
+                if not fetched and results[0] and len(results[0]) != page_size:
+                    # Dice may cap or ignore pageSize: go by the page it actually sent
+                    page_size = len(results[0])
+                    pages = -(-max_results // page_size)
+                fetched += len(wave)
+
+                for page_jobs in results:
+                    page_jobs = page_jobs or []
+                    jobs = page_jobs[:max_results - found]
+                    if jobs:
+                        found += len(jobs)
+                        yield jobs
+                    # A short or empty page is the last one
+                    if len(page_jobs) < page_size or found >= max_results:
+                        done = True
                         break
-                        
-                    try:
-                        
-                        job_info = {
-                            'company': 'N/A',
-                            'title': 'N/A',
-                            'url': 'N/A',
-                            'location': 'N/A',
-                            'post_date': 'N/A',
-                            'employment_type': 'Not specified',
-                            'salary': 'Not disclosed'
-                        }
-                        
-                        
-                        # Company Name
-                        company_elem = card.find('a', {'data-cy': 'search-result-company-name'})
-                        if company_elem:
-                            job_info['company'] = company_elem.get_text(strip=True)
-                        
-                        # Job Title and URL
-                        title_elem = card.find('a', {'data-cy': 'card-title-link'})
-                        if title_elem:
-                            job_info['title'] = title_elem.get_text(strip=True)
-                            job_info['url'] = title_elem['href'] if title_elem.has_attr('href') else 'N/A'
-                        
-                        # Location
-                        location_elem = card.find('span', {'data-cy': 'search-result-location'})
-                        if location_elem:
-                            job_info['location'] = location_elem.get_text(strip=True)
-                        
-                        # Post Date
-                        date_elem = card.find('span', class_='posted-date')
-                        if date_elem:
-                            job_info['post_date'] = date_elem.get_text(strip=True)
-                        
-                        # Employment Type
-                        employment_elem = card.find('span', {'data-cy': 'search-result-employment-type'})
-                        if employment_elem:
-                            job_info['employment_type'] = employment_elem.get_text(strip=True)
-                        
-                        # Salary Information
-                        salary_elem = card.find('span', {'data-cy': 'compensationText'})
-                        if salary_elem:
-                            job_info['salary'] = salary_elem.get_text(strip=True)
-                        
-                        dice_list.append(job_info)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error parsing job card: {str(e)}")
-                        continue
-                
-                
-                if len(dice_list) < max_results and page < max_pages:
-                    try:
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, "button[data-cy='pagination-next-page']")
-                        if next_button.is_enabled():
-                            next_button.click()
-                            page += 1
-                            
-                            time.sleep(1.5)
-                            wait.until(EC.staleness_of(job_cards[0]))
-                        else:
-                            break  
-                    except:
-                        break  
-                else:
-                    break
-                    
-            logger.info(f"Successfully extracted {len(dice_list)} jobs from Dice")
-            return dice_list
-            
+
+            logger.info(f"Successfully extracted {found} jobs from Dice ({fetched} pages requested)")
+            metrics.result("dice", "success" if found else "empty")
+
+        except (CircuitOpen, Saturated) as e:
+            # Backpressure, not a scrape error: the API answers 503 with Retry-After
+            if not found:
+                metrics.result("dice", "rejected")
+                raise
+            metrics.result("dice", "success")
+            logger.warning(f"Stopping Dice scrape early: {e}")
         except Exception as e:
+            metrics.result("dice", "error")
             logger.error(f"Dice.com search failed: {str(e)}")
-            return []
 
-        
+    async def search_dice_http(self, skill: str, location: str, max_results: int = 50,
+                               concurrency: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Search Dice.com over plain HTTP; see ``iter_dice_http``.
+
+        Returns:
+            A list of job dicts, in page order
+        """
+        dice_list = []
+        async for jobs in self.iter_dice_http(skill, location, max_results, concurrency):
+            dice_list.extend(jobs)
+        return dice_list
 
 
 
 
-def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0):
-    """Add a random delay to avoid detection."""
-    time.sleep(random.uniform(min_seconds, max_seconds))
 
 
 if __name__ == "__main__":
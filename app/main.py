@@ -1,11 +1,57 @@
 
-from fastapi import FastAPI,Request, Response
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI,Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from typing import Literal
 import logging
 from . import schemas
 from . import jobs
+from . import config
+from .cache import ResultCache
+from .compression import CompressionMiddleware
+from .executor import Saturated
+from .ratelimit import CircuitOpen
+from .incremental import SeenIndex
+from .paging import CursorExpired, InvalidCursor, decode_cursor, new_token, page, query_digest
+from .store import JobStore
+from .metrics import MetricsMiddleware, metrics
+from .prewarm import Prewarmer
+from .federated import SOURCES, FederatedSearch
+from .streaming import JobsResponse, page_events, stream_response
+from .workqueue import QueueTimeout, RemoteError, WorkQueue
 
-app=FastAPI()
+logger = logging.getLogger('job_scraper')
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await jobscr.http.start()
+    seen.prune(config.SEEN_MAX_AGE)
+    expiry = asyncio.create_task(store.expire_periodically(config.STORE_MAX_AGE, config.STORE_EXPIRE_INTERVAL))
+    if config.PREWARM_ENABLED:
+        prewarmer.start()
+    warmup = None
+    if work_queue is None:
+        # Heavy imports and browser launches happen after the app is already serving
+        warmup = asyncio.create_task(asyncio.to_thread(jobscr.warm_up, config.BROWSER_WARM))
+    yield
+    if warmup is not None and not warmup.done():
+        await asyncio.wait([warmup], timeout=30)
+    await prewarmer.stop()
+    expiry.cancel()
+    await asyncio.gather(expiry, return_exceptions=True)
+    seen.close()
+    store.close()
+    await cache.close()
+    await result_sets.close()
+    if work_queue is not None:
+        await work_queue.close()
+    await jobscr.aclose()
+
+
+app=FastAPI(lifespan=lifespan, default_response_class=JobsResponse)
 
 origins = [
       "https://job-hub-rho.vercel.app/",
@@ -20,89 +66,344 @@ app.add_middleware(
       allow_methods=["*"], 
       allow_headers=["*"],
 )
+app.add_middleware(
+      CompressionMiddleware,
+      minimum_size=config.COMPRESSION_MIN_SIZE,
+      gzip_level=config.GZIP_LEVEL,
+      brotli_quality=config.BROTLI_QUALITY,
+)
+app.add_middleware(MetricsMiddleware, access_log=config.ACCESS_LOG)
 
 
 jobscr = jobs.JobScraper()
 
+# With a queue configured this process stays a thin front-end and workers scrape
+work_queue = WorkQueue(config.QUEUE_URL, name=config.QUEUE_NAME) if config.QUEUE_URL else None
+
+
+async def fetch_source(source, title):
+    """Run one source's search locally, or on a scrape worker in queue mode, and store the result."""
+    if work_queue is not None:
+        raw = await work_queue.submit(source, title.model_dump(), config.QUEUE_TIMEOUT)
+    else:
+        raw = await SOURCES[source].fetch(jobscr, title)
+    await remember(source, raw)
+    return raw
+
+
+async def remember(source, raw):
+    """Write a scrape's postings into the job store behind /jobs/query; never fails the request."""
+    try:
+        await asyncio.to_thread(lambda: store.add(SOURCES[source].normalizer(raw)))
+    except Exception as e:
+        logger.warning(f"Could not store {source} results: {e}")
+
+
+async def remembered_pages(source, pages):
+    """Pass pages through unchanged, storing each one."""
+    async for rows in pages:
+        await remember(source, rows)
+        yield rows
+
+
+async def single_page(fetch):
+    """Present a whole remote result as one page for the paginated code paths."""
+    jobs = await fetch()
+    if jobs:
+        yield jobs
+
+
+def linkedin_pages(title):
+    """LinkedIn results page by page; in queue mode the worker's whole result as one page."""
+    if work_queue is not None:
+        return single_page(lambda: fetch_source("linkedin", title))
+    jobscr.guards["linkedin"].check()
+    return remembered_pages("linkedin", jobscr.iter_linkedin_http(title.skill, title.location, title.pagenumber))
+
+
+def dice_pages(title):
+    """Dice results page by page; in queue mode the worker's whole result as one page."""
+    if work_queue is not None:
+        return single_page(lambda: fetch_source("dice", title))
+    jobscr.guards["dice"].check()
+    return remembered_pages("dice", jobscr.iter_dice_http(title.search_term, title.location))
+
+cache = ResultCache(
+      ttls=config.CACHE_TTLS,
+      stale_ttl=config.CACHE_STALE_TTL,
+      maxsize=config.CACHE_MAXSIZE,
+      redis_url=config.CACHE_REDIS_URL,
+)
+
+prewarmer = Prewarmer(
+      jobscr, cache,
+      top_n=config.PREWARM_TOP_N,
+      interval=config.PREWARM_INTERVAL,
+      jitter=config.PREWARM_JITTER,
+      concurrency=config.PREWARM_CONCURRENCY,
+      min_intervals=config.PREWARM_MIN_INTERVALS,
+      fetch=fetch_source,
+)
+
+federated = FederatedSearch(jobscr, cache, timeouts=config.FEDERATED_TIMEOUTS,
+                            on_query=prewarmer.track, fetch=fetch_source)
+
+# Result sets paged through by cursor; shared through Redis when the cache tier is on
+result_sets = ResultCache(
+      ttls={},
+      default_ttl=config.RESULT_SET_TTL,
+      stale_ttl=0,
+      maxsize=config.RESULT_SET_MAXSIZE,
+      redis_url=config.CACHE_REDIS_URL,
+)
+
+seen = SeenIndex(config.SEEN_DB_PATH)
+
+store = JobStore(config.STORE_PATH)
+
+
+async def cached(source, title, fetch):
+    """Serve a search from the cache and count it towards pre-warming popularity."""
+    prewarmer.track(source, title)
+    return await cache.get_or_fetch(source, title.model_dump(), fetch)
+
+
+async def fetch_delta(source, title, fetch):
+    """Incremental mode: scrape, then return only postings this query has not seen yet."""
+    delta = seen.delta(source, title)
+    jobs = delta.filter(await fetch())
+    delta.commit()
+    return jobs
+
+
+async def collect_delta(source, title, pages):
+    """Incremental mode for paginated sources: only postings not seen yet, from every page needed."""
+    delta = seen.delta(source, title)
+    jobs = []
+    async for batch in delta.pages(pages):
+        jobs.extend(batch)
+    delta.commit()
+    return jobs
+
+
+async def paged(source, title, result):
+    """
+    Answer a /*/get request: the whole raw result as before, or one page of it.
+
+    Sending ``page_size``, ``fields`` or a ``cursor`` switches to paged
+    responses of normalized jobs. The first page keeps the result set
+    server-side, so following pages are served from it by cursor without
+    scraping or re-sorting anything.
+    """
+    page_size = title.page_size or config.PAGE_SIZE_DEFAULT
+    # Paging fields are excluded from model_dump(), so every page of one search shares it
+    query = query_digest(source, title.model_dump())
+    if title.cursor:
+        token, offset = decode_cursor(title.cursor, query)
+        jobs = await result_sets.peek("results", f"jobhub:results:{token}")
+        if jobs is None:
+            raise CursorExpired("This result set expired, start the search again without a cursor")
+        return JobsResponse(page(jobs, token, query, offset, page_size, title.fields))
+
+    raw = await result()
+    if title.page_size is None and title.fields is None:
+        return JobsResponse(raw)
+    if isinstance(raw, dict) and "error" in raw:
+        return JobsResponse(raw)
+    jobs = SOURCES[source].normalizer(raw)
+    token = new_token()
+    if len(jobs) > page_size:
+        await result_sets.store("results", f"jobhub:results:{token}", jobs)
+    return JobsResponse(page(jobs, token, query, 0, page_size, title.fields))
 
 
 logging.basicConfig(level=logging.INFO)
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    response: Response = await call_next(request)
-    logging.info(f"Response Headers: {dict(response.headers)}")
-    return response
+@app.exception_handler(Saturated)
+async def saturated_handler(request: Request, exc: Saturated):
+    return JSONResponse(
+        status_code=503,
+        content={"error": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(CircuitOpen)
+async def circuit_open_handler(request: Request, exc: CircuitOpen):
+    return JSONResponse(
+        status_code=503,
+        content={"error": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(status_code=400, content={"error": str(exc)})
+
+@app.exception_handler(CursorExpired)
+async def cursor_expired_handler(request: Request, exc: CursorExpired):
+    return JSONResponse(status_code=410, content={"error": str(exc)})
+
+@app.exception_handler(QueueTimeout)
+async def queue_timeout_handler(request: Request, exc: QueueTimeout):
+    return JSONResponse(status_code=504, content={"error": str(exc)})
+
+@app.exception_handler(RemoteError)
+async def remote_error_handler(request: Request, exc: RemoteError):
+    return JSONResponse(status_code=502, content={"error": str(exc)})
 
 @app.get("/") 
 async def root():
     return {"message": f"The API is working ! "}
 
+@app.get("/ready")
+async def ready():
+    """Readiness: 200 once the background warm-up finished, 503 while it is still running."""
+    if work_queue is not None:
+        reachable = await work_queue.ping()
+        return JSONResponse(status_code=200 if reachable else 503,
+                            content={"ready": reachable, "mode": "queue"})
+    state = jobscr.warmup["state"]
+    return JSONResponse(
+        status_code=200 if state in ("ready", "failed") else 503,
+        content={"ready": state in ("ready", "failed"), **jobscr.warmup},
+    )
+
+@app.get("/status")
+async def status():
+    return {
+        "http": jobscr.http.status(),
+        "browsers": jobscr.driver_pool.status(),
+        "executor": jobscr.executor.status(),
+        "sources": {name: guard.status() for name, guard in jobscr.guards.items()},
+        "proxies": jobscr.proxies.status(),
+        "cache": {**cache.stats, "entries": len(cache.local), "in_flight": cache.flights.in_flight()},
+        "queue": await work_queue.status() if work_queue is not None else None,
+        "store": await asyncio.to_thread(store.status),
+    }
+
+def pool_gauges():
+    """Utilization of the browser, thread and connection pools for /metrics."""
+    browsers = jobscr.driver_pool.status()
+    for state in ("size", "idle", "in_use"):
+        yield "jobhub_browsers", {"state": state}, browsers[state]
+    executor = jobscr.executor.status()
+    for state in ("max_workers", "running", "queued"):
+        yield "jobhub_executor_tasks", {"state": state}, executor[state]
+    http = jobscr.http.status()
+    for state in ("limit", "in_use", "idle"):
+        yield "jobhub_http_connections", {"state": state}, http[state]
+    for name, guard in jobscr.guards.items():
+        yield "jobhub_source_rate", {"source": name}, guard.limiter.rate
+        yield "jobhub_source_circuit_open", {"source": name}, guard.breaker.state != "closed"
+    yield "jobhub_cache_entries", {}, len(cache.local)
+    yield "jobhub_cache_in_flight", {}, cache.flights.in_flight()
+    for name, count in cache.stats.items():
+        yield "jobhub_cache_lookups", {"result": name}, count
+
+
+metrics.collector(pool_gauges)
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/prewarm/status")
+async def prewarm_status():
+    return await prewarmer.status()
+
 @app.post("/linkdin/get")
-def get_LIposts(title:schemas.userInput):
-    linkdin=jobscr.search_linkedin(title.skill,title.location,title.pagenumber)
+async def get_LIposts(title:schemas.userInput):
+    async def result():
+        if title.incremental:
+            return await collect_delta("linkedin", title, linkedin_pages(title))
+        return await cached("linkedin", title, lambda: fetch_source("linkedin", title))
 
-    return linkdin
+    return await paged("linkedin", title, result)
 
 @app.post("/ziprecuter/get")
-def get_zip(title:schemas.indeedInput):
+async def get_zip(title:schemas.indeedInput):
     site = "zip_recruiter"
-    term = title.search_term
-    google_st = title.google_search_term
-    loc = title.location
-    res = title.results_wanted
-    hr = title.hours_old
-    country = title.country_indeed
-    
-    
-    ziprecuter = jobscr.search_with_jobspy_ziprecuiter(
-        site_name = ["zip_recruiter"],
-        search_term=term,
-        google_search_term=google_st,
-        location=loc,
-        results_wanted=res,
-        hours_old=hr,
-        country=country
-        )
+    fetch = lambda: fetch_source(site, title)
+
+    async def result():
+        if title.incremental:
+            return await fetch_delta(site, title, fetch)
+        return await cached(site, title, fetch)
 
-    return ziprecuter
+    return await paged(site, title, result)
 
 
 
 @app.post('/indeed/get')
-def get_indeed(title:schemas.indeedInput):
+async def get_indeed(title:schemas.indeedInput):
 
     site = "indeed"
-    
-    term = title.search_term
-    google_st = title.google_search_term
-    loc = title.location
-    res = title.results_wanted
-    hr = title.hours_old
-    country = title.country_indeed
-    indeed = jobscr.search_with_jobspy(
-        site_name = site,
-        search_term=term,
-        google_search_term=google_st,
-        location=loc,
-        results_wanted=res,
-        hours_old=hr,
-        country=country
-        )
-    return indeed
+    fetch = lambda: fetch_source(site, title)
+
+    async def result():
+        if title.incremental:
+            return await fetch_delta(site, title, fetch)
+        return await cached(site, title, fetch)
+
+    return await paged(site, title, result)
 
 
 @app.post("/hirebase/get")
 async def search_hirebase(title:schemas.hireBase):
-    term = title.search_term
-    loc = title.location
-    hirebase = await jobscr.search_on_hireBase(search_term=term, location=loc)
-    return hirebase
+    async def result():
+        if not title.incremental:
+            return await cached("hirebase", title, lambda: fetch_source("hirebase", title))
+        data = await fetch_source("hirebase", title)
+        if isinstance(data, list) and data and isinstance(data[0], list):
+            delta = seen.delta("hirebase", title)
+            data = [delta.filter(data[0]), *data[1:]]
+            delta.commit()
+        return data
+
+    return await paged("hirebase", title, result)
 
 @app.post("/dice/get")
-def search_dice(title:schemas.hireBase):
-    term = title.search_term
-    location = title.location
+async def search_dice(title:schemas.hireBase):
+    async def result():
+        if title.incremental:
+            return await collect_delta("dice", title, dice_pages(title))
+        return await cached("dice", title, lambda: fetch_source("dice", title))
 
-    dice = jobscr.search_dice(skill=term, location=location)
-    return dice
\ No newline at end of file
+    return await paged("dice", title, result)
+
+
+@app.post("/search")
+async def search_all(query:schemas.searchInput):
+    return JobsResponse(await federated.search(query))
+
+@app.post("/search/stream")
+async def search_all_stream(query:schemas.searchInput, format:Literal["ndjson", "sse"] = "ndjson"):
+    return stream_response(federated.stream(query), format)
+
+@app.post("/linkdin/stream")
+async def stream_LIposts(title:schemas.userInput, format:Literal["ndjson", "sse"] = "ndjson"):
+    pages = linkedin_pages(title)
+    if title.incremental:
+        pages = seen.delta("linkedin", title).committed_pages(pages)
+    return stream_response(page_events("linkedin", pages), format)
+
+@app.post("/dice/stream")
+async def stream_dice(title:schemas.hireBase, format:Literal["ndjson", "sse"] = "ndjson"):
+    pages = dice_pages(title)
+    if title.incremental:
+        pages = seen.delta("dice", title).committed_pages(pages)
+    return stream_response(page_events("dice", pages), format)
+
+
+@app.post("/jobs/query")
+async def query_jobs(query:schemas.jobQuery):
+    """Answer a search from postings already scraped, without contacting any job board."""
+    with metrics.stage("api", "store_query"):
+        jobs = await asyncio.to_thread(
+            store.query,
+            query.search_term, query.location,
+            max_age_days=query.max_age_days, min_salary=query.min_salary,
+            sources=query.sources, order=query.order, limit=query.limit,
+        )
+    return JobsResponse({"jobs": jobs, "total": len(jobs)})
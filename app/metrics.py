@@ -0,0 +1,193 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('job_scraper')
+
+# Upper bounds in seconds; scrape stages span milliseconds (parse) to minutes (jobspy)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels: Any) -> Labels:
+    return tuple((name, str(value)) for name, value in labels.items())
+
+
+def _format(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = labels + (extra,) if extra else labels
+    if not pairs:
+        return ""
+    body = ",".join('{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"')) for name, value in pairs)
+    return "{" + body + "}"
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """
+    In-process counters and latency histograms in the Prometheus text format.
+
+    Scrape code records per-stage timings (``stage``) and per-source
+    outcomes (``result``) from browser threads and the event loop alike;
+    gauges such as pool utilization are read from collector callbacks
+    only when ``/metrics`` is scraped, so they cost nothing in between.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, Dict[str, Any], float]]]] = []
+
+    def describe(self, name: str, text: str):
+        self._help[name] = text
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any):
+        key = _labels(**labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any):
+        key = _labels(**labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def stage(self, source: str, stage: str):
+        """Time one stage of a scrape (navigate, wait, fetch, parse, postprocess, ...)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("jobhub_stage_seconds", time.perf_counter() - started, source=source, stage=stage)
+
+    def result(self, source: str, outcome: str):
+        """Count a finished scrape: ``success``, ``empty``, ``error`` or ``rejected``."""
+        self.inc("jobhub_scrape_results_total", source=source, outcome=outcome)
+
+    def totals(self, name: str) -> Dict[Labels, Tuple[int, float]]:
+        """Observation count and sum of every series of one histogram."""
+        with self._lock:
+            return {key: (h.count, h.sum) for key, h in self._histograms.get(name, {}).items()}
+
+    def collector(self, fn: Callable[[], Iterable[Tuple[str, Dict[str, Any], float]]]):
+        """Register a callback yielding ``(gauge name, labels, value)`` at scrape time."""
+        self._collectors.append(fn)
+
+    def render(self) -> str:
+        """All series in the Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {
+                name: {key: (list(h.counts), h.sum, h.count) for key, h in series.items()}
+                for name, series in self._histograms.items()
+            }
+
+        for name, series in sorted(counters.items()):
+            header(name, "counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_format(key)} {value:g}")
+
+        for name, series in sorted(histograms.items()):
+            header(name, "histogram")
+            for key, (counts, total, count) in series.items():
+                cumulative = 0
+                for bound, bucket in zip(BUCKETS, counts):
+                    cumulative += bucket
+                    lines.append(f"{name}_bucket{_format(key, ('le', f'{bound:g}'))} {cumulative}")
+                lines.append(f"{name}_bucket{_format(key, ('le', '+Inf'))} {count}")
+                lines.append(f"{name}_sum{_format(key)} {total:.6f}")
+                lines.append(f"{name}_count{_format(key)} {count}")
+
+        gauges: Dict[str, List[str]] = {}
+        for fn in self._collectors:
+            try:
+                for name, labels, value in fn():
+                    gauges.setdefault(name, []).append(f"{name}{_format(_labels(**labels))} {float(value):g}")
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        for name, samples in sorted(gauges.items()):
+            header(name, "gauge")
+            lines.extend(samples)
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+metrics.describe("jobhub_stage_seconds", "Time spent in one stage of a scrape or response")
+metrics.describe("jobhub_scrape_results_total", "Finished scrapes per source and outcome")
+metrics.describe("jobhub_page_fetches_total", "Results pages fetched (made) and next-page checks avoided (saved)")
+metrics.describe("jobhub_http_requests_total", "API requests per handler and status code")
+metrics.describe("jobhub_http_request_seconds", "API request latency per handler, until the last body byte")
+
+
+class MetricsMiddleware:
+    """
+    Count and time API requests at the ASGI level.
+
+    Replaces the header-dumping ``@app.middleware`` logger: it does not
+    wrap responses in Starlette's ``BaseHTTPMiddleware`` machinery and
+    only logs one line per request when ``access_log`` is on. Requests
+    are labelled with the endpoint name, so URLs cannot blow up the
+    number of series.
+    """
+
+    def __init__(self, app, access_log: bool = False):
+        self.app = app
+        self.access_log = access_log
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            endpoint = scope.get("endpoint")
+            handler = getattr(endpoint, "__name__", None) or "unmatched"
+            metrics.inc("jobhub_http_requests_total", handler=handler, method=scope["method"], status=status)
+            metrics.observe("jobhub_http_request_seconds", elapsed, handler=handler)
+            if self.access_log:
+                logger.info(f'{scope["method"]} {scope["path"]} {status} {elapsed * 1000:.0f}ms')
@@ -0,0 +1,45 @@
+import fnmatch
+from typing import Dict, List, Tuple
+
+# URL patterns per resource category, in the wildcard syntax of CDP's
+# Network.setBlockedURLs ("*" matches anything, the whole URL must match)
+CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "images": (
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+        # LinkedIn serves logos without a file extension
+        "*media.licdn.com/*", "*static.licdn.com/aero-v1/sc/h/*",
+    ),
+    "fonts": ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*", "*fonts.googleapis.com*", "*fonts.gstatic.com*"),
+    "media": ("*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"),
+    "styles": ("*.css*",),
+    "scripts": ("*.js", "*.js?*", "*.mjs*"),
+    "trackers": (
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*", "*segment.com*", "*segment.io*",
+        "*newrelic.com*", "*nr-data.net*", "*optimizely.com*", "*adsrvr.org*", "*bat.bing.com*",
+        "*px.ads.linkedin.com*", "*linkedin.com/li/track*", "*quantserve.com*", "*demdex.net*",
+    ),
+}
+
+
+def build_patterns(spec: str) -> List[str]:
+    """
+    Expand a blocking profile into CDP URL patterns.
+
+    ``spec`` is a comma-separated list of category names (see
+    ``CATEGORIES``) and/or raw URL patterns, e.g. "images,fonts,*ads.example.com*".
+    An empty spec blocks nothing.
+    """
+    patterns: List[str] = []
+    for item in (part.strip() for part in spec.split(",")):
+        if not item:
+            continue
+        for pattern in CATEGORIES.get(item, (item,)):
+            if pattern not in patterns:
+                patterns.append(pattern)
+    return patterns
+
+
+def is_blocked(url: str, patterns: List[str]) -> bool:
+    """Whether Chrome would block ``url`` with these patterns."""
+    return any(fnmatch.fnmatchcase(url, pattern) for pattern in patterns)
@@ -0,0 +1,197 @@
+import re
+import logging
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('job_scraper')
+
+# Placeholder strings the scrapers use for missing fields
+MISSING_VALUES = {
+    "", "N/A", "No Company", "No Job Title", "No Link", "No Salary", "No Date",
+    "Not disclosed", "Not specified",
+}
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "trk", "trkinfo", "trackingid", "refid", "ref", "position", "pagenum", "lipi",
+    "src", "source", "from", "campaign", "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid",
+    "sid", "eid", "tk", "searchid", "cmp", "_ga",
+}
+_URL = re.compile(r"^(?:[a-z][a-z0-9+.-]*:)?//(?:www\.|m\.)?([^/?#:]+)(?::\d+)?([^?#]*)(?:\?([^#]*))?", re.IGNORECASE)
+LINKEDIN_JOB = re.compile(r"^/jobs/view/(?:[^/]*-)?(\d+)/?$")
+
+
+def _clean(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if value in MISSING_VALUES else value
+
+
+@dataclass(slots=True)
+class Job:
+    """
+    One job posting in the schema shared by every source.
+
+    Slotted, so large result sets take a fraction of the memory of dicts;
+    orjson serializes it natively, without a conversion pass.
+    """
+
+    source: str
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    url: Optional[str] = None
+    salary: Optional[str] = None
+    post_date: Optional[str] = None
+    logo: Optional[str] = None
+    description: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {name: getattr(self, name) for name in FIELDS}
+
+
+FIELDS = [f.name for f in fields(Job)]
+
+
+def make_job(source: str, title: Any = None, company: Any = None, location: Any = None,
+             url: Any = None, salary: Any = None, post_date: Any = None,
+             logo: Any = None, description: Any = None) -> Job:
+    """Build a job in the normalized schema shared by every source."""
+    return Job(
+        source,
+        _clean(title),
+        _clean(company),
+        _clean(location),
+        _clean(url),
+        _clean(salary),
+        _clean(post_date),
+        _clean(logo),
+        _clean(description),
+    )
+
+
+def from_linkedin(rows: List[List[str]]) -> List[Job]:
+    """LinkedIn rows are [company, job, link, salary, post_date]."""
+    return [
+        make_job("linkedin", company=row[0], title=row[1], url=row[2], salary=row[3], post_date=row[4])
+        for row in rows
+    ]
+
+
+def from_indeed(rows: List[List[Any]]) -> List[Job]:
+    """Indeed rows are [company, title, job_url, date_posted, company_logo, salary_info]."""
+    return [
+        make_job("indeed", company=row[0], title=row[1], url=row[2], post_date=row[3],
+                 logo=row[4], salary=row[5])
+        for row in rows
+    ]
+
+
+def from_zip_recruiter(records: List[Dict[str, Any]]) -> List[Job]:
+    return [
+        make_job("zip_recruiter", company=r.get("company"), title=r.get("title"),
+                 url=r.get("job_url"), post_date=r.get("date_posted"),
+                 location=r.get("location"), salary=r.get("salary_info"),
+                 description=r.get("description"))
+        for r in records
+    ]
+
+
+def from_dice(records: List[Dict[str, str]]) -> List[Job]:
+    return [
+        make_job("dice", company=r.get("company"), title=r.get("title"), url=r.get("url"),
+                 location=r.get("location"), post_date=r.get("post_date"),
+                 salary=r.get("salary"))
+        for r in records
+    ]
+
+
+def _hirebase_location(item: Dict[str, Any]) -> Optional[str]:
+    locations = item.get("locations") or []
+    if not locations or not isinstance(locations[0], dict):
+        return None
+    loc = locations[0]
+    parts = [loc.get("city"), loc.get("region"), loc.get("country")]
+    return ", ".join(p for p in parts if p) or None
+
+
+def _hirebase_salary(item: Dict[str, Any]) -> Optional[str]:
+    salary = item.get("salary_range")
+    if not isinstance(salary, dict) or not (salary.get("min") and salary.get("max")):
+        return None
+    currency = salary.get("currency") or "USD"
+    period = salary.get("period") or "year"
+    return f"{salary['min']}-{salary['max']} {currency} per {period}"
+
+
+def from_hirebase(data: Any) -> List[Job]:
+    """HireBase returns a nested array whose first element is the list of jobs."""
+    if isinstance(data, dict):
+        if "error" in data:
+            logger.warning(f"HireBase returned an error: {data['error']}")
+        return []
+    if not data or not isinstance(data[0], list):
+        return []
+    return [
+        make_job("hirebase", title=item.get("job_title"), company=item.get("company_name"),
+                 location=_hirebase_location(item), url=item.get("application_link"),
+                 salary=_hirebase_salary(item), post_date=item.get("date_posted"),
+                 logo=item.get("company_logo"), description=item.get("requirements_summary"))
+        for item in data[0]
+        if isinstance(item, dict)
+    ]
+
+
+def canonical_url(url: Optional[str]) -> Optional[str]:
+    """
+    Strip a job URL down to what identifies the posting.
+
+    Lowercases the host, drops ``www.``/country subdomains of LinkedIn,
+    fragments and tracking parameters, and reduces LinkedIn job pages to
+    their numeric ID, so the same posting found twice compares equal.
+    """
+    if not url:
+        return None
+    match = _URL.match(url.strip())
+    if not match:
+        return url.strip().lower()
+    host, path, query = match.groups()
+    host = host.lower()
+    path = path.rstrip("/") or "/"
+    if host.endswith("linkedin.com"):
+        host = "linkedin.com"
+        job = LINKEDIN_JOB.match(path)
+        if job:
+            return f"https://linkedin.com/jobs/view/{job.group(1)}"
+    if query:
+        params = sorted(param for param in query.split("&")
+                        if param and not _is_tracking(param.split("=", 1)[0].lower()))
+        query = "&".join(params)
+    return f"https://{host}{path}?{query}" if query else f"https://{host}{path}"
+
+
+def _is_tracking(name: str) -> bool:
+    return name in TRACKING_PARAMS or name.startswith("utm_")
+
+
+def dedupe_key(job: Job) -> str:
+    """Jobs are identical if they share a canonical URL, otherwise company + title + location."""
+    url = canonical_url(job.url)
+    if url:
+        return url
+    return "|".join((value or "").lower() for value in (job.company, job.title, job.location))
+
+
+NORMALIZERS = {
+    "linkedin": from_linkedin,
+    "indeed": from_indeed,
+    "zip_recruiter": from_zip_recruiter,
+    "dice": from_dice,
+    "hirebase": lambda items: from_hirebase([items]),
+}
+
+
+def job_id(source: str, item: Any) -> str:
+    """Stable ID of one raw scraper result (a LinkedIn/Indeed row or a ZipRecruiter/Dice/HireBase dict)."""
+    return dedupe_key(NORMALIZERS[source]([item])[0])
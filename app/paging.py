@@ -0,0 +1,85 @@
+import base64
+import secrets
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cache import make_key
+from .normalize import Job
+
+
+class InvalidCursor(ValueError):
+    """The cursor was not issued by this API."""
+
+
+class CursorExpired(Exception):
+    """The result set a cursor points into is no longer kept."""
+
+
+def new_token() -> str:
+    return secrets.token_urlsafe(12)
+
+
+def query_digest(source: str, params: Dict[str, Any]) -> str:
+    """Short fingerprint of the search a cursor is issued for."""
+    return make_key(source, params).rsplit(":", 1)[-1][:16]
+
+
+def encode_cursor(token: str, query: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{token}:{query}:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, query: str) -> Tuple[str, int]:
+    """
+    Split a cursor into its result set token and offset.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or was issued for a different search
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        token, issued_for, offset = raw.split(":")
+        offset = int(offset)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursor("Malformed cursor")
+    if not token or offset < 0:
+        raise InvalidCursor("Malformed cursor")
+    if issued_for != query:
+        raise InvalidCursor("This cursor belongs to a different search")
+    return token, offset
+
+
+def _as_job(item: Any) -> Job:
+    # Result sets read back from Redis are plain dicts
+    return item if isinstance(item, Job) else Job(**item)
+
+
+def page(jobs: Sequence[Any], token: str, query: str, offset: int, page_size: int,
+         fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    One page of a result set.
+
+    Args:
+        jobs: The whole result set, normalized
+        token: The result set's token, for the next cursor
+        query: The search's ``query_digest``, for the next cursor
+        offset: Index of the first job on the page
+        page_size: Jobs per page
+        fields: Job fields to include; all of them if omitted
+
+    Returns:
+        ``jobs``, the ``total`` size of the result set and ``next_cursor``
+        (None on the last page)
+
+    Raises:
+        InvalidCursor: If ``offset`` is past the end of the result set
+    """
+    if offset > len(jobs):
+        raise InvalidCursor("Cursor points past the end of the results")
+    chunk = [_as_job(job) for job in jobs[offset:offset + page_size]]
+    if fields:
+        chunk = [{name: getattr(job, name) for name in fields} for job in chunk]
+    end = offset + page_size
+    return {
+        "jobs": chunk,
+        "total": len(jobs),
+        "next_cursor": encode_cursor(token, query, end) if end < len(jobs) else None,
+    }
@@ -0,0 +1,193 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
+
+logger = logging.getLogger('job_scraper')
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one class token, like the CSS selector ``.name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class Field:
+    """One value extracted from a card: the text of the first match, or an attribute."""
+
+    def __init__(self, xpath: str, attr: Optional[str] = None, default: str = ""):
+        self.xpath = xpath
+        self.attr = attr
+        self.default = default
+
+
+class LxmlExtractor:
+    """
+    Extract job cards with precompiled XPath expressions.
+
+    The document is parsed once by libxml2 and only the card subtrees are
+    visited. Compiled expressions are kept per thread because lxml's XPath
+    objects must not be shared between threads.
+    """
+
+    def __init__(self, card_xpath: str, fields: Dict[str, Field]):
+        self.card_xpath = card_xpath
+        self.fields = fields
+        self._local = threading.local()
+
+    def _compiled(self):
+        compiled = getattr(self._local, "compiled", None)
+        if compiled is None:
+            compiled = (
+                etree.XPath(self.card_xpath),
+                [(name, etree.XPath(field.xpath), field) for name, field in self.fields.items()],
+            )
+            self._local.compiled = compiled
+        return compiled
+
+    @staticmethod
+    def _text(element: Any) -> str:
+        # Same result as BeautifulSoup's get_text(strip=True)
+        return "".join(part.strip() for part in element.itertext())
+
+    def parse(self, html: str) -> List[Dict[str, str]]:
+        if not html or not html.strip():
+            return []
+        cards_xpath, field_xpaths = self._compiled()
+        document = lxml_html.document_fromstring(html)
+
+        results = []
+        for card in cards_xpath(document):
+            item = {}
+            for name, xpath, field in field_xpaths:
+                matches = xpath(card)
+                value = None
+                if matches:
+                    if field.attr:
+                        value = matches[0].get(field.attr)
+                    else:
+                        value = self._text(matches[0])
+                item[name] = value if value is not None else field.default
+            results.append(item)
+        return results
+
+
+class SoupExtractor:
+    """
+    Extract job cards with BeautifulSoup.
+
+    A SoupStrainer limits the parse tree to the card elements, then
+    ``parse_card`` pulls the fields out of each card.
+    """
+
+    def __init__(self, strainer: SoupStrainer, parse_card: Callable[[Any], Dict[str, str]],
+                 features: str = "html.parser"):
+        self.strainer = strainer
+        self.parse_card = parse_card
+        self.features = features
+
+    def parse(self, html: str) -> List[Dict[str, str]]:
+        soup = BeautifulSoup(html, self.features, parse_only=self.strainer)
+        results = []
+        # With parse_only, the matched cards are the top-level elements of the tree
+        for card in soup.find_all(self.strainer.name, recursive=False):
+            try:
+                results.append(self.parse_card(card))
+            except Exception as e:
+                logger.warning(f"Error parsing job card: {str(e)}")
+        return results
+
+
+def _soup_text(card: Any, *args, **kwargs) -> Optional[str]:
+    elem = card.find(*args, **kwargs)
+    return elem.get_text(strip=True) if elem else None
+
+
+LINKEDIN_DEFAULTS = {
+    'company': 'No Company',
+    'job': 'No Job Title',
+    'link': 'No Link',
+    'salary': 'No Salary',
+    'post_date': 'No Date',
+}
+
+DICE_DEFAULTS = {
+    'company': 'N/A',
+    'title': 'N/A',
+    'url': 'N/A',
+    'location': 'N/A',
+    'post_date': 'N/A',
+    'employment_type': 'Not specified',
+    'salary': 'Not disclosed',
+}
+
+
+def _linkedin_card(item: Any) -> Dict[str, str]:
+    link_elem = item.find('a', class_='base-card__full-link')
+    values = {
+        'job': _soup_text(item, 'h3', class_='base-search-card__title'),
+        'company': _soup_text(item, 'h4', class_='base-search-card__subtitle'),
+        'link': link_elem['href'] if link_elem and link_elem.has_attr('href') else None,
+        'salary': _soup_text(item, 'div', class_='job-salary'),
+        'post_date': _soup_text(item, 'time', class_=lambda c: c and 'job-search-card__listdate' in c),
+    }
+    return {name: values[name] if values[name] is not None else default
+            for name, default in LINKEDIN_DEFAULTS.items()}
+
+
+def _dice_card(card: Any) -> Dict[str, str]:
+    title_elem = card.find('a', {'data-cy': 'card-title-link'})
+    values = {
+        'company': _soup_text(card, 'a', {'data-cy': 'search-result-company-name'}),
+        'title': title_elem.get_text(strip=True) if title_elem else None,
+        'url': title_elem['href'] if title_elem and title_elem.has_attr('href') else None,
+        'location': _soup_text(card, 'span', {'data-cy': 'search-result-location'}),
+        'post_date': _soup_text(card, 'span', class_='posted-date'),
+        'employment_type': _soup_text(card, 'span', {'data-cy': 'search-result-employment-type'}),
+        'salary': _soup_text(card, 'span', {'data-cy': 'compensationText'}),
+    }
+    return {name: values[name] if values[name] is not None else default
+            for name, default in DICE_DEFAULTS.items()}
+
+
+PARSERS: Dict[str, Dict[str, Any]] = {
+    "linkedin": {
+        "lxml": LxmlExtractor("//body//li", {
+            'company': Field(f".//h4[{_has_class('base-search-card__subtitle')}]", default=LINKEDIN_DEFAULTS['company']),
+            'job': Field(f".//h3[{_has_class('base-search-card__title')}]", default=LINKEDIN_DEFAULTS['job']),
+            'link': Field(f".//a[{_has_class('base-card__full-link')}][@href]", attr="href", default=LINKEDIN_DEFAULTS['link']),
+            'salary': Field(f".//div[{_has_class('job-salary')}]", default=LINKEDIN_DEFAULTS['salary']),
+            'post_date': Field(".//time[contains(@class, 'job-search-card__listdate')]", default=LINKEDIN_DEFAULTS['post_date']),
+        }),
+        "soup": SoupExtractor(SoupStrainer('li'), _linkedin_card),
+    },
+    "dice": {
+        "lxml": LxmlExtractor(f"//div[{_has_class('card')} and {_has_class('search-card')}]", {
+            'company': Field(".//a[@data-cy='search-result-company-name']", default=DICE_DEFAULTS['company']),
+            'title': Field(".//a[@data-cy='card-title-link']", default=DICE_DEFAULTS['title']),
+            'url': Field(".//a[@data-cy='card-title-link'][@href]", attr="href", default=DICE_DEFAULTS['url']),
+            'location': Field(".//span[@data-cy='search-result-location']", default=DICE_DEFAULTS['location']),
+            'post_date': Field(f".//span[{_has_class('posted-date')}]", default=DICE_DEFAULTS['post_date']),
+            'employment_type': Field(".//span[@data-cy='search-result-employment-type']", default=DICE_DEFAULTS['employment_type']),
+            'salary': Field(".//span[@data-cy='compensationText']", default=DICE_DEFAULTS['salary']),
+        }),
+        # While straining, class is still the raw attribute string, so split it here
+        "soup": SoupExtractor(SoupStrainer('div', class_=lambda c: c and 'search-card' in c.split()), _dice_card),
+    },
+}
+
+
+def get_parser(source: str, engine: str = "lxml"):
+    """
+    Return the card extractor for a source.
+
+    Args:
+        source: "linkedin" or "dice"
+        engine: "lxml" (compiled XPath) or "soup" (BeautifulSoup with a SoupStrainer)
+    """
+    try:
+        return PARSERS[source][engine]
+    except KeyError:
+        raise ValueError(f"No {engine!r} parser for {source!r}")
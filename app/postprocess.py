@@ -0,0 +1,74 @@
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('job_scraper')
+
+# Typed salary columns added to every jobspy result
+SALARY_COLUMNS = ["salary_min", "salary_max", "salary_currency", "salary_interval"]
+
+
+def _numeric(jobs: pd.DataFrame, column: str) -> pd.Series:
+    if column not in jobs.columns:
+        return pd.Series(np.nan, index=jobs.index, dtype="float64")
+    return pd.to_numeric(jobs[column], errors="coerce")
+
+
+def _text(jobs: pd.DataFrame, column: str) -> pd.Series:
+    if column not in jobs.columns:
+        return pd.Series(None, index=jobs.index, dtype="object")
+    series = jobs[column]
+    return series.where(series.notna(), None)
+
+
+def add_salary_columns(jobs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add typed salary columns and the ``salary_info`` display string, column-wise.
+
+    ``salary_min``/``salary_max`` are floats (NaN when unknown),
+    ``salary_currency``/``salary_interval`` are strings or None, and
+    ``salary_info`` reads like "90000-120000 USD" or "Not disclosed".
+
+    Args:
+        jobs: A jobspy result frame
+
+    Returns:
+        The same frame with the salary columns added
+    """
+    salary_min = _numeric(jobs, "min_amount")
+    salary_max = _numeric(jobs, "max_amount")
+    currency = _text(jobs, "currency")
+
+    jobs["salary_min"] = salary_min
+    jobs["salary_max"] = salary_max
+    jobs["salary_currency"] = currency
+    jobs["salary_interval"] = _text(jobs, "interval")
+
+    disclosed = (salary_min.fillna(0) > 0) | (salary_max.fillna(0) > 0)
+    low = salary_min.fillna(0).round().astype("int64").astype(str)
+    high = salary_max.fillna(0).round().astype("int64").astype(str)
+    info = (low + "-" + high + " " + currency.fillna("").astype(str)).str.rstrip()
+    jobs["salary_info"] = info.where(disclosed, "Not disclosed")
+    return jobs
+
+
+def select_columns(jobs: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Select the output columns and turn every missing value into None in one pass.
+
+    Columns missing from the scrape are filled with None.
+    """
+    frame = jobs.reindex(columns=columns).astype(object)
+    return frame.where(frame.notna(), None)
+
+
+def to_rows(jobs: pd.DataFrame, columns: List[str]) -> List[List[Any]]:
+    """Post-process a jobspy frame into positional rows."""
+    return select_columns(add_salary_columns(jobs), columns).values.tolist()
+
+
+def to_records(jobs: pd.DataFrame, columns: List[str]) -> List[Dict[str, Any]]:
+    """Post-process a jobspy frame into a list of dicts."""
+    return select_columns(add_salary_columns(jobs), columns).to_dict(orient='records')
@@ -0,0 +1,200 @@
+import time
+import random
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .cache import ResultCache, make_key
+from .executor import Saturated
+from .federated import SOURCES, Fetcher, local_fetcher
+from .jobs import JobScraper
+from .ratelimit import CircuitOpen
+
+logger = logging.getLogger('job_scraper')
+
+
+class TrackedQuery:
+    """Popularity and refresh bookkeeping for one (source, request) pair."""
+
+    def __init__(self, source: str, title: BaseModel):
+        self.source = source
+        self.title = title
+        self.score = 0.0
+        self.requests = 0
+        self.last_seen = time.time()
+        self.last_refresh: Optional[float] = None
+        self.last_status: Optional[str] = None
+        self.queued = False
+
+    def hit(self, half_life: float):
+        # Exponentially decayed request count, so yesterday's trend fades out
+        now = time.time()
+        self.score = self.score * 0.5 ** ((now - self.last_seen) / half_life) + 1
+        self.last_seen = now
+        self.requests += 1
+
+    def current_score(self, half_life: float) -> float:
+        return self.score * 0.5 ** ((time.time() - self.last_seen) / half_life)
+
+
+class Prewarmer:
+    """
+    Keep the most popular searches of every source warm in the cache.
+
+    Incoming requests are tracked with a decaying popularity score. Every
+    ``interval`` seconds (plus jitter) the top ``top_n`` queries per source
+    whose cached result is missing or close to expiry are queued, and
+    ``concurrency`` workers re-scrape them, spacing scrapes of the same
+    source by at least that source's minimum interval.
+    """
+
+    def __init__(self, scraper: JobScraper, cache: ResultCache, top_n: int = 5,
+                 interval: float = 300.0, jitter: float = 30.0, concurrency: int = 2,
+                 refresh_at: float = 0.8, half_life: float = 3600.0,
+                 min_intervals: Optional[Dict[str, float]] = None, max_tracked: int = 1000,
+                 fetch: Optional[Fetcher] = None):
+        self.scraper = scraper
+        self.fetch = fetch or local_fetcher(scraper)
+        self.cache = cache
+        self.top_n = top_n
+        self.interval = interval
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.refresh_at = refresh_at
+        self.half_life = half_life
+        self.min_intervals = min_intervals or {}
+        self.max_tracked = max_tracked
+
+        self.queries: Dict[str, TrackedQuery] = {}
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._last_scrape: Dict[str, float] = {}
+        self._source_locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: List[asyncio.Task] = []
+        self.last_cycle: Optional[float] = None
+
+    def track(self, source: str, title: BaseModel):
+        """Record one incoming request for a search."""
+        if source not in SOURCES:
+            return
+        key = make_key(source, title.model_dump())
+        query = self.queries.get(key)
+        if query is None:
+            if len(self.queries) >= self.max_tracked:
+                self._evict()
+            query = self.queries[key] = TrackedQuery(source, title)
+        query.hit(self.half_life)
+
+    def _evict(self):
+        coldest = min(self.queries, key=lambda k: self.queries[k].current_score(self.half_life))
+        del self.queries[coldest]
+
+    def top(self) -> List[Tuple[str, TrackedQuery]]:
+        """The top-N tracked queries of every source, most popular first."""
+        ranked = sorted(self.queries.items(), key=lambda kv: kv[1].current_score(self.half_life), reverse=True)
+        per_source: Dict[str, int] = {}
+        selected = []
+        for key, query in ranked:
+            if per_source.get(query.source, 0) < self.top_n:
+                per_source[query.source] = per_source.get(query.source, 0) + 1
+                selected.append((key, query))
+        return selected
+
+    async def schedule(self) -> int:
+        """Queue every top query whose cached result is missing or about to expire."""
+        queued = 0
+        for key, query in self.top():
+            if query.queued:
+                continue
+            age = await self.cache.age(query.source, query.title.model_dump())
+            if age is not None and age < self.cache.ttl_for(query.source) * self.refresh_at:
+                continue
+            query.queued = True
+            self._queue.put_nowait(key)
+            queued += 1
+        self.last_cycle = time.time()
+        return queued
+
+    async def _wait_for_source(self, source: str):
+        lock = self._source_locks.setdefault(source, asyncio.Lock())
+        async with lock:
+            wait = self._last_scrape.get(source, 0) + self.min_intervals.get(source, 0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_scrape[source] = time.monotonic()
+
+    async def _refresh(self, key: str):
+        query = self.queries.get(key)
+        if query is None:
+            return
+        try:
+            await self._wait_for_source(query.source)
+            await self.cache.refresh(query.source, query.title.model_dump(),
+                                     lambda: self.fetch(query.source, query.title))
+            query.last_status = "ok"
+        except (Saturated, CircuitOpen):
+            # User traffic has priority and blocked boards get a rest; try again next cycle
+            query.last_status = "skipped"
+        except Exception as e:
+            logger.warning(f"Prewarming {query.source} failed: {e}")
+            query.last_status = "error"
+        finally:
+            query.last_refresh = time.time()
+            query.queued = False
+
+    async def _worker(self):
+        while True:
+            key = await self._queue.get()
+            try:
+                await self._refresh(key)
+            finally:
+                self._queue.task_done()
+
+    async def _scheduler(self):
+        while True:
+            await asyncio.sleep(self.interval + random.uniform(0, self.jitter))
+            try:
+                queued = await self.schedule()
+                if queued:
+                    logger.info(f"Prewarming {queued} popular searches")
+            except Exception as e:
+                logger.error(f"Prewarm scheduling failed: {e}")
+
+    def start(self):
+        """Start the scheduler and its workers on the running event loop."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._scheduler())]
+        self._tasks += [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def status(self) -> Dict[str, Any]:
+        """Queue length and popularity/freshness of every top query."""
+        keys = []
+        for key, query in self.top():
+            age = await self.cache.age(query.source, query.title.model_dump())
+            keys.append({
+                "key": key,
+                "source": query.source,
+                "params": query.title.model_dump(),
+                "score": round(query.current_score(self.half_life), 3),
+                "requests": query.requests,
+                "age": None if age is None else round(age, 1),
+                "fresh": age is not None and age < self.cache.ttl_for(query.source),
+                "queued": query.queued,
+                "last_refresh": query.last_refresh,
+                "last_status": query.last_status,
+            })
+        return {
+            "running": bool(self._tasks),
+            "queue": self._queue.qsize(),
+            "tracked": len(self.queries),
+            "last_cycle": self.last_cycle,
+            "keys": keys,
+        }
@@ -0,0 +1,159 @@
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger('job_scraper')
+
+
+def _normalize(url: str) -> str:
+    url = url.strip()
+    return url if "://" in url else f"http://{url}"
+
+
+class Proxy:
+    """Health bookkeeping for one outbound proxy."""
+
+    def __init__(self, url: str):
+        self.url = _normalize(url)
+        self.in_use = 0
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency: Optional[float] = None
+        self.cooldown_until = 0.0
+        self.strikes = 0
+
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def score(self) -> float:
+        """Higher is better: smoothed success rate over latency."""
+        success_rate = (self.successes + 1) / (self.successes + self.failures + 2)
+        return success_rate / (1 + (self.latency or 1.0))
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "in_use": self.in_use,
+            "successes": self.successes,
+            "failures": self.failures,
+            "latency": None if self.latency is None else round(self.latency, 3),
+            "score": round(self.score(), 4),
+            "cooling_down": self.cooling_down(),
+        }
+
+
+class ProxyPool:
+    """
+    Rotate requests over a list of proxies, preferring healthy ones.
+
+    Every use reports success or failure and latency back to the pool.
+    ``strategy`` picks the next proxy: "best" takes the highest score
+    (success rate over latency, discounted by current load),
+    "least_loaded" the one with the fewest requests in flight. After
+    ``max_failures`` consecutive failures a proxy sits out ``cooldown``
+    seconds, doubled on every repeat. With no proxy available ``acquire``
+    returns None and the caller connects directly.
+    """
+
+    def __init__(self, urls: Iterable[str], strategy: str = "best",
+                 max_failures: int = 3, cooldown: float = 120.0):
+        if strategy not in ("best", "least_loaded"):
+            raise ValueError(f"Unknown proxy strategy {strategy!r}")
+        self.proxies: List[Proxy] = [Proxy(url) for url in dict.fromkeys(u for u in urls if u.strip())]
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.stats = {"acquired": 0, "direct": 0}
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def acquire(self, exclude: Iterable[Proxy] = ()) -> Optional[Proxy]:
+        """Reserve the next proxy, skipping ``exclude``, or None to connect directly."""
+        if not self.proxies:
+            return None
+        with self._lock:
+            candidates = [p for p in self.proxies if not p.cooling_down() and p not in exclude]
+            if not candidates:
+                self.stats["direct"] += 1
+                logger.warning("No healthy proxy available, connecting directly")
+                return None
+            if self.strategy == "least_loaded":
+                proxy = min(candidates, key=lambda p: (p.in_use, -p.score()))
+            else:
+                proxy = max(candidates, key=lambda p: p.score() / (1 + p.in_use))
+            proxy.in_use += 1
+            self.stats["acquired"] += 1
+            return proxy
+
+    def record(self, proxy: Optional[Proxy], ok: bool, latency: Optional[float] = None):
+        """Report the outcome of one request made through a proxy."""
+        if proxy is None:
+            return
+        with self._lock:
+            if ok:
+                proxy.successes += 1
+                proxy.consecutive_failures = 0
+                proxy.strikes = 0
+                if latency is not None:
+                    # Exponential moving average, so one slow response does not bury a proxy
+                    proxy.latency = latency if proxy.latency is None else 0.7 * proxy.latency + 0.3 * latency
+                return
+            proxy.failures += 1
+            proxy.consecutive_failures += 1
+            if proxy.consecutive_failures >= self.max_failures:
+                proxy.strikes += 1
+                proxy.consecutive_failures = 0
+                pause = self.cooldown * 2 ** min(proxy.strikes - 1, 4)
+                proxy.cooldown_until = time.monotonic() + pause
+                logger.warning(f"Proxy {proxy.url} failed {self.max_failures} times, cooling down for {pause:.0f}s")
+
+    def release(self, proxy: Optional[Proxy], ok: Optional[bool] = None, latency: Optional[float] = None):
+        """Give a reserved proxy back, optionally recording the outcome."""
+        if proxy is None:
+            return
+        if ok is not None:
+            self.record(proxy, ok, latency)
+        with self._lock:
+            proxy.in_use -= 1
+
+    @contextmanager
+    def use(self, exclude: Iterable[Proxy] = ()):
+        """
+        Reserve a proxy for one request.
+
+        Yields the proxy (or None); an exception counts as a failure,
+        otherwise the caller reports the outcome with ``record``.
+        """
+        proxy = self.acquire(exclude)
+        try:
+            yield proxy
+        except Exception:
+            self.record(proxy, False)
+            raise
+        finally:
+            self.release(proxy)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "strategy": self.strategy,
+                "proxies": [p.status() for p in self.proxies],
+                **self.stats,
+            }
+
+
+def load_proxies(urls: str, path: Optional[str] = None) -> List[str]:
+    """Read proxies from a comma-separated setting and an optional file with one per line."""
+    proxies = [url.strip() for url in urls.split(",") if url.strip()]
+    if path:
+        try:
+            with open(path) as f:
+                proxies += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        except OSError as e:
+            logger.error(f"Could not read proxy file {path}: {e}")
+    return proxies
@@ -0,0 +1,231 @@
+import time
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger('job_scraper')
+
+# Statuses job boards answer with when they want us to slow down
+THROTTLE_STATUSES = (403, 429, 999)
+
+
+class CircuitOpen(Exception):
+    """Raised instead of scraping a source that is currently blocking us."""
+
+    def __init__(self, source: str, retry_after: float):
+        self.source = source
+        self.retry_after = max(1, round(retry_after))
+        super().__init__(f"{source} is blocking requests, retry in {self.retry_after}s")
+
+
+class AdaptiveRateLimiter:
+    """
+    A token bucket whose rate adapts to how the board responds (AIMD).
+
+    Every success raises the rate by ``increase`` requests/s up to
+    ``max_rate``; a throttling signal (429, challenge page) halves it, and
+    slow responses shave it down, never below ``min_rate``. Tokens are
+    reserved under a lock and the caller sleeps outside it, so the limiter
+    can be shared by browser threads and the event loop.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, min_rate: float = 0.05,
+                 max_rate: Optional[float] = None, increase: float = 0.05,
+                 slow_latency: float = 8.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate * 4
+        self.increase = increase
+        self.slow_latency = slow_latency
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self, latency: Optional[float] = None):
+        with self._lock:
+            if latency is not None and latency > self.slow_latency:
+                self.rate = max(self.min_rate, self.rate * 0.8)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttled(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            # Drop any saved-up burst so the slowdown applies immediately
+            self._tokens = min(self._tokens, 0.0)
+
+
+class CircuitBreaker:
+    """
+    Stop calling a source after repeated failures.
+
+    After ``threshold`` consecutive failures the circuit opens and calls
+    fail immediately for ``reset_timeout`` seconds. Then one probe call is
+    let through (half-open); its outcome closes or re-opens the circuit.
+    ``check`` only looks at the state, so a scrape can fail fast up front
+    and still send the probe from its first ``allow``.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 60.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = "closed"
+        self._opened_at = 0.0
+        # When the half-open probe was let through; None while no probe is out
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _blocked_for(self, now: float) -> float:
+        """Seconds until a call may go through, 0 if one may go now."""
+        if self.state == "closed":
+            return 0.0
+        if self.state == "open":
+            return max(0.0, self._opened_at + self.reset_timeout - now)
+        # Half-open: a probe that never reported back does not block forever
+        if self._probe_started is None:
+            return 0.0
+        return max(0.0, self._probe_started + self.reset_timeout - now)
+
+    def check(self, source: str):
+        """
+        Raises:
+            CircuitOpen: If a call would be refused right now; never claims the probe
+        """
+        with self._lock:
+            remaining = self._blocked_for(time.monotonic())
+        if remaining > 0:
+            raise CircuitOpen(source, max(remaining, 1))
+
+    def allow(self, source: str):
+        """
+        Admit one call; in the half-open state only the probe is admitted.
+
+        Raises:
+            CircuitOpen: If the circuit is open, or half-open with a probe already running
+        """
+        with self._lock:
+            if self.state == "closed":
+                return
+            now = time.monotonic()
+            remaining = self._blocked_for(now)
+            if remaining > 0:
+                raise CircuitOpen(source, max(remaining, 1))
+            self.state = "half_open"
+            self._probe_started = now
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = "closed"
+            self._probe_started = None
+
+    def record_failure(self, source: str):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.threshold:
+                if self.state != "open":
+                    logger.warning(f"Circuit for {source} opened after {self.failures} failures")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probe_started = None
+
+
+class SourceGuard:
+    """Rate limiter and circuit breaker for one job board."""
+
+    def __init__(self, source: str, limiter: AdaptiveRateLimiter, breaker: CircuitBreaker):
+        self.source = source
+        self.limiter = limiter
+        self.breaker = breaker
+        self.stats = {"success": 0, "throttled": 0, "failure": 0, "rejected": 0}
+
+    def check(self):
+        """
+        Fail fast if the source is currently blocking us.
+
+        Raises:
+            CircuitOpen: If the source's circuit is open
+        """
+        self._admit(self.breaker.check)
+
+    def _admit(self, gate):
+        try:
+            gate(self.source)
+        except CircuitOpen:
+            self.stats["rejected"] += 1
+            raise
+
+    def before(self):
+        """Block until the next request to the source may be sent; claims the half-open probe."""
+        self._admit(self.breaker.allow)
+        self.limiter.acquire()
+
+    async def before_async(self):
+        self._admit(self.breaker.allow)
+        await self.limiter.acquire_async()
+
+    def success(self, latency: Optional[float] = None):
+        self.stats["success"] += 1
+        self.limiter.on_success(latency)
+        self.breaker.record_success()
+
+    def throttled(self):
+        """The board rate-limited us or served a challenge page."""
+        self.stats["throttled"] += 1
+        self.limiter.on_throttled()
+        self.breaker.record_failure(self.source)
+
+    def failure(self):
+        """The board timed out, errored or returned an unusable page."""
+        self.stats["failure"] += 1
+        self.breaker.record_failure(self.source)
+
+    def observe(self, status: int, latency: Optional[float] = None):
+        """Feed back the HTTP status of one response."""
+        if status in THROTTLE_STATUSES:
+            self.throttled()
+        elif status >= 500:
+            self.failure()
+        else:
+            self.success(latency)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.limiter.rate, 3),
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            **self.stats,
+        }
+
+
+def build_guards(rates: Dict[str, float], threshold: int, reset_timeout: float,
+                 bursts: Optional[Dict[str, float]] = None) -> Dict[str, SourceGuard]:
+    """Create one guard per source from requests-per-second settings (and optional burst sizes)."""
+    bursts = bursts or {}
+    return {
+        source: SourceGuard(source, AdaptiveRateLimiter(rate, burst=max(1.0, rate * 2, bursts.get(source, 0))),
+                            CircuitBreaker(threshold, reset_timeout))
+        for source, rate in rates.items()
+    }
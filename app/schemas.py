@@ -1,15 +1,31 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Union
 from typing import Literal
 from typing import Optional
+from typing import List
 
-class userInput(BaseModel):
+from . import config
+
+JobField = Literal["source", "title", "company", "location", "url", "salary", "post_date", "logo", "description"]
+
+
+class pageInput(BaseModel):
+    # Paging and projection are not part of the search, so model_dump() (cache keys,
+    # seen-job keys, queued scrapes) leaves them out; so do incremental and client_id below
+    page_size:Optional[int] = Field(default=None, ge=1, le=config.PAGE_SIZE_MAX, exclude=True)
+    cursor:Optional[str] = Field(default=None, max_length=256, exclude=True)
+    fields:Optional[List[JobField]] = Field(default=None, exclude=True)
+
+
+class userInput(pageInput):
     skill:str
     location:str
     pagenumber:int
+    incremental:bool = Field(default=False, exclude=True)
+    client_id:Optional[str] = Field(default=None, exclude=True)
 
 
-class indeedInput(BaseModel):
+class indeedInput(pageInput):
     #site_name: Union[str, Literal["indeed", "google"]]
     search_term:str
     google_search_term: Optional[str]
@@ -17,8 +33,32 @@ class indeedInput(BaseModel):
     results_wanted:int = 20
     hours_old:int = 12
     country_indeed:str = "usa"
+    incremental:bool = Field(default=False, exclude=True)
+    client_id:Optional[str] = Field(default=None, exclude=True)
 
 
-class hireBase(BaseModel):
+class hireBase(pageInput):
     search_term:str
     location:Optional[str]
+    incremental:bool = Field(default=False, exclude=True)
+    client_id:Optional[str] = Field(default=None, exclude=True)
+
+
+class searchInput(BaseModel):
+    search_term:str
+    location:str
+    sources:Optional[List[Literal["linkedin", "indeed", "zip_recruiter", "hirebase", "dice"]]] = None
+    results_wanted:int = 20
+    hours_old:int = 12
+    country_indeed:str = "usa"
+    rank:bool = True
+
+
+class jobQuery(BaseModel):
+    search_term:Optional[str] = None
+    location:Optional[str] = None
+    max_age_days:Optional[float] = None
+    min_salary:Optional[float] = None
+    sources:Optional[List[Literal["linkedin", "indeed", "zip_recruiter", "hirebase", "dice"]]] = None
+    order:Literal["recent", "relevance"] = "recent"
+    limit:int = 50
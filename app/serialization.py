@@ -0,0 +1,19 @@
+from typing import Any
+
+import orjson
+
+# numpy scalars can still slip through jobspy frames; Job dataclasses and dates are native
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> str:
+    # Same fallback as json.dumps(default=str), e.g. for pandas Timestamps
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize scrape results straight to JSON bytes."""
+    return orjson.dumps(value, default=_default, option=_OPTIONS)
+
+
+loads = orjson.loads
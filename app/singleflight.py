@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger('job_scraper')
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key starts the work as a task; callers that
+    arrive while it is running await the same task instead of starting
+    their own scrape. The task is shielded, so a client that disconnects
+    does not cancel the scrape for everyone else.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"started": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` for the key, or join the run already in flight.
+
+        Args:
+            key: Identifies identical work (e.g. a cache key)
+            fn: Coroutine factory that performs the work
+
+        Returns:
+            The result of the shared run
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["started"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+            logger.info(f"Joining in-flight search {key}")
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,218 @@
+import re
+import time
+import sqlite3
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .dedupe import age_days, annual_salary
+from .normalize import FIELDS, Job, dedupe_key
+
+logger = logging.getLogger('job_scraper')
+
+# Indexed text columns and their bm25 weights: a hit in the title counts most
+TEXT_COLUMNS = ("title", "company", "location", "description")
+BM25_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+MAX_LIMIT = 500
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    {", ".join(f"{name} TEXT" for name in FIELDS)},
+    annual_salary REAL,
+    posted_at REAL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_posted ON jobs (coalesce(posted_at, first_seen));
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    {", ".join(TEXT_COLUMNS)},
+    content='jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, {", ".join(TEXT_COLUMNS)})
+    VALUES (new.id, {", ".join(f"new.{name}" for name in TEXT_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, {", ".join(TEXT_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{name}" for name in TEXT_COLUMNS)});
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs
+WHEN {" OR ".join(f"old.{name} IS NOT new.{name}" for name in TEXT_COLUMNS)} BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, {", ".join(TEXT_COLUMNS)})
+    VALUES ('delete', old.id, {", ".join(f"old.{name}" for name in TEXT_COLUMNS)});
+    INSERT INTO jobs_fts (rowid, {", ".join(TEXT_COLUMNS)})
+    VALUES (new.id, {", ".join(f"new.{name}" for name in TEXT_COLUMNS)});
+END;
+"""
+
+# A re-scraped posting refreshes last_seen and fills fields that were missing
+UPSERT = f"""
+INSERT INTO jobs (job_key, {", ".join(FIELDS)}, annual_salary, posted_at, first_seen, last_seen)
+VALUES ({", ".join("?" * (len(FIELDS) + 5))})
+ON CONFLICT (job_key) DO UPDATE SET
+    {", ".join(f"{name} = coalesce(jobs.{name}, excluded.{name})" for name in FIELDS if name != "source")},
+    annual_salary = coalesce(jobs.annual_salary, excluded.annual_salary),
+    posted_at = coalesce(jobs.posted_at, excluded.posted_at),
+    last_seen = excluded.last_seen
+"""
+
+
+def job_key(job: Job) -> str:
+    """A posting is one row per board: its canonical URL, or company + title + location."""
+    return f"{job.source}:{dedupe_key(job)}"
+
+
+def _match(text: Optional[str], columns: Iterable[str]) -> Optional[str]:
+    """FTS5 query requiring every word of ``text`` as a prefix in one of ``columns``."""
+    words = _TOKEN.findall(text or "")
+    if not words:
+        return None
+    terms = " AND ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+    return "{%s} : (%s)" % (" ".join(columns), terms)
+
+
+class JobStore:
+    """
+    Persistent store of every posting scraped, with a full-text index.
+
+    Backed by SQLite and an FTS5 index over title, company, location and
+    description, so queries are answered from postings other requests
+    already scraped without touching a job board. Like ``SeenIndex``,
+    one connection is shared between threads behind a lock, in WAL mode.
+    Postings not seen again, or posted, within the expiry age are
+    deleted by ``expire``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def add(self, jobs: Iterable[Job]) -> int:
+        """Insert or refresh normalized jobs; returns how many were written."""
+        now = time.time()
+        rows = []
+        for job in jobs:
+            if not (job.title or job.url):
+                continue
+            age = age_days(job.post_date)
+            rows.append((
+                job_key(job), *(getattr(job, name) for name in FIELDS),
+                annual_salary(job.salary),
+                None if age is None else now - age * 86400,
+                now, now,
+            ))
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(UPSERT, rows)
+            self._conn.commit()
+        return len(rows)
+
+    def query(self, text: Optional[str] = None, location: Optional[str] = None,
+              max_age_days: Optional[float] = None, min_salary: Optional[float] = None,
+              sources: Optional[List[str]] = None, order: str = "recent", limit: int = 50) -> List[Job]:
+        """
+        Search stored postings.
+
+        Args:
+            text: Words that must all appear (as prefixes) in the title, company or description
+            location: Words that must all appear in the location
+            max_age_days: Only postings posted (or, with no date, first scraped) this recently
+            min_salary: Only postings whose annualized salary is at least this much
+            sources: Only postings from these boards
+            order: "recent" (newest first) or "relevance" (bm25, title hits first)
+            limit: Maximum number of jobs returned
+
+        Returns:
+            The matching jobs
+        """
+        clauses = [c for c in (_match(text, ("title", "company", "description")),
+                               _match(location, ("location",))) if c]
+        where: List[str] = []
+        params: List[Any] = []
+        relevance = order == "relevance" and clauses
+        if clauses and not relevance:
+            # "+" keeps SQLite from driving the plan off the FTS hits: newest first then
+            # walks the posted index and stops after ``limit`` hits instead of sorting them all
+            where.append("+j.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(" AND ".join(clauses))
+        elif relevance:
+            where.append("jobs_fts MATCH ?")
+            params.append(" AND ".join(clauses))
+        if max_age_days is not None:
+            where.append("coalesce(j.posted_at, j.first_seen) >= ?")
+            params.append(time.time() - max_age_days * 86400)
+        if min_salary is not None:
+            where.append("j.annual_salary >= ?")
+            params.append(min_salary)
+        if sources:
+            where.append(f"j.source IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+
+        if relevance:
+            sql = "SELECT j.* FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid"
+        else:
+            sql = "SELECT j.* FROM jobs j"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if relevance:
+            sql += " ORDER BY bm25(jobs_fts, {})".format(", ".join(map(str, BM25_WEIGHTS)))
+        else:
+            sql += " ORDER BY coalesce(j.posted_at, j.first_seen) DESC"
+        sql += " LIMIT ?"
+        params.append(max(1, min(limit, MAX_LIMIT)))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [Job(*(row[name] for name in FIELDS)) for row in rows]
+
+    def expire(self, max_age: float, batch: int = 1000) -> int:
+        """Delete postings not scraped again, or posted, within the last ``max_age`` seconds."""
+        cutoff = time.time() - max_age
+        expired = 0
+        while True:
+            # In batches, so queries are not locked out while thousands of postings are deleted
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM jobs WHERE id IN (SELECT id FROM jobs WHERE last_seen < ? OR posted_at < ? LIMIT ?)",
+                    (cutoff, cutoff, batch),
+                )
+                self._conn.commit()
+            expired += cursor.rowcount
+            if cursor.rowcount < batch:
+                break
+        if expired:
+            logger.info(f"Expired {expired} postings from the job store")
+        return expired
+
+    async def expire_periodically(self, max_age: float, interval: float):
+        """Run ``expire`` in a thread every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                await asyncio.to_thread(self.expire, max_age)
+            except Exception as e:
+                logger.error(f"Job store expiry failed: {e}")
+            await asyncio.sleep(interval)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            count, oldest = self._conn.execute("SELECT count(*), min(first_seen) FROM jobs").fetchone()
+        return {"jobs": count, "oldest": None if oldest is None else round(time.time() - oldest)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
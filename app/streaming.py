@@ -0,0 +1,64 @@
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from .metrics import metrics
+from .serialization import dumps
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+async def page_events(source: str, pages: AsyncIterator[List[Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Turn a page-by-page job generator into stream events.
+
+    Each page becomes one event and a final ``done`` event carries the total.
+    """
+    total = 0
+    page = 0
+    async for jobs in pages:
+        page += 1
+        total += len(jobs)
+        yield {"source": source, "page": page, "jobs": jobs}
+    yield {"done": True, "source": source, "total": total, "pages": page}
+
+
+class JobsResponse(ORJSONResponse):
+    """
+    A JSON response rendered by orjson.
+
+    Returning it from an endpoint bypasses FastAPI's ``jsonable_encoder``
+    walk, so result lists and ``Job`` records are encoded in one pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with metrics.stage("api", "serialize"):
+            return dumps(content)
+
+
+async def _encode(events: AsyncIterator[Dict[str, Any]], fmt: str) -> AsyncIterator[bytes]:
+    async for event in events:
+        data = dumps(event)
+        if fmt == "sse":
+            name = b"done" if event.get("done") else b"jobs"
+            yield b"event: " + name + b"\ndata: " + data + b"\n\n"
+        else:
+            yield data + b"\n"
+
+
+def stream_response(events: AsyncIterator[Dict[str, Any]], fmt: str = "ndjson") -> StreamingResponse:
+    """
+    Stream events as NDJSON lines or Server-Sent Events.
+
+    Args:
+        events: The events to send, one JSON object each
+        fmt: "ndjson" or "sse"
+
+    Returns:
+        A StreamingResponse that writes each event as soon as it is produced
+    """
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(_encode(events, fmt), media_type=MEDIA_TYPES[fmt], headers=headers)
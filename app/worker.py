@@ -0,0 +1,154 @@
+"""
+Scrape worker for the queue-based deployment mode.
+
+Pulls scrape jobs from the work queue, runs them on this process's
+browsers and executor, and sends the results back to the API process
+that is waiting for them. Start as many as the browser capacity needs:
+
+    JOBHUB_QUEUE_URL=redis://localhost:6379/1 python -m app.worker
+"""
+import time
+import signal
+import asyncio
+import logging
+import argparse
+from typing import Any, Dict, Set
+
+from . import config
+from .cache import make_key
+from .executor import Saturated
+from .federated import SOURCES
+from .jobs import JobScraper
+from .ratelimit import CircuitOpen
+from .singleflight import SingleFlight
+from .workqueue import WorkQueue, worker_id
+
+logger = logging.getLogger('job_scraper')
+
+
+class Worker:
+    """
+    Run queued scrapes, at most ``concurrency`` at a time.
+
+    A job is only popped when a slot is free, so queued work waits in
+    Redis for whichever worker has capacity. Identical jobs in flight on
+    this worker share one scrape.
+    """
+
+    def __init__(self, queue: WorkQueue, scraper: JobScraper, concurrency: int,
+                 heartbeat_interval: float = 10.0):
+        self.queue = queue
+        self.scraper = scraper
+        self.concurrency = concurrency
+        self.heartbeat_interval = heartbeat_interval
+        self.id = worker_id()
+        self.flights = SingleFlight()
+        self.stats = {"done": 0, "failed": 0, "expired": 0}
+        self._slots = asyncio.Semaphore(concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    async def _run(self, job: Dict[str, Any]):
+        try:
+            source = SOURCES[job["source"]]
+            title = source.model(**job["params"])
+            result = await self.flights.do(make_key(source.name, job["params"]),
+                                           lambda: source.fetch(self.scraper, title))
+            await self.queue.reply(job, "ok", result=result)
+            self.stats["done"] += 1
+        except Saturated as e:
+            await self.queue.reply(job, "saturated", error=str(e), retry_after=e.retry_after)
+            self.stats["failed"] += 1
+        except CircuitOpen as e:
+            await self.queue.reply(job, "circuit_open", error=str(e), retry_after=e.retry_after)
+            self.stats["failed"] += 1
+        except Exception as e:
+            logger.error(f"Job {job.get('id')} ({job.get('source')}) failed: {e}")
+            await self.queue.reply(job, "error", error=str(e))
+            self.stats["failed"] += 1
+        finally:
+            self._slots.release()
+
+    async def _heartbeat(self):
+        while not self._stopping.is_set():
+            try:
+                await self.queue.heartbeat(self.id, self.status(), ttl=self.heartbeat_interval * 3)
+            except Exception as e:
+                logger.warning(f"Worker heartbeat failed: {e}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.heartbeat_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "concurrency": self.concurrency,
+            "running": len(self._tasks),
+            "browsers": self.scraper.driver_pool.status(),
+            "at": time.time(),
+            **self.stats,
+        }
+
+    async def serve(self):
+        """Pull and run jobs until ``stop`` is called, then finish the running ones."""
+        heartbeat = asyncio.create_task(self._heartbeat())
+        logger.info(f"Worker {self.id} serving {self.queue.name} with {self.concurrency} slots")
+        try:
+            while not self._stopping.is_set():
+                await self._slots.acquire()
+                try:
+                    job = await self.queue.next_job(timeout=1)
+                except Exception as e:
+                    self._slots.release()
+                    logger.error(f"Reading the work queue failed: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                if job is None:
+                    self._slots.release()
+                    continue
+                if job.get("deadline", 0) < time.time():
+                    # The API process already gave up on this one
+                    self._slots.release()
+                    self.stats["expired"] += 1
+                    continue
+                task = asyncio.create_task(self._run(job))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._stopping.set()
+            await heartbeat
+
+    def stop(self):
+        self._stopping.set()
+
+
+async def main(concurrency: int):
+    if not config.QUEUE_URL:
+        raise SystemExit("JOBHUB_QUEUE_URL is not set")
+    queue = WorkQueue(config.QUEUE_URL, name=config.QUEUE_NAME)
+    scraper = JobScraper()
+    await scraper.http.start()
+    worker = Worker(queue, scraper, concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    warmup = asyncio.create_task(asyncio.to_thread(scraper.warm_up, config.BROWSER_WARM))
+    try:
+        await worker.serve()
+    finally:
+        await asyncio.wait([warmup], timeout=30)
+        await queue.close()
+        await scraper.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JobHub scrape worker")
+    parser.add_argument("--concurrency", type=int, default=config.WORKER_CONCURRENCY,
+                        help="Scrapes run at once by this worker")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1,120 @@
+import math
+import asyncio
+import time
+import uuid
+import socket
+import logging
+from typing import Any, Dict, List, Optional
+
+from .executor import Saturated
+from .ratelimit import CircuitOpen
+from .serialization import dumps, loads
+
+logger = logging.getLogger('job_scraper')
+
+
+class RemoteError(Exception):
+    """A scrape failed on the worker that ran it."""
+
+
+class QueueTimeout(asyncio.TimeoutError):
+    """No worker answered a job in time."""
+
+
+class WorkQueue:
+    """
+    Redis-backed job queue between API front-ends and scrape workers.
+
+    The API side pushes ``{id, source, params, reply, deadline}`` onto a
+    list and blocks on a per-job reply list; workers pop jobs, run them and
+    push the outcome to the reply list. Any number of API processes and
+    workers can share one Redis, so browser capacity scales separately
+    from HTTP capacity.
+    """
+
+    def __init__(self, url: str, name: str = "jobhub:scrape", result_ttl: float = 300.0):
+        import redis.asyncio as redis
+
+        self.name = name
+        self.result_ttl = result_ttl
+        self._client = redis.Redis.from_url(url)
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "timeouts": 0}
+
+    async def submit(self, source: str, params: Dict[str, Any], timeout: float) -> Any:
+        """
+        Enqueue a scrape and wait for a worker's result.
+
+        Raises:
+            QueueTimeout: If no worker answered within ``timeout``
+            Saturated, CircuitOpen: Re-raised from the worker
+            RemoteError: If the scrape failed on the worker
+        """
+        job_id = uuid.uuid4().hex
+        reply = f"{self.name}:reply:{job_id}"
+        job = {"id": job_id, "source": source, "params": params, "reply": reply,
+               "deadline": time.time() + timeout}
+        await self._client.lpush(self.name, dumps(job))
+        self.stats["submitted"] += 1
+
+        popped = await self._client.blpop([reply], timeout=max(1, math.ceil(timeout)))
+        if popped is None:
+            self.stats["timeouts"] += 1
+            raise QueueTimeout(f"No worker answered {source} job {job_id} within {timeout:.0f}s")
+
+        message = loads(popped[1])
+        status = message["status"]
+        if status == "ok":
+            self.stats["completed"] += 1
+            return message["result"]
+        self.stats["failed"] += 1
+        if status == "saturated":
+            raise Saturated("worker", message.get("retry_after") or 5)
+        if status == "circuit_open":
+            raise CircuitOpen(source, message.get("retry_after") or 60)
+        raise RemoteError(message.get("error") or f"{source} scrape failed on a worker")
+
+    async def next_job(self, timeout: float = 5.0) -> Optional[Dict[str, Any]]:
+        """Pop the oldest job, waiting up to ``timeout`` seconds; None if the queue stayed empty."""
+        popped = await self._client.brpop([self.name], timeout=max(1, math.ceil(timeout)))
+        return None if popped is None else loads(popped[1])
+
+    async def reply(self, job: Dict[str, Any], status: str, result: Any = None,
+                    error: Optional[str] = None, retry_after: Optional[int] = None):
+        """Send a job's outcome back to the API process waiting for it."""
+        message = {"status": status, "result": result, "error": error, "retry_after": retry_after}
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.lpush(job["reply"], dumps(message))
+            # Nobody may be waiting any more; do not leave the reply behind forever
+            pipe.expire(job["reply"], max(1, int(self.result_ttl)))
+            await pipe.execute()
+
+    async def heartbeat(self, worker_id: str, status: Dict[str, Any], ttl: float = 30.0):
+        """Announce a live worker and its load; the key expires if the worker dies."""
+        await self._client.set(f"{self.name}:worker:{worker_id}",
+                               dumps(status), ex=max(1, int(ttl)))
+
+    async def status(self) -> Dict[str, Any]:
+        """Queue depth and the last heartbeat of every live worker."""
+        try:
+            depth = await self._client.llen(self.name)
+            workers: List[Dict[str, Any]] = []
+            async for key in self._client.scan_iter(match=f"{self.name}:worker:*"):
+                raw = await self._client.get(key)
+                if raw is not None:
+                    workers.append(loads(raw))
+        except Exception as e:
+            return {"error": str(e), **self.stats}
+        return {"depth": depth, "workers": workers, **self.stats}
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self._client.ping())
+        except Exception:
+            return False
+
+    async def close(self):
+        await self._client.aclose()
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
@@ -0,0 +1,108 @@
+"""
+Measure what request blocking and the page-load strategy save per browser scrape.
+
+Loads the LinkedIn and Dice fixture pages in Chrome from the offline
+stand-in boards, once as the scraper used to (``normal`` load strategy,
+nothing blocked) and once with the configured profile (``eager`` plus
+the per-source blocked URLs), and reports navigation time, bytes and
+requests transferred and the page's JS heap. Without Chrome it only
+prints how many of each fixture's subresources the profiles block.
+
+    python -m benchmarks.bench_browser --runs 5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from lxml import html as lxml_html
+
+from benchmarks.harness import DICE_PAGE, LINKEDIN_PAGE, FixtureBoards, offline_env
+
+# LinkedIn lazy-loads its logos from data-delayed-url
+SUBRESOURCES = "//img/@src | //img/@data-delayed-url | //script/@src | //link[@rel='stylesheet' or @rel='preload']/@href | //source/@src"
+
+
+def static_report(profiles: dict):
+    """Subresources each fixture references, and how many its profile would block."""
+    from app.netfilter import build_patterns, is_blocked
+
+    print("subresources referenced by the fixtures")
+    for source, page in (("linkedin", LINKEDIN_PAGE), ("dice", DICE_PAGE)):
+        urls = [str(url) for url in lxml_html.fromstring(page).xpath(SUBRESOURCES)]
+        patterns = build_patterns(profiles[source])
+        blocked = sum(is_blocked(url, patterns) for url in urls)
+        print(f"  {source:<10}{len(urls):>4} referenced, {blocked:>4} blocked ({profiles[source] or 'nothing'})")
+
+
+def measure(scraper, driver, source: str, url: str, blocked: bool) -> dict:
+    driver.block_urls(scraper.blocked_urls[source] if blocked else ())
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.execute_cdp_cmd("Performance.enable", {})
+    started = time.perf_counter()
+    driver.get(url)
+    elapsed = time.perf_counter() - started
+    transferred = driver.execute_script(
+        "const e = performance.getEntriesByType('resource').concat(performance.getEntriesByType('navigation'));"
+        "return [e.length, e.reduce((n, r) => n + (r.transferSize || 0), 0)];"
+    )
+    heap = {m["name"]: m["value"] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+    return {"ms": elapsed * 1000, "requests": transferred[0], "kib": transferred[1] / 1024,
+            "heap": heap.get("JSHeapUsedSize", 0) / 1024 / 1024}
+
+
+def browser_report(boards: FixtureBoards, runs: int):
+    from app import config
+    from app.jobs import JobScraper
+
+    pages = {
+        "linkedin": f"{boards.url}/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords=engineer&start=0",
+        "dice": f"{boards.url}/jobs?q=engineer",
+    }
+    print()
+    print(f"{'':<20}{'navigate ms':>12}{'requests':>10}{'KiB':>10}{'JS heap MiB':>13}")
+    for label, strategy, blocked in (("before (normal)", "normal", False), ("after (eager+block)", "eager", True)):
+        config.BROWSER_PAGE_LOAD_STRATEGY = strategy
+        scraper = JobScraper(pool_size=1)
+        driver = scraper._create_driver()
+        try:
+            for source, url in pages.items():
+                samples = [measure(scraper, driver, source, url, blocked) for _ in range(runs)]
+                row = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+                print(f"{source + ' ' + label:<20}"[:20] + f"{row['ms']:>12.0f}{row['requests']:>10.0f}"
+                      f"{row['kib']:>10.0f}{row['heap']:>13.1f}")
+        finally:
+            driver.quit()
+            scraper.driver_pool.close()
+
+
+async def run(args):
+    boards = FixtureBoards(latency=args.latency)
+    await boards.start()
+    state = tempfile.TemporaryDirectory()
+    os.environ.update(offline_env(boards.url, state.name))
+    from app import config
+
+    static_report(config.BLOCK_PROFILES)
+    if not Path(config.CHROME_BINARY).exists():
+        print(f"\nChrome not found at {config.CHROME_BINARY}; set JOBHUB_CHROME_BINARY to measure a browser")
+    else:
+        # Selenium blocks, so the stand-in server keeps serving from this loop meanwhile
+        await asyncio.to_thread(browser_report, boards, args.runs)
+    await boards.stop()
+    state.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Seconds the stand-in server waits per response, like a real CDN")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark cross-source deduplication and ranking on large result sets.
+
+Builds postings that reappear on several boards with tracking URLs,
+abbreviated titles and company suffixes, then times ``Deduplicator``
+and ``rank`` over all of them.
+
+    python -m benchmarks.bench_dedupe --jobs 20000
+"""
+import argparse
+import random
+import time
+
+from app import dedupe
+from app.normalize import make_job
+
+ROLES = ["Software Engineer", "Data Engineer", "Backend Developer", "Frontend Developer",
+         "Data Scientist", "DevOps Engineer", "Product Manager", "QA Analyst",
+         "Machine Learning Engineer", "Site Reliability Engineer"]
+LEVELS = ["", "Senior ", "Sr. ", "Junior ", "Staff ", "Lead "]
+TEAMS = ["", " - Payments", " - Platform", " (Remote)", ", Growth"]
+CITIES = ["San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA", "Remote"]
+BOARDS = ["linkedin", "indeed", "zip_recruiter", "dice", "hirebase"]
+
+
+def make_jobs(count: int, seed: int = 0) -> list:
+    """About ``count`` jobs, each unique posting listed on one to three boards."""
+    rng = random.Random(seed)
+    jobs = []
+    posting = 0
+    while len(jobs) < count:
+        posting += 1
+        company = f"Company {rng.randrange(count // 10 or 1)}"
+        title = rng.choice(LEVELS) + rng.choice(ROLES) + rng.choice(TEAMS)
+        city = rng.choice(CITIES)
+        salary = rng.choice([None, f"{rng.randrange(80, 200)}000-{rng.randrange(200, 260)}000 USD"])
+        posted = rng.choice(["Today", "2 days ago", "1 week ago", "2025-01-01", None])
+        for board in rng.sample(BOARDS, rng.randint(1, 3)):
+            jobs.append(make_job(
+                board,
+                title.replace("Sr. ", "Senior ") if board == "indeed" else title,
+                company + rng.choice(["", " Inc.", ", LLC"]),
+                city if board != "dice" else city.split(",")[0],
+                f"https://www.{board}.com/jobs/{posting}?utm_source=feed&trk={rng.randrange(9999)}",
+                salary, posted,
+            ))
+    return jobs[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    dedupe.minhash_signatures(["warm up numpy"])
+    best_dedupe = best_rank = float("inf")
+    for _ in range(args.repeat):
+        jobs = make_jobs(args.jobs)
+        started = time.perf_counter()
+        deduper = dedupe.Deduplicator()
+        unique = deduper.add(jobs)
+        deduped = time.perf_counter()
+        dedupe.rank(unique)
+        ranked = time.perf_counter()
+        best_dedupe = min(best_dedupe, deduped - started)
+        best_rank = min(best_rank, ranked - deduped)
+
+    print(f"jobs={args.jobs} unique={len(unique)} duplicates={deduper.stats}")
+    print(f"dedupe {best_dedupe * 1000:8.1f} ms")
+    print(f"rank   {best_rank * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Load-test the API offline against recorded job-board fixtures.
+
+Starts the stand-in boards from ``benchmarks.harness``, serves the app
+with uvicorn on a local port and drives every search endpoint with
+concurrent clients. Reports latency percentiles and throughput per
+endpoint, for cold requests (a new query each time, so the full scrape
+path runs) and cached ones, then the time per parsed page and the
+allocation peak of one request.
+
+Per-source pacing is off by default, so the numbers show the app's own
+cost; ``--pacing`` keeps the production rates and bursts, which is what
+a single cold search waits for in practice.
+
+    python -m benchmarks.bench_load --requests 200 --concurrency 16
+    python -m benchmarks.bench_load --pacing --requests 3 --concurrency 1 --board-latency 0.3 --linkedin-pages 10
+"""
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import aiohttp
+
+from benchmarks.harness import FixtureBoards, install_stubs, offline_env
+
+ENDPOINTS = {
+    "linkedin": ("/linkdin/get", lambda q: {"skill": q, "location": "usa", "pagenumber": 0}),
+    "indeed": ("/indeed/get", lambda q: {"search_term": q, "google_search_term": None,
+                                         "location": "San Francisco, CA", "results_wanted": 50}),
+    "zip_recruiter": ("/ziprecuter/get", lambda q: {"search_term": q, "google_search_term": None,
+                                                    "location": "San Francisco, CA", "results_wanted": 50}),
+    "hirebase": ("/hirebase/get", lambda q: {"search_term": q, "location": "usa"}),
+    "dice": ("/dice/get", lambda q: {"search_term": q, "location": "usa"}),
+    "search": ("/search", lambda q: {"search_term": q, "location": "San Francisco, CA", "results_wanted": 50}),
+}
+# Stage timings reported per source: (source, stage)
+STAGES = [("linkedin", "parse"), ("dice", "parse"), ("indeed", "postprocess"),
+          ("zip_recruiter", "postprocess"), ("api", "serialize")]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def drive(session: aiohttp.ClientSession, url: str, body, requests: int, concurrency: int) -> dict:
+    """Send ``requests`` POSTs, ``concurrency`` at a time; ``body(i)`` builds the i-th payload."""
+    latencies = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def client():
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            async with session.post(url, json=body(i)) as response:
+                await response.read()
+                if response.status != 200:
+                    errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "p50": quantiles[49] * 1000,
+        "p90": quantiles[89] * 1000,
+        "p99": quantiles[98] * 1000,
+        "rps": len(latencies) / elapsed,
+        "errors": errors,
+    }
+
+
+async def allocation_peak(session: aiohttp.ClientSession, url: str, body, runs: int = 3) -> float:
+    """Largest traced allocation peak (KiB) of one cold request, server and client in this process."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(runs):
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            async with session.post(url, json=body(i)) as response:
+                await response.read()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+    return max(peaks) / 1024
+
+
+async def run(args):
+    boards = FixtureBoards(linkedin_pages=args.linkedin_pages, latency=args.board_latency)
+    boards_url = await boards.start()
+    state = tempfile.TemporaryDirectory()
+    os.environ.update(offline_env(boards_url, state.name, pacing=args.pacing))
+
+    # Imported only now, so the app picks up the offline configuration
+    import uvicorn
+    import app.main
+    from app import config
+    from app.metrics import metrics
+
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("job_scraper").setLevel(logging.WARNING)
+    install_stubs(latency=args.board_latency)
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app.main.app, host="127.0.0.1", port=port, log_level="warning"))
+    serving = asyncio.ensure_future(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    base = f"http://127.0.0.1:{port}"
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            print(f"requests={args.requests} concurrency={args.concurrency} board latency={args.board_latency * 1000:.0f} ms")
+            if args.pacing:
+                print("pacing: " + ", ".join(
+                    f"{source} {rate:g}/s burst {max(1.0, rate * 2, config.RATE_BURSTS.get(source, 0)):g}"
+                    for source, rate in config.RATE_LIMITS.items()))
+            else:
+                print("pacing: off (--pacing applies the production rates)")
+            print(f"{'endpoint':<16}{'mode':<8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'req/s':>9}{'errors':>8}")
+            names = args.endpoints or list(ENDPOINTS)
+            for round_id, name in enumerate(names):
+                path, payload = ENDPOINTS[name]
+                url = base + path
+                cold = lambda i, payload=payload, r=round_id: payload(f"engineer {r}-{i}")
+                warm = lambda i, payload=payload: payload("engineer")
+                await session.post(url, json=warm(0))
+                for mode, body in (("cold", cold), ("cached", warm)):
+                    result = await drive(session, url, body, args.requests, args.concurrency)
+                    print(f"{name:<16}{mode:<8}{result['p50']:>9.1f}{result['p90']:>9.1f}"
+                          f"{result['p99']:>9.1f}{result['rps']:>9.0f}{result['errors']:>8}")
+
+            print()
+            print("time per call")
+            totals = metrics.totals("jobhub_stage_seconds")
+            for source, stage in STAGES:
+                count, total = totals.get((("source", source), ("stage", stage)), (0, 0.0))
+                if count:
+                    print(f"  {source + ' ' + stage:<26}{total / count * 1000:8.2f} ms  ({count} calls)")
+
+            print()
+            print("allocation peak per cold request")
+            for name in names:
+                path, payload = ENDPOINTS[name]
+                peak = await allocation_peak(session, base + path, lambda i, payload=payload: payload(f"memory {i}"))
+                print(f"  {name:<16}{peak:10.0f} KiB")
+    finally:
+        server.should_exit = True
+        await serving
+        await boards.stop()
+        state.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and mode")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--board-latency", type=float, default=0.0,
+                        help="Seconds the stand-in boards and stubbed scrapers wait before answering")
+    parser.add_argument("--linkedin-pages", type=int, default=3)
+    parser.add_argument("--endpoints", nargs="*", choices=list(ENDPOINTS))
+    parser.add_argument("--pacing", action="store_true",
+                        help="Keep the production per-source rates instead of switching pacing off")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Micro-benchmark the card parsers on saved LinkedIn and Dice fixture pages.
+
+Compares the previous full-page BeautifulSoup parse with the SoupStrainer
+and compiled-XPath (lxml) extractors from ``app.parsers``.
+
+    python -m benchmarks.bench_parsers --repeat 50
+"""
+import argparse
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.parsers import get_parser
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PAGES = {
+    "linkedin": FIXTURES / "linkedin_guest_page.html",
+    "dice": FIXTURES / "dice_search_page.html",
+}
+
+
+def legacy_linkedin(html: str) -> list:
+    """The pre-parser-layer LinkedIn extraction: whole-page html.parser + find() per field."""
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for item in soup.find('body').find_all('li') if soup.find('body') else soup.find_all('li'):
+        rows.append([
+            item.find('h4', class_='base-search-card__subtitle'),
+            item.find('h3', class_='base-search-card__title'),
+            item.find('a', class_='base-card__full-link'),
+            item.find('div', class_='job-salary'),
+            item.find('time', class_=lambda c: c and ('job-search-card__listdate' in c or 'job-search-card__listdate--new' in c)),
+        ])
+    return rows
+
+
+def legacy_dice(html: str) -> list:
+    """The pre-parser-layer Dice extraction: whole-page html.parser + find() per field."""
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for card in soup.find_all('div', class_='card search-card'):
+        rows.append([
+            card.find('a', {'data-cy': 'search-result-company-name'}),
+            card.find('a', {'data-cy': 'card-title-link'}),
+            card.find('span', {'data-cy': 'search-result-location'}),
+            card.find('span', class_='posted-date'),
+            card.find('span', {'data-cy': 'search-result-employment-type'}),
+            card.find('span', {'data-cy': 'compensationText'}),
+        ])
+    return rows
+
+
+LEGACY = {"linkedin": legacy_linkedin, "dice": legacy_dice}
+
+
+def best_ms(fn, html: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(html)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for source, path in PAGES.items():
+        html = path.read_text()
+        legacy = best_ms(LEGACY[source], html, args.repeat)
+        print(f"{source} ({len(html) // 1024} KiB page)")
+        print(f"  legacy bs4  {legacy:7.2f} ms")
+        for engine in ("soup", "lxml"):
+            extractor = get_parser(source, engine)
+            cards = len(extractor.parse(html))
+            elapsed = best_ms(extractor.parse, html, args.repeat)
+            print(f"  {engine:<10}  {elapsed:7.2f} ms  ({legacy / elapsed:.1f}x, {cards} cards)")
+
+
+if __name__ == "__main__":
+    main()
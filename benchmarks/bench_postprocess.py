@@ -0,0 +1,84 @@
+"""
+Benchmark the jobspy post-processing stage on large result frames.
+
+Compares the previous row-wise pipeline (``DataFrame.apply(axis=1)`` plus
+``replace({np.nan: None})``) with ``app.postprocess``.
+
+    python -m benchmarks.bench_postprocess --rows 10000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app import postprocess
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Build a frame shaped like a jobspy result, with about a third of salaries missing."""
+    rng = np.random.default_rng(seed)
+    low = rng.integers(40_000, 120_000, rows).astype(float)
+    low[rng.random(rows) < 0.33] = np.nan
+    high = low + rng.integers(5_000, 40_000, rows)
+    return pd.DataFrame({
+        "company": [f"Company {i % 500}" for i in range(rows)],
+        "title": [f"Software Engineer {i}" for i in range(rows)],
+        "job_url": [f"https://example.com/jobs/{i}" for i in range(rows)],
+        "date_posted": pd.Timestamp("2025-01-01").date(),
+        "company_logo": np.where(rng.random(rows) < 0.5, "https://example.com/logo.png", None),
+        "location": "San Francisco, CA",
+        "description": "A long description " * 20,
+        "min_amount": low,
+        "max_amount": high,
+        "currency": np.where(np.isnan(low), None, "USD"),
+        "interval": np.where(np.isnan(low), None, "yearly"),
+    })
+
+
+def legacy_rows(jobs: pd.DataFrame) -> list:
+    """The pre-vectorization Indeed pipeline."""
+    columns_needed = ["company", "title", "job_url", "date_posted", "company_logo"]
+    jobs["min_amount"] = jobs["min_amount"].fillna(0).astype(int)
+    jobs["max_amount"] = jobs["max_amount"].fillna(0).astype(int)
+    jobs["salary_info"] = jobs.apply(
+        lambda row: f"{row['min_amount']}-{row['max_amount']} {row['currency']}"
+        if pd.notnull(row["min_amount"]) and pd.notnull(row["max_amount"])
+        else "Not disclosed",
+        axis=1
+    )
+    return jobs[columns_needed + ["salary_info"]].replace({np.nan: None}).values.tolist()
+
+
+def vectorized_rows(jobs: pd.DataFrame) -> list:
+    columns = ["company", "title", "job_url", "date_posted", "company_logo", "salary_info"]
+    return postprocess.to_rows(jobs, columns + postprocess.SALARY_COLUMNS)
+
+
+def timeit(fn, frame: pd.DataFrame, repeat: int) -> float:
+    """Best-of-N wall time in milliseconds; each run gets a fresh copy of the frame."""
+    best = float("inf")
+    for _ in range(repeat):
+        data = frame.copy()
+        started = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows)
+    legacy = timeit(legacy_rows, frame, args.repeat)
+    vectorized = timeit(vectorized_rows, frame, args.repeat)
+    print(f"rows={args.rows}")
+    print(f"legacy     {legacy:8.1f} ms")
+    print(f"vectorized {vectorized:8.1f} ms  ({legacy / vectorized:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
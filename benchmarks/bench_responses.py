@@ -0,0 +1,83 @@
+"""
+Compare response sizes and times for large /*/get results.
+
+Runs the app in-process against the offline stand-ins (see
+``benchmarks/harness.py``) and requests one large ZipRecruiter result,
+which carries every posting's description. It compares the whole body
+against the first page with and without ``description``, each sent raw,
+gzip- and brotli-encoded. It reports bytes on the wire, server time,
+and the time to decode the body as a client would before rendering.
+
+    python -m benchmarks.bench_responses --results 500 --page-size 50
+"""
+import argparse
+import asyncio
+import gzip
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from benchmarks.harness import FixtureBoards, install_stubs, offline_env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    boards = FixtureBoards()
+    boards_url = loop.run_until_complete(boards.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    state = tempfile.TemporaryDirectory()
+    os.environ.update(offline_env(boards_url, state.name))
+    install_stubs()
+
+    # Imported only now, so the app picks up the offline configuration
+    import brotli
+    import orjson
+    from fastapi.testclient import TestClient
+
+    import app.main
+
+    search = {"search_term": "engineer", "google_search_term": None, "location": "usa",
+              "results_wanted": args.results}
+    variants = [
+        ("whole result", search),
+        ("first page", {**search, "page_size": args.page_size}),
+        ("page, no description", {**search, "page_size": args.page_size,
+                                  "fields": ["title", "company", "location", "url", "salary", "post_date"]}),
+    ]
+    decoders = {"identity": lambda body: body, "gzip": gzip.decompress, "br": brotli.decompress}
+
+    with TestClient(app.main.app) as client:
+        # Fills the result cache, so only response building and encoding are timed
+        client.post("/ziprecuter/get", json=search)
+        print(f"results={args.results} page size={args.page_size}")
+        print(f"{'response':<24}{'encoding':<10}{'KiB':>9}{'server ms':>11}{'decode ms':>11}")
+        for name, body in variants:
+            for encoding, decode in decoders.items():
+                sizes, server, client_side = [], [], []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    with client.stream("POST", "/ziprecuter/get", json=body,
+                                       headers={"Accept-Encoding": encoding}) as response:
+                        raw = b"".join(response.iter_raw())
+                    server.append(time.perf_counter() - started)
+                    started = time.perf_counter()
+                    orjson.loads(decode(raw))
+                    client_side.append(time.perf_counter() - started)
+                    sizes.append(len(raw))
+                print(f"{name:<24}{encoding:<10}{statistics.median(sizes) / 1024:>9.1f}"
+                      f"{statistics.median(server) * 1000:>11.2f}{statistics.median(client_side) * 1000:>11.2f}")
+
+    loop.call_soon_threadsafe(loop.stop)
+    state.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark the normalized job record and the response encoder.
+
+Compares per-record memory of plain dicts with the slotted ``Job``
+dataclass, and FastAPI's default ``jsonable_encoder`` + ``json.dumps``
+path with the orjson path ``JobsResponse`` uses.
+
+    python -m benchmarks.bench_serialization --jobs 10000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from fastapi.encoders import jsonable_encoder
+
+from app import normalize
+from app.serialization import dumps
+
+
+def make_jobs(count: int) -> list:
+    return [
+        normalize.make_job(
+            "indeed", f"Software Engineer {i}", f"Company {i % 500}", "San Francisco, CA",
+            f"https://example.com/jobs/{i}", "120000-150000 USD", "2025-01-01",
+            "https://example.com/logo.png",
+        )
+        for i in range(count)
+    ]
+
+
+def memory(build, count: int) -> float:
+    """Bytes allocated per record while building ``count`` records."""
+    tracemalloc.start()
+    records = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size / count
+
+
+def timeit(fn, repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    as_dicts = memory(lambda n: [job.to_dict() for job in make_jobs(n)], args.jobs)
+    as_slots = memory(make_jobs, args.jobs)
+    print(f"jobs={args.jobs}")
+    print(f"dict records  {as_dicts:8.0f} B/job")
+    print(f"Job records   {as_slots:8.0f} B/job  ({as_dicts / as_slots:.1f}x smaller)")
+
+    jobs = make_jobs(args.jobs)
+    body = {"jobs": [job.to_dict() for job in jobs], "next_page": False}
+    default = timeit(lambda: json.dumps(jsonable_encoder(body)).encode(), args.repeat)
+    fast = timeit(lambda: dumps({"jobs": jobs, "next_page": False}), args.repeat)
+    print(f"jsonable_encoder + json {default:8.1f} ms")
+    print(f"orjson (Job records)    {fast:8.1f} ms  ({default / fast:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
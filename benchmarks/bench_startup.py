@@ -0,0 +1,58 @@
+"""
+Measure cold startup of the API in fresh interpreter processes.
+
+Times ``import app.main`` and the time until ``GET /`` first answers,
+with the scraping dependencies deferred (current behaviour) and with
+them imported up front (how the app used to start).
+
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import time
+started = time.perf_counter()
+if {eager}:
+    import importlib
+    from app.jobs import HEAVY_MODULES
+    for module in HEAVY_MODULES:
+        importlib.import_module(module, "app")
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    client.get("/")
+    answered = time.perf_counter()
+print(imported - started, answered - started)
+"""
+
+
+def run(eager: bool) -> tuple:
+    # Keep background warm-up from launching Chrome while we measure
+    env = {**os.environ, "JOBHUB_BROWSER_WARM": "0", "JOBHUB_PREWARM_ENABLED": "0"}
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(eager=eager)],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(out[-2]), float(out[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'':<10}{'import app.main':>18}{'first response':>18}")
+    for label, eager in (("eager", True), ("lazy", False)):
+        samples = [run(eager) for _ in range(args.runs)]
+        imported = statistics.median(s[0] for s in samples) * 1000
+        answered = statistics.median(s[1] for s in samples) * 1000
+        print(f"{label:<10}{imported:>15.0f} ms{answered:>15.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark the persistent job store behind /jobs/query.
+
+Fills a fresh SQLite store with generated postings in scrape-sized
+batches, then times typical skill/location/recency/salary queries and
+one expiry pass.
+
+    python -m benchmarks.bench_store --jobs 50000
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.store import JobStore
+from benchmarks.bench_dedupe import make_jobs
+
+QUERIES = [
+    ("skill", dict(text="data engineer")),
+    ("skill + city", dict(text="software engineer", location="new york")),
+    ("prefix, relevance", dict(text="sen eng", order="relevance")),
+    ("recent + salary", dict(text="engineer", max_age_days=3, min_salary=150000)),
+    ("board, no text", dict(sources=["dice"], max_age_days=7)),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=100, help="Postings written per scrape")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as state:
+        store = JobStore(str(Path(state) / "jobs.sqlite3"))
+        jobs = make_jobs(args.jobs)
+        started = time.perf_counter()
+        for i in range(0, len(jobs), args.batch):
+            store.add(jobs[i:i + args.batch])
+        elapsed = time.perf_counter() - started
+        print(f"jobs={args.jobs} stored={store.status()['jobs']}")
+        print(f"{'insert':<20}{elapsed / (len(jobs) / args.batch) * 1000:>8.2f} ms per {args.batch}-job scrape")
+
+        for name, query in QUERIES:
+            times = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                found = store.query(**query)
+                times.append(time.perf_counter() - started)
+            print(f"{name:<20}{statistics.median(times) * 1000:>8.2f} ms  ({len(found)} jobs)")
+
+        started = time.perf_counter()
+        store.expire(0)
+        print(f"{'expire all':<20}{(time.perf_counter() - started) * 1000:>8.1f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
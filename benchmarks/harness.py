@@ -0,0 +1,158 @@
+"""
+Offline stand-ins for the job boards, shared by the load benchmarks.
+
+``FixtureBoards`` serves the captured pages in ``benchmarks/fixtures``
+from a local aiohttp server: the LinkedIn guest API and the Dice results
+pages (a fixed number of full pages, then empty ones), HireBase's search
+API, plus stand-ins for the images, scripts and styles those pages
+reference so a real browser can load them offline. ``offline_env``
+points the app's board URLs at it, and ``install_stubs`` swaps the one
+scraper that cannot run offline: jobspy's ``scrape_jobs`` returns a
+generated result frame.
+
+The app reads its configuration at import time, so set the environment
+from ``offline_env`` before importing anything from ``app``.
+"""
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).parent / "fixtures"
+LINKEDIN_PAGE = (FIXTURES / "linkedin_guest_page.html").read_text()
+DICE_PAGE = (FIXTURES / "dice_search_page.html").read_text()
+HIREBASE_RESULT = (FIXTURES / "hirebase_search.json").read_text()
+# What Dice answers past the last page of results
+DICE_EMPTY_PAGE = ('<html><body><main><div id="searchDisplay-div"><dhi-search-cards-widget>'
+                   '<p data-cy="no-results">No jobs found</p></dhi-search-cards-widget></div></main></body></html>')
+
+# Cards on the captured pages, i.e. the page sizes the stand-ins answer with
+LINKEDIN_PAGE_SIZE = 10
+DICE_PAGE_SIZE = 20
+
+# Stand-in subresource sizes in bytes, by file extension (LinkedIn logos have none)
+ASSET_SIZES = {".css": 60_000, ".js": 250_000, ".png": 12_000, ".woff2": 30_000}
+DEFAULT_ASSET_SIZE = 12_000
+
+
+class FixtureBoards:
+    """
+    A local HTTP server answering like the job boards, from fixtures.
+
+    ``latency`` adds a fixed delay to every response to stand in for the
+    network; ``linkedin_pages`` and ``dice_pages`` are how many full
+    pages a search returns.
+    """
+
+    def __init__(self, linkedin_pages: int = 3, dice_pages: int = 10, latency: float = 0.0):
+        self.linkedin_pages = linkedin_pages
+        self.dice_pages = dice_pages
+        self.latency = latency
+        self.requests = {"linkedin": 0, "hirebase": 0, "dice": 0, "assets": 0}
+        self.asset_bytes = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+        self._pages = {"linkedin": LINKEDIN_PAGE, "dice": DICE_PAGE}
+
+    def _local_assets(self, html: str) -> str:
+        # Keeps the original host in the path, so host-based block patterns still match
+        return html.replace('="https://', f'="{self.url}/assets/')
+
+    async def _delay(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def linkedin(self, request: web.Request) -> web.Response:
+        self.requests["linkedin"] += 1
+        await self._delay()
+        start = int(request.query.get("start", 0))
+        body = self._pages["linkedin"] if start < self.linkedin_pages * LINKEDIN_PAGE_SIZE else ""
+        return web.Response(text=body, content_type="text/html")
+
+    async def hirebase(self, request: web.Request) -> web.Response:
+        self.requests["hirebase"] += 1
+        await request.read()
+        await self._delay()
+        return web.Response(text=HIREBASE_RESULT, content_type="application/json")
+
+    async def dice(self, request: web.Request) -> web.Response:
+        self.requests["dice"] += 1
+        await self._delay()
+        page = int(request.query.get("page", 1))
+        body = self._pages["dice"] if page <= self.dice_pages else DICE_EMPTY_PAGE
+        return web.Response(text=body, content_type="text/html")
+
+    async def asset(self, request: web.Request) -> web.Response:
+        self.requests["assets"] += 1
+        path = request.match_info["path"].split("?")[0]
+        size = next((n for ext, n in ASSET_SIZES.items() if path.endswith(ext)), DEFAULT_ASSET_SIZE)
+        self.asset_bytes += size
+        return web.Response(body=b"\0" * size, headers={"Cache-Control": "no-store"})
+
+    async def start(self, host: str = "127.0.0.1") -> str:
+        app = web.Application()
+        app.router.add_get("/jobs-guest/jobs/api/seeMoreJobPostings/search", self.linkedin)
+        app.router.add_post("/api", self.hirebase)
+        app.router.add_get("/jobs", self.dice)
+        app.router.add_get("/assets/{path:.*}", self.asset)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        self._pages = {name: self._local_assets(html) for name, html in self._pages.items()}
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def offline_env(boards_url: str, state_dir: str, pacing: bool = False) -> Dict[str, str]:
+    """
+    Environment that points the app at ``FixtureBoards`` and keeps it off the network.
+
+    Per-source pacing is switched off unless ``pacing`` is set, in which
+    case the app's default rates and bursts apply as in production.
+    """
+    env = {
+        "JOBHUB_LINKEDIN_URL": boards_url,
+        "JOBHUB_HIREBASE_URL": f"{boards_url}/api",
+        "JOBHUB_DICE_URL": boards_url,
+        "JOBHUB_DICE_PAGE_SIZE": str(DICE_PAGE_SIZE),
+        "JOBHUB_SEEN_DB_PATH": str(Path(state_dir) / "seen.sqlite3"),
+        "JOBHUB_STORE_PATH": str(Path(state_dir) / "jobs.sqlite3"),
+        "JOBHUB_BROWSER_WARM": "0",
+        "JOBHUB_PREWARM_ENABLED": "0",
+        "JOBHUB_PROXIES": "",
+        "JOBHUB_HTTP_RETRIES": "0",
+        "JOBHUB_QUEUE_URL": "",
+        "JOBHUB_REDIS_URL": "",
+    }
+    if not pacing:
+        # The stand-ins never throttle, so pacing would only measure the limiter
+        for source in ("LINKEDIN", "INDEED", "ZIP_RECRUITER", "HIREBASE", "DICE", "DEFAULT"):
+            env[f"JOBHUB_RATE_{source}"] = "10000"
+    return env
+
+
+def install_stubs(latency: float = 0.0):
+    """
+    Replace jobspy's network access with a generated result frame.
+
+    ``scrape_jobs`` returns a frame shaped like jobspy's, sized by
+    ``results_wanted``; it still runs through the app's executor, guards
+    and post-processing.
+    """
+    import jobspy
+
+    from benchmarks.bench_postprocess import make_frame
+
+    def scrape_jobs(results_wanted: int = 20, proxies=None, **kwargs):
+        time.sleep(latency)
+        return make_frame(results_wanted)
+
+    jobspy.scrape_jobs = scrape_jobs
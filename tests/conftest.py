@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# The app reads its configuration at import time: keep its SQLite files out of the checkout
+_state = tempfile.mkdtemp(prefix="jobhub-tests-")
+os.environ.setdefault("JOBHUB_SEEN_DB_PATH", os.path.join(_state, "seen.sqlite3"))
+os.environ.setdefault("JOBHUB_STORE_PATH", os.path.join(_state, "jobs.sqlite3"))
+os.environ.setdefault("JOBHUB_PREWARM_ENABLED", "0")
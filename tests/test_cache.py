@@ -0,0 +1,69 @@
+import asyncio
+
+from app.cache import LRUCache, ResultCache, make_key
+
+
+def counting_fetch(value):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return value
+
+    return fetch, calls
+
+
+def test_key_ignores_parameter_order():
+    assert make_key("dice", {"a": 1, "b": 2}) == make_key("dice", {"b": 2, "a": 1})
+    assert make_key("dice", {"a": 1}) != make_key("indeed", {"a": 1})
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1, 0.0)
+    lru.set("b", 2, 0.0)
+    lru.get("a")
+    lru.set("c", 3, 0.0)
+    assert lru.get("b") is None
+    assert lru.get("a") == (1, 0.0)
+
+
+def test_fresh_results_are_served_from_cache():
+    cache = ResultCache({"dice": 60})
+    fetch, calls = counting_fetch(["job"])
+
+    async def run():
+        await cache.get_or_fetch("dice", {"q": "python"}, fetch)
+        return await cache.get_or_fetch("dice", {"q": "python"}, fetch)
+
+    assert asyncio.run(run()) == ["job"]
+    assert len(calls) == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_empty_results_are_not_cached():
+    cache = ResultCache({"dice": 60})
+    fetch, calls = counting_fetch([])
+
+    async def run():
+        await cache.get_or_fetch("dice", {"q": "python"}, fetch)
+        await cache.get_or_fetch("dice", {"q": "python"}, fetch)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_stale_result_is_served_and_refreshed_in_background():
+    cache = ResultCache({"dice": 0.01}, stale_ttl=60)
+    fetch, calls = counting_fetch(["job"])
+
+    async def run():
+        await cache.get_or_fetch("dice", {"q": "python"}, fetch)
+        await asyncio.sleep(0.02)
+        value = await cache.get_or_fetch("dice", {"q": "python"}, fetch)
+        await asyncio.sleep(0.01)
+        return value
+
+    assert asyncio.run(run()) == ["job"]
+    assert cache.stats["stale_hits"] == 1
+    assert len(calls) == 2
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware, choose_encoding
+
+
+@pytest.mark.parametrize("header, with_brotli, without_brotli", [
+    ("gzip", "gzip", "gzip"),
+    ("br, gzip", "br", "gzip"),
+    ("*", "br", "gzip"),
+    ("identity;q=0, *", "br", "gzip"),
+    ("gzip;q=0.5, br;q=0.8", "br", "gzip"),
+    ("gzip;q=1, br;q=0.5", "gzip", "gzip"),
+    ("br; q=0.7 , gzip", "gzip", "gzip"),
+    ("*, br;q=0", "gzip", "gzip"),
+    ("gzip;q=0, *", "br", None),
+    ("br;q=0, gzip;q=0", None, None),
+    ("*;q=0", None, None),
+    ("gzip;q=0.2, identity;q=0.9", None, None),
+    ("deflate", None, None),
+    ("", None, None),
+])
+def test_choose_encoding(header, with_brotli, without_brotli):
+    assert choose_encoding(header, True) == with_brotli
+    assert choose_encoding(header, False) == without_brotli
+
+
+def test_large_json_is_compressed():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+    payload = {"jobs": ["Data Engineer"] * 200}
+
+    @app.get("/")
+    def jobs():
+        return JSONResponse(payload)
+
+    client = TestClient(app)
+    response = client.get("/", headers={"Accept-Encoding": "identity;q=0, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == payload
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == payload
@@ -0,0 +1,83 @@
+from datetime import date
+
+from app import dedupe
+from app.dedupe import Deduplicator, age_days, rank
+from app.normalize import make_job
+
+
+def test_age_follows_the_clock(monkeypatch):
+    class Clock(date):
+        current = date(2026, 10, 18)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(dedupe, "date", Clock)
+    assert age_days("2026-10-01") == 17
+    Clock.current = date(2026, 11, 30)
+    assert age_days("2026-10-01") == 60
+
+
+def test_age_texts():
+    today = date(2026, 10, 18)
+    assert age_days("3 days ago", today) == 3
+    assert age_days("2 weeks ago", today) == 14
+    assert age_days("Just posted", today) == 0
+    assert age_days("yesterday", today) == 1
+    assert age_days("2026-13-45", today) is None
+    assert age_days("sometime", today) is None
+    assert age_days(None, today) is None
+
+
+def job(source, title, company, location="Austin, TX", url=None, **fields):
+    return make_job(source, title=title, company=company, location=location, url=url, **fields)
+
+
+def test_same_url_is_one_posting():
+    dedupe = Deduplicator()
+    dedupe.add([job("indeed", "Data Engineer", "Acme", url="https://www.indeed.com/viewjob?jk=1&from=serp")])
+    fresh = dedupe.add([job("indeed", "Data Engineer II", "Acme", url="https://indeed.com/viewjob?jk=1")])
+    assert fresh == [] and dedupe.stats["url"] == 1
+
+
+def test_near_duplicate_titles_merge_and_fill_missing_fields():
+    dedupe = Deduplicator()
+    first = job("linkedin", "Senior Software Engineer, Backend", "Acme Inc.")
+    dedupe.add([first])
+    fresh = dedupe.add([job("dice", "Sr. Software Engineer - Backend", "ACME", location="Austin",
+                            salary="$150,000 a year")])
+    assert fresh == []
+    assert dedupe.duplicates == 1
+    assert first.salary == "$150,000 a year"
+
+
+def test_distinct_postings_stay_separate():
+    jobs = [
+        job("linkedin", "Software Engineer", "Acme"),
+        job("linkedin", "Senior Software Engineer", "Acme"),
+        job("linkedin", "Software Engineer", "Globex"),
+        job("linkedin", "Software Engineer", "Acme", location="Denver, CO"),
+        job("linkedin", "Registered Nurse", "Acme"),
+    ]
+    assert Deduplicator().add(jobs) == jobs
+
+
+def test_postings_without_title_or_company_are_not_merged():
+    blank = [make_job("hirebase", url=f"https://apply.example.com/{n}") for n in range(3)]
+    untitled = [make_job("dice", company="Acme", url=f"https://www.dice.com/job-detail/{n}") for n in range(2)]
+    dedupe = Deduplicator()
+    assert dedupe.add(blank + untitled) == blank + untitled
+    assert dedupe.add([make_job("hirebase", url="https://apply.example.com/1")]) == []
+
+
+def test_rank_prefers_recent_then_well_paid():
+    today = date(2026, 10, 18)
+    old_rich = job("indeed", "A", "Acme", post_date="2026-09-01", salary="$300,000 a year")
+    fresh_poor = job("indeed", "B", "Acme", post_date="2026-10-18", salary="$50,000 a year")
+    fresh_rich = job("indeed", "C", "Acme", post_date="2026-10-17", salary="$200,000 a year")
+    undated = job("indeed", "D", "Acme")
+    # An undated posting scores as two half-lives old and without pay it falls behind even an old, well-paid one
+    assert rank([old_rich, undated, fresh_poor, fresh_rich], today=today) == [fresh_rich, fresh_poor, old_rich, undated]
+    # All weight on salary
+    assert rank([fresh_poor, old_rich], salary_weight=1.0, today=today) == [old_rich, fresh_poor]
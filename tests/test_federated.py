@@ -0,0 +1,38 @@
+import asyncio
+
+from app import schemas
+from app.cache import ResultCache
+from app.federated import FederatedSearch
+
+INDEED = [
+    ["Acme", "Data Engineer", "https://www.indeed.com/viewjob?jk=1a2b3c", "1 day ago", None, None],
+    ["Globex", "Nurse Practitioner", "https://www.indeed.com/viewjob?jk=4d5e6f", "1 day ago", None, None],
+    # The first posting again, reached through a tracked link
+    ["Acme", "Data Engineer", "https://indeed.com/viewjob?jk=1a2b3c&from=serp", "1 day ago", None, None],
+]
+ZIP_RECRUITER = [
+    {"company": "Initech", "title": "Accountant", "job_url": "https://www.ziprecruiter.com/jobs//j?lvk=abc"},
+    {"company": "Umbrella", "title": "Forklift Operator", "job_url": "https://www.ziprecruiter.com/jobs//j?lvk=def"},
+]
+
+
+def search(sources):
+    async def fetch(name, title):
+        return {"indeed": INDEED, "zip_recruiter": ZIP_RECRUITER}[name]
+
+    federated = FederatedSearch(None, ResultCache({}), {}, fetch=fetch)
+    query = schemas.searchInput(search_term="anything", location="Austin", sources=sources, rank=False)
+    return asyncio.run(federated.search(query))
+
+
+def test_postings_identified_by_query_string_are_kept():
+    result = search(["indeed", "zip_recruiter"])
+    urls = sorted(job.url for job in result["jobs"])
+    assert urls == [
+        "https://www.indeed.com/viewjob?jk=1a2b3c",
+        "https://www.indeed.com/viewjob?jk=4d5e6f",
+        "https://www.ziprecruiter.com/jobs//j?lvk=abc",
+        "https://www.ziprecruiter.com/jobs//j?lvk=def",
+    ]
+    assert result["duplicates"] == 1
+    assert result["sources"]["indeed"]["count"] == 2
@@ -0,0 +1,77 @@
+import asyncio
+
+from app import schemas
+from app.cache import make_key
+from app.incremental import SeenIndex
+
+
+def dice_item(number):
+    return {"company": "Acme", "title": f"Engineer {number}", "url": f"https://www.dice.com/job-detail/{number}"}
+
+
+def linkedin_row(number):
+    return ["Acme", f"Engineer {number}", f"https://www.linkedin.com/jobs/view/{number}", None, None]
+
+
+async def source(pages, requested):
+    for number, page in enumerate(pages, 1):
+        requested.append(number)
+        yield page
+
+
+def run(delta, pages):
+    requested = []
+
+    async def collect():
+        return [items async for items in delta.committed_pages(source(pages, requested))]
+
+    return asyncio.run(collect()), requested
+
+
+def test_incremental_and_client_id_are_not_part_of_the_query():
+    plain = schemas.hireBase(search_term="python", location="Austin")
+    polled = schemas.hireBase(search_term="python", location="Austin", incremental=True, client_id="a")
+    assert plain.model_dump() == polled.model_dump()
+    assert make_key("dice", plain.model_dump()) == make_key("dice", polled.model_dump())
+
+
+def test_second_poll_returns_only_new_postings(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite3"))
+    title = schemas.hireBase(search_term="python", location="Austin", incremental=True)
+    first, _ = run(index.delta("dice", title), [[dice_item(1), dice_item(2)]])
+    assert first == [[dice_item(1), dice_item(2)]]
+    second, _ = run(index.delta("dice", title), [[dice_item(1), dice_item(3)]])
+    assert second == [[dice_item(3)]]
+    index.close()
+
+
+def test_clients_have_their_own_view(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite3"))
+    pages = [[dice_item(1)]]
+    for client in ("a", "b"):
+        title = schemas.hireBase(search_term="python", location="Austin", incremental=True, client_id=client)
+        delivered, _ = run(index.delta("dice", title), pages)
+        assert delivered == pages
+    index.close()
+
+
+def test_linkedin_stops_at_first_known_page(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite3"))
+    title = schemas.userInput(skill="python", location="Austin", pagenumber=1, incremental=True)
+    run(index.delta("linkedin", title), [[linkedin_row(2)]])
+    delivered, requested = run(index.delta("linkedin", title),
+                               [[linkedin_row(1), linkedin_row(2)], [linkedin_row(3)]])
+    assert delivered == [[linkedin_row(1)]]
+    assert requested == [1]
+    index.close()
+
+
+def test_dice_reads_every_page(tmp_path):
+    # Dice results are not sorted by date: new postings can follow known ones
+    index = SeenIndex(str(tmp_path / "seen.sqlite3"))
+    title = schemas.hireBase(search_term="python", location="Austin", incremental=True)
+    run(index.delta("dice", title), [[dice_item(2)]])
+    delivered, requested = run(index.delta("dice", title), [[dice_item(1), dice_item(2)], [dice_item(3)]])
+    assert delivered == [[dice_item(1)], [dice_item(3)]]
+    assert requested == [1, 2]
+    index.close()
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from app import config
+from app.jobs import JobScraper
+from app.ratelimit import build_guards
+
+FIXTURES = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+LINKEDIN_PAGE = (FIXTURES / "linkedin_guest_page.html").read_text()
+CHALLENGE_PAGE = '<html><body><a href="https://www.linkedin.com/authwall">Sign in</a></body></html>'
+
+
+class FakeDriver:
+    proxy = None
+
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+
+@pytest.fixture
+def scraper():
+    scraper = JobScraper(pool_size=1)
+    # No pacing: the stand-in pages answer instantly
+    scraper.guards = build_guards({source: 1000.0 for source in config.RATE_LIMITS},
+                                  config.BREAKER_THRESHOLD, config.BREAKER_RESET)
+    yield scraper
+    scraper.executor.shutdown()
+
+
+def serve(scraper, http_pages, browser_page):
+    """Answer HTTP fetches from ``http_pages`` in order (then empty pages) and browser loads with ``browser_page``."""
+    responses = iter(http_pages)
+    driver = FakeDriver(browser_page)
+
+    async def fetch_text(url, proxy=None):
+        return next(responses, (200, ""))
+
+    @contextmanager
+    def browser(source):
+        yield driver
+
+    scraper.http.fetch_text = fetch_text
+    scraper._browser = browser
+    scraper._navigate = lambda driver, url: driver.get(url)
+    return driver
+
+
+def scrape_linkedin(scraper, max_pages=1, concurrency=2):
+    async def collect():
+        return [rows async for rows in scraper.iter_linkedin_http("python", "Austin", max_pages=max_pages,
+                                                                  concurrency=concurrency)]
+
+    return asyncio.run(collect())
+
+
+def test_challenge_falls_back_to_browser(scraper):
+    driver = serve(scraper, [(999, "")], LINKEDIN_PAGE)
+    [rows] = scrape_linkedin(scraper)
+    assert len(rows) == 10
+    assert len(driver.urls) == 1
+    stats = scraper.guards["linkedin"].stats
+    assert stats["throttled"] == 1 and stats["success"] == 1
+
+
+def test_browser_challenge_is_not_parsed_as_jobs(scraper):
+    serve(scraper, [(200, CHALLENGE_PAGE)], CHALLENGE_PAGE)
+    assert scrape_linkedin(scraper) == []
+    stats = scraper.guards["linkedin"].stats
+    assert stats["throttled"] == 2 and stats["success"] == 0
+
+
+def test_pages_are_parsed_off_the_event_loop(scraper):
+    serve(scraper, [(200, LINKEDIN_PAGE)], None)
+    threads = []
+    parse = scraper._parse_linkedin_page
+
+    def recording_parse(html):
+        threads.append(threading.current_thread())
+        return parse(html)
+
+    scraper._parse_linkedin_page = recording_parse
+    pages = scrape_linkedin(scraper, max_pages=2)
+    assert [len(rows) for rows in pages] == [10]
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+DICE_PAGE = (FIXTURES / "dice_search_page.html").read_text()
+DICE_NO_RESULTS_PAGE = ('<html><body><div id="searchDisplay-div"><dhi-search-cards-widget>'
+                        '<p data-cy="no-results">No jobs found</p></dhi-search-cards-widget></div></body></html>')
+DICE_SHELL_PAGE = '<html><head><script src="/app.js"></script></head><body><dhi-root></dhi-root></body></html>'
+
+
+def scrape_dice(scraper, browser_pages):
+    browser_pages = iter(browser_pages)
+    loaded = []
+
+    def fetch_dice_page_source(url):
+        loaded.append(url)
+        return next(browser_pages)
+
+    scraper._fetch_dice_page_source = fetch_dice_page_source
+
+    async def collect():
+        return [jobs async for jobs in scraper.iter_dice_http("python", "Austin", max_results=20)]
+
+    return asyncio.run(collect()), loaded
+
+
+def test_dice_search_without_matches_is_not_a_failure(scraper):
+    serve(scraper, [(200, DICE_NO_RESULTS_PAGE)], None)
+    pages, loaded = scrape_dice(scraper, [])
+    assert pages == [] and loaded == []
+    stats = scraper.guards["dice"].stats
+    assert stats["failure"] == 0 and stats["success"] == 1
+
+
+def test_dice_script_shell_falls_back_to_browser(scraper):
+    serve(scraper, [(200, DICE_SHELL_PAGE)], None)
+    pages, loaded = scrape_dice(scraper, [DICE_PAGE])
+    assert len(loaded) == 1
+    assert sum(len(jobs) for jobs in pages) == 20
+
+
+def test_linkedin_reports_saved_fetches(scraper, caplog):
+    serve(scraper, [(200, LINKEDIN_PAGE), (200, LINKEDIN_PAGE)], None)
+    with caplog.at_level("INFO", logger="job_scraper"):
+        pages = scrape_linkedin(scraper, max_pages=5)
+    assert [len(rows) for rows in pages] == [10, 10]
+    assert "(3 fetches, 2 saved)" in caplog.text
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/linkdin/get", {"skill": "saturated", "location": "Austin", "pagenumber": 0}),
+    ("/dice/get", {"search_term": "saturated", "location": "Austin"}),
+])
+def test_saturated_executor_is_a_503(monkeypatch, path, body):
+    from fastapi.testclient import TestClient
+
+    from app import main
+    from app.executor import BoundedExecutor
+
+    executor = BoundedExecutor(max_workers=1, max_queue=0)
+    # Every slot taken: pages can no longer be parsed
+    executor._pending = executor.capacity
+    monkeypatch.setattr(main.jobscr, "executor", executor)
+    monkeypatch.setattr(main.jobscr, "guards", build_guards({source: 1000.0 for source in config.RATE_LIMITS},
+                                                            config.BREAKER_THRESHOLD, config.BREAKER_RESET))
+    pages = {"/linkdin/get": LINKEDIN_PAGE, "/dice/get": DICE_PAGE}
+
+    async def fetch_text(url, proxy=None):
+        return 200, pages[path]
+
+    monkeypatch.setattr(main.jobscr.http, "fetch_text", fetch_text)
+    response = TestClient(main.app).post(path, json=body)
+    executor.shutdown()
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_dice_page_size_comes_from_the_first_page(scraper, monkeypatch):
+    # Asked for 100 per page, Dice sends its usual 20
+    monkeypatch.setattr(config, "DICE_PAGE_SIZE", 100)
+    serve(scraper, [(200, DICE_PAGE)] * 3, None)
+
+    async def collect():
+        return [jobs async for jobs in scraper.iter_dice_http("python", "Austin", max_results=50)]
+
+    pages = asyncio.run(collect())
+    assert [len(jobs) for jobs in pages] == [20, 20, 10]
@@ -0,0 +1,37 @@
+from app.normalize import canonical_url, dedupe_key, job_id, make_job
+
+
+def indeed_row(url, title="Data Engineer"):
+    return ["Acme", title, url, "2 days ago", None, None]
+
+
+def test_indeed_postings_keep_their_job_key():
+    first = job_id("indeed", indeed_row("https://www.indeed.com/viewjob?jk=1a2b3c"))
+    second = job_id("indeed", indeed_row("https://www.indeed.com/viewjob?jk=4d5e6f"))
+    assert first != second
+    assert first == "https://indeed.com/viewjob?jk=1a2b3c"
+
+
+def test_zip_recruiter_postings_keep_their_job_key():
+    ids = {
+        job_id("zip_recruiter", {"company": "Acme", "title": "Nurse",
+                                 "job_url": f"https://www.ziprecruiter.com/jobs//j?lvk={key}"})
+        for key in ("abc", "def")
+    }
+    assert len(ids) == 2
+
+
+def test_tracking_parameters_do_not_change_the_id():
+    plain = job_id("indeed", indeed_row("https://www.indeed.com/viewjob?jk=1a2b3c"))
+    tracked = job_id("indeed", indeed_row("https://indeed.com/viewjob?from=serp&jk=1a2b3c&utm_source=x#apply"))
+    assert plain == tracked
+
+
+def test_linkedin_urls_reduce_to_the_job_number():
+    assert canonical_url("https://uk.linkedin.com/jobs/view/data-engineer-at-acme-3812345678?refId=x&trk=y") \
+        == "https://linkedin.com/jobs/view/3812345678"
+
+
+def test_jobs_without_url_use_company_title_location():
+    job = make_job("dice", company="Acme", title="Data Engineer", location="Austin, TX")
+    assert dedupe_key(job) == "acme|data engineer|austin, tx"
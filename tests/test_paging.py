@@ -0,0 +1,66 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.paging import InvalidCursor, decode_cursor, encode_cursor, page, query_digest
+
+JOBS = [
+    {"company": "Acme", "title": f"Engineer {number}", "url": f"https://www.dice.com/job-detail/{number}"}
+    for number in range(5)
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def fetch_source(source, title):
+        return JOBS
+
+    monkeypatch.setattr(main, "fetch_source", fetch_source)
+    return TestClient(main.app)
+
+
+def body(**fields):
+    return {"search_term": "python", "location": "Austin", **fields}
+
+
+def test_cursor_round_trip():
+    query = query_digest("dice", body())
+    assert decode_cursor(encode_cursor("tok", query, 20), query) == ("tok", 20)
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", encode_cursor("tok", "q", -1), encode_cursor("", "q", 0)])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, "q")
+
+
+def test_cursor_is_bound_to_its_search():
+    cursor = encode_cursor("tok", query_digest("dice", body()), 2)
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, query_digest("dice", body(search_term="java")))
+
+
+def test_offset_past_the_end_is_rejected():
+    with pytest.raises(InvalidCursor):
+        page(JOBS, "tok", "q", len(JOBS) + 1, 2)
+
+
+def test_pages_follow_the_cursor(client):
+    first = client.post("/dice/get", json=body(page_size=2)).json()
+    assert [job["title"] for job in first["jobs"]] == ["Engineer 0", "Engineer 1"]
+    assert first["total"] == 5
+    second = client.post("/dice/get", json=body(page_size=2, cursor=first["next_cursor"], fields=["title"])).json()
+    assert second["jobs"] == [{"title": "Engineer 2"}, {"title": "Engineer 3"}]
+    third = client.post("/dice/get", json=body(page_size=2, cursor=second["next_cursor"])).json()
+    assert len(third["jobs"]) == 1 and third["next_cursor"] is None
+
+
+def test_cursor_from_another_search_is_a_bad_request(client):
+    first = client.post("/dice/get", json=body(page_size=2)).json()
+    response = client.post("/dice/get", json=body(search_term="java", cursor=first["next_cursor"]))
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("page_size", [0, -5, main.config.PAGE_SIZE_MAX + 1])
+def test_page_size_is_bounded(client, page_size):
+    assert client.post("/dice/get", json=body(page_size=page_size)).status_code == 422
@@ -0,0 +1,91 @@
+import time
+import asyncio
+
+import pytest
+
+from app.ratelimit import CircuitBreaker, CircuitOpen, build_guards
+
+
+def tripped_guard(reset_timeout=0.05):
+    guard = build_guards({"dice": 1000.0}, threshold=2, reset_timeout=reset_timeout)["dice"]
+    guard.failure()
+    guard.failure()
+    assert guard.breaker.state == "open"
+    return guard
+
+
+def test_open_breaker_fails_fast():
+    guard = tripped_guard(reset_timeout=60)
+    with pytest.raises(CircuitOpen):
+        guard.check()
+    with pytest.raises(CircuitOpen):
+        guard.before()
+
+
+def test_probe_after_check_closes_breaker():
+    guard = tripped_guard()
+    time.sleep(0.06)
+    # A scrape checks up front, then sends its first request as the probe
+    guard.check()
+    assert guard.breaker.state == "open"
+    guard.before()
+    assert guard.breaker.state == "half_open"
+    guard.success()
+    assert guard.breaker.state == "closed"
+    guard.before()
+
+
+def test_probe_async_path_closes_breaker():
+    guard = tripped_guard()
+    time.sleep(0.06)
+
+    async def scrape():
+        guard.check()
+        await guard.before_async()
+        guard.observe(200, 0.1)
+
+    asyncio.run(scrape())
+    assert guard.breaker.state == "closed"
+
+
+def test_only_one_probe_is_admitted():
+    guard = tripped_guard()
+    time.sleep(0.06)
+    guard.before()
+    with pytest.raises(CircuitOpen):
+        guard.check()
+    with pytest.raises(CircuitOpen):
+        guard.before()
+    assert guard.stats["rejected"] == 2
+
+
+def test_failed_probe_reopens_breaker():
+    guard = tripped_guard()
+    time.sleep(0.06)
+    guard.before()
+    guard.failure()
+    assert guard.breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        guard.before()
+
+
+def test_lost_probe_does_not_block_forever():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+    breaker.record_failure("dice")
+    time.sleep(0.06)
+    breaker.allow("dice")
+    with pytest.raises(CircuitOpen):
+        breaker.allow("dice")
+    # The probe never reported back; after another timeout a new one may go
+    time.sleep(0.06)
+    breaker.allow("dice")
+    assert breaker.state == "half_open"
+
+
+def test_burst_covers_a_concurrent_wave():
+    guards = build_guards({"linkedin": 0.5, "indeed": 0.5}, threshold=5, reset_timeout=60, bursts={"linkedin": 8})
+    started = time.monotonic()
+    for _ in range(8):
+        guards["linkedin"].before()
+    assert time.monotonic() - started < 0.5
+    assert guards["indeed"].limiter.burst == 1.0
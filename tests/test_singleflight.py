@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from app import schemas
+from app.cache import ResultCache
+from app.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    flights = SingleFlight()
+    calls = []
+
+    async def scrape():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["job"]
+
+    async def run():
+        return await asyncio.gather(*(flights.do("key", scrape) for _ in range(5)))
+
+    assert asyncio.run(run()) == [["job"]] * 5
+    assert len(calls) == 1
+    assert flights.stats == {"started": 1, "coalesced": 4}
+    assert flights.in_flight() == 0
+
+
+def test_different_keys_run_separately():
+    flights = SingleFlight()
+
+    async def run():
+        return await asyncio.gather(flights.do("a", lambda: asyncio.sleep(0, "a")),
+                                    flights.do("b", lambda: asyncio.sleep(0, "b")))
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert flights.stats["started"] == 2
+
+
+def test_error_reaches_every_caller_and_frees_the_key():
+    flights = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("blocked")
+
+    async def run():
+        results = await asyncio.gather(*(flights.do("key", failing) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flights.in_flight() == 0
+        return await flights.do("key", lambda: asyncio.sleep(0, "retried"))
+
+    assert asyncio.run(run()) == "retried"
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_run():
+    flights = SingleFlight()
+
+    async def scrape():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        leaving = asyncio.ensure_future(flights.do("key", scrape))
+        staying = asyncio.ensure_future(flights.do("key", scrape))
+        await asyncio.sleep(0.005)
+        leaving.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leaving
+        return await staying
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_polling_clients_share_the_cached_scrape():
+    cache = ResultCache({})
+    calls = []
+
+    async def scrape():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [{"title": "Engineer"}]
+
+    async def run():
+        titles = [schemas.hireBase(search_term="python", location="Austin", client_id=client)
+                  for client in ("a", "b", "c")]
+        return await asyncio.gather(*(cache.get_or_fetch("dice", title.model_dump(), scrape) for title in titles))
+
+    asyncio.run(run())
+    assert len(calls) == 1
+    assert cache.flights.stats["coalesced"] == 2
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from app.normalize import make_job
+from app.store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    yield store
+    store.close()
+
+
+def indeed(key, title, **fields):
+    return make_job("indeed", title=title, company=fields.pop("company", "Acme"),
+                    url=f"https://www.indeed.com/viewjob?jk={key}", **fields)
+
+
+def test_postings_identified_by_query_string_are_stored_apart(store):
+    store.add([
+        indeed("1a2b3c", "Data Engineer"),
+        indeed("4d5e6f", "Backend Engineer"),
+        make_job("zip_recruiter", title="Nurse", company="Globex", url="https://www.ziprecruiter.com/jobs//j?lvk=abc"),
+        make_job("zip_recruiter", title="Accountant", company="Initech", url="https://www.ziprecruiter.com/jobs//j?lvk=def"),
+    ])
+    assert store.status()["jobs"] == 4
+
+
+def test_rescraped_posting_is_refreshed_not_duplicated(store):
+    store.add([indeed("1a2b3c", "Data Engineer")])
+    store.add([make_job("indeed", title="Data Engineer", company="Acme", salary="$120,000 a year",
+                        url="https://indeed.com/viewjob?jk=1a2b3c&from=serp")])
+    assert store.status()["jobs"] == 1
+    [job] = store.query("data engineer")
+    assert job.salary == "$120,000 a year"
+
+
+def test_same_url_on_two_boards_is_two_postings(store):
+    url = "https://careers.acme.com/jobs/42"
+    store.add([make_job("indeed", title="Data Engineer", url=url),
+               make_job("zip_recruiter", title="Data Engineer", url=url)])
+    assert sorted(job.source for job in store.query("data")) == ["indeed", "zip_recruiter"]
+
+
+def test_query_filters(store):
+    store.add([
+        indeed("1", "Senior Python Developer", location="Austin, TX", salary="$150,000 a year"),
+        indeed("2", "Python Developer", location="Denver, CO", salary="$40 an hour"),
+        indeed("3", "Java Developer", location="Austin, TX"),
+    ])
+    assert {job.url[-1] for job in store.query("pyth")} == {"1", "2"}
+    assert [job.url[-1] for job in store.query("python", location="austin")] == ["1"]
+    assert [job.url[-1] for job in store.query("python", min_salary=100000)] == ["1"]
+    assert store.query("python", sources=["dice"]) == []
+    assert store.query("python developer senior", order="relevance")[0].url.endswith("1")
+
+
+def test_expire_drops_postings_not_seen_again(store):
+    store.add([indeed("1", "Data Engineer")])
+    assert store.expire(3600) == 0
+    time.sleep(0.01)
+    assert store.expire(0.001) == 1
+    assert store.query("data") == []